@@ -2,10 +2,39 @@ from .app import show
 
 
 if __name__ == '__main__':
+    import sys
     import argparse
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true")
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="Process without a window, printing results as JSON lines"
+    )
+
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Headless: continue from the last checkpoint, see checkpoint"
+    )
+
+    parser.add_argument(
+        "--remote", type=int, metavar="PORT",
+        help="Show window of a host processing on PORT, see remote.show()"
+    )
+
+    stage = parser.add_mutually_exclusive_group()
+    stage.add_argument(
+        "--collect", dest="stage", action="store_const", const="collect",
+        help="Headless: stop after collection"
+    )
+    stage.add_argument(
+        "--validate", dest="stage", action="store_const", const="validate",
+        help="Headless: stop after validation"
+    )
+    stage.add_argument(
+        "--publish", dest="stage", action="store_const", const="publish",
+        help="Headless: process all plug-ins (default)"
+    )
 
     args = parser.parse_args()
 
@@ -16,4 +45,12 @@ if __name__ == '__main__':
         for Plugin in mock.plugins:
             pyblish.api.register_plugin(Plugin)
 
-    show()
+    if args.headless:
+        from . import headless
+        sys.exit(headless.run(args.stage or "publish", resume=args.resume))
+
+    if args.remote:
+        from . import remote
+        show(controller=remote.connect(args.remote))
+    else:
+        show()
@@ -4,7 +4,7 @@ import contextlib
 import os
 import sys
 
-from . import compat, control, settings, util, window
+from . import asynchronous, compat, settings, util, window
 from .vendor.Qt import QtCore, QtGui, QtWidgets
 
 self = sys.modules[__name__]
@@ -70,7 +70,7 @@ def on_destroyed():
     self._window = None
 
 
-def show(parent=None):
+def show(parent=None, controller=None):
     with open(util.get_asset("app.css")) as f:
         css = f.read()
 
@@ -84,7 +84,7 @@ def show(parent=None):
         install_fonts()
         install_translator(app)
 
-        ctrl = control.Controller()
+        ctrl = controller or asynchronous.AsyncController()
 
         if self._window is None:
             self._window = window.Window(ctrl, parent)
@@ -0,0 +1,158 @@
+"""Process coroutine plug-ins on an asyncio event loop
+
+Plug-ins waiting on I/O, such as uploads or writes to a database, may
+define `process` as a coroutine.
+
+    class IntegrateUpload(pyblish.api.InstancePlugin):
+        order = pyblish.api.IntegratorOrder
+
+        async def process(self, instance):
+            await upload(instance.data["path"])
+
+With an :class:`AsyncController`, pairs of such plug-ins sharing a slot
+(see `dependencies`), e.g. of the same order, are awaited alongside
+each other, at most "PYBLISH_ASYNC_LIMIT" at a time, 8 by default.
+Other plug-ins are processed as with `control.Controller`, which awaits
+coroutine plug-ins too, though one at a time. The window and headless
+publishing use an :class:`AsyncController` by default.
+
+The event loop runs in a thread of its own, started on first use.
+Processing waits on the coroutines of a slot as it waits on worker
+threads, such that the window is driven by the same timer as before.
+A loop already running may be given instead, e.g. one shared with other
+I/O of the application, so long as it is not run by the thread calling
+upon the controller; such as a qasync loop of the Qt thread, which
+would wait on itself.
+
+Coroutines share the thread of the loop, hence their CPU time is not
+measured, and they are not profiled.
+
+"""
+import os
+import asyncio
+import logging
+import threading
+
+from . import control, util
+from .coroutines import is_async, process, TaskHandler  # noqa
+
+
+class AsyncController(control.Controller):
+    """Controller awaiting coroutine plug-ins alongside each other
+
+    Arguments:
+        loop (asyncio.AbstractEventLoop, optional): Running loop on which
+            to await plug-ins, run by another thread than the caller.
+            Defaults to a loop and thread of its own.
+        parent (QtCore.QObject, optional): Parent of controller
+
+    """
+
+    # Coroutines awaited at once
+    # - None uses environment "PYBLISH_ASYNC_LIMIT", 8 by default
+    max_concurrency = None
+
+    def __init__(self, loop=None, parent=None):
+        super(AsyncController, self).__init__(parent)
+        self.loop = loop
+        self._loop_thread = None
+
+    def concurrency(self):
+        limit = self.max_concurrency
+        if limit is None:
+            limit = int(os.getenv("PYBLISH_ASYNC_LIMIT", 8))
+        return max(1, limit)
+
+    def is_concurrent(self, plugin):
+        return is_async(plugin) or super(
+            AsyncController, self).is_concurrent(plugin)
+
+    def event_loop(self):
+        """Return loop on which to await plug-ins, starting one if need be"""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self.loop.run_forever,
+                name="PyblishLiteEventLoop"
+            )
+            self._loop_thread.daemon = True
+            self._loop_thread.start()
+
+        return self.loop
+
+    def _run_pair(self, plugin, instance):
+        if not is_async(plugin):
+            return super(AsyncController, self)._run_pair(plugin, instance)
+
+        return self._submit([(plugin, instance)]).result()[0]
+
+    def _wait_concurrently(self, pairs):
+        coroutines = [
+            index for index, (plugin, instance) in enumerate(pairs)
+            if is_async(plugin)
+        ]
+        if not coroutines:
+            return super(AsyncController, self)._wait_concurrently(pairs)
+
+        # Await coroutines whilst the rest is processed
+        future = self._submit([pairs[index] for index in coroutines])
+
+        others = sorted(set(range(len(pairs))) - set(coroutines))
+        results = [None] * len(pairs)
+        processed = super(AsyncController, self)._wait_concurrently(
+            [pairs[index] for index in others]
+        )
+        for index, result in zip(others, processed):
+            results[index] = result
+
+        for index, result in zip(coroutines, future.result()):
+            results[index] = result
+
+        return results
+
+    def _submit(self, pairs):
+        # Returns a `concurrent.futures.Future` of results of `pairs`
+        return asyncio.run_coroutine_threadsafe(
+            self._gather(pairs), self.event_loop()
+        )
+
+    async def _gather(self, pairs):
+        semaphore = asyncio.Semaphore(self.concurrency())
+
+        async def limited(plugin, instance):
+            async with semaphore:
+                return await self._process_async(plugin, instance)
+
+        # As `pyblish.plugin.logger` does, once for all of them
+        root = logging.getLogger()
+        level = root.level
+        root.setLevel(logging.DEBUG)
+        try:
+            return await asyncio.gather(*[
+                limited(plugin, instance) for plugin, instance in pairs
+            ])
+        finally:
+            root.setLevel(level)
+
+    async def _process_async(self, plugin, instance):
+        # As `_run_pair`, on the thread of the loop; what the pair
+        # created is noted once its slot is done, see `_finish_pairs`
+        with util.measure() as measurement:
+            with self.tracker.processing(plugin):
+                result = await process(plugin, self.context, instance)
+        result.update(measurement)
+
+        # The thread is shared by every coroutine
+        result["cpu_time"] = None
+
+        return result
+
+    def cleanup(self):
+        super(AsyncController, self).cleanup()
+
+        if self._loop_thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._loop_thread.join()
+            self.loop.close()
+            self.loop = None
+            self._loop_thread = None
@@ -0,0 +1,251 @@
+"""Cache results of validators between resets
+
+Enabled by setting environment variable "PYBLISH_RESULT_CACHE" to a
+directory in which to store results.
+
+Validators are cached given a `plugin_id` and declared inputs; the
+keys of `context.data` and `instance.data` given by `context_keys`,
+`requires_data` and `instance_keys`. A fingerprint is taken of these
+inputs along with the source of the plug-in, and the result stored
+under it. On a later reset, a matching fingerprint replays the stored
+result rather than processing the plug-in. Only results of validators
+which passed are stored.
+
+Validators using the host, see `util.is_host_bound`, also depend on
+what is in the scene. They are only cached once the host provides a
+hasher, producing a hash of the content of a node. Each node is hashed
+once per reset, and the fingerprint of a pair combines the hashes of
+the nodes in its inputs.
+
+    from pyblish_lite import cache
+    cache.register_hasher("maya", hash_node)
+
+Inputs holding more nodes than are validated, such as every mesh of the
+scene of which only those of the instance are validated, would have any
+change to the scene invalidate every result. Plug-ins may list the keys
+holding the nodes to hash as `node_keys`, all inputs by default.
+
+    class ValidateMeshes(pyblish.api.InstancePlugin):
+        context_keys = ["mesh_nodes"]
+        instance_keys = ["nodes"]
+        node_keys = ["nodes"]
+
+Plug-ins may opt out with `cacheable = False`.
+
+"""
+import os
+import json
+import hashlib
+import inspect
+
+import pyblish.api
+import pyblish.lib
+
+from . import util, tracking
+
+# Hashers of host content, by host
+_hashers = {}
+
+
+def register_hasher(host, hasher):
+    """Register `hasher` of content of nodes in `host`
+
+    Arguments:
+        host (str): Name of host, as registered with pyblish
+        hasher (callable): Called with the name of a node, returning
+            a string
+
+    """
+
+    _hashers[host] = hasher
+
+
+def deregister_hasher(host):
+    _hashers.pop(host, None)
+
+
+def registered_hasher():
+    for host in reversed(pyblish.api.registered_hosts()):
+        if host in _hashers:
+            return _hashers[host]
+    return None
+
+
+def inputs(plugin):
+    """Return keys of context and instance data declared by `plugin`"""
+    context_keys = set(getattr(plugin, "context_keys", None) or ())
+    context_keys.update(getattr(plugin, "requires_data", None) or ())
+    instance_keys = set(getattr(plugin, "instance_keys", None) or ())
+    return sorted(context_keys), sorted(instance_keys)
+
+
+def from_environment():
+    """Return cache as configured by environment, or None"""
+    root = os.getenv("PYBLISH_RESULT_CACHE")
+    if not root:
+        return None
+    return ResultCache(root)
+
+
+class ResultCache(object):
+    """Results of validators, stored as JSON by fingerprint
+
+    Arguments:
+        root (str): Directory in which to store results
+
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._sources = {}
+
+        # Hashes of nodes, by name, as of this run
+        self._nodes = {}
+
+    def is_cacheable(self, plugin):
+        if not getattr(plugin, "cacheable", True):
+            return False
+
+        if not getattr(plugin, "plugin_id", None):
+            return False
+
+        if not pyblish.lib.inrange(plugin.order, pyblish.api.ValidatorOrder):
+            return False
+
+        if not any(inputs(plugin)):
+            return False
+
+        if util.is_host_bound(plugin) and registered_hasher() is None:
+            return False
+
+        return True
+
+    def source(self, plugin):
+        """Return hash of the source of `plugin` and its bases"""
+        if plugin not in self._sources:
+            digest = hashlib.sha1()
+            for cls in inspect.getmro(plugin):
+                path = getattr(cls, "__module__", None) or ""
+                if path.startswith("pyblish."):
+                    continue
+
+                if not os.path.isfile(path):
+                    try:
+                        path = inspect.getsourcefile(cls)
+                    except TypeError:
+                        continue
+
+                if path and os.path.isfile(path):
+                    with open(path, "rb") as f:
+                        digest.update(f.read())
+
+            self._sources[plugin] = digest.hexdigest()
+
+        return self._sources[plugin]
+
+    def content(self, nodes):
+        """Return hashes of `nodes`, hashing each once per run
+
+        Arguments:
+            nodes (list): Names of nodes, sorted
+
+        """
+
+        hasher = registered_hasher()
+        hashes = []
+        for node in nodes:
+            if node not in self._nodes:
+                self._nodes[node] = hasher(node)
+            hashes.append(self._nodes[node])
+        return hashes
+
+    def fingerprint(self, plugin, context, instance):
+        """Return fingerprint of inputs of `plugin`, or None
+
+        Arguments:
+            plugin (pyblish.api.Plugin): Plug-in to process
+            context (pyblish.api.Context): Context of `instance`
+            instance (pyblish.api.Instance): Instance to process, if any
+
+        """
+
+        if not self.is_cacheable(plugin):
+            return None
+
+        context_keys, instance_keys = inputs(plugin)
+        keys = list(context_keys)
+        values = [
+            dict.get(context.data, key) for key in context_keys
+        ]
+        if instance is not None:
+            keys.append("name")
+            values.append(instance.data["name"])
+            keys.extend(instance_keys)
+            values.extend(
+                dict.get(instance.data, key) for key in instance_keys
+            )
+
+        content = None
+        if registered_hasher() is not None:
+            node_keys = getattr(plugin, "node_keys", None)
+            nodes = set()
+            for key, value in zip(keys, values):
+                if node_keys is None or key in node_keys:
+                    nodes |= tracking.node_names(value)
+            content = self.content(sorted(nodes))
+
+        payload = json.dumps(
+            [plugin.plugin_id, self.source(plugin), values, content],
+            sort_keys=True,
+            default=repr
+        )
+
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def path(self, plugin, fingerprint):
+        return os.path.join(
+            self.root, plugin.plugin_id, fingerprint + ".json"
+        )
+
+    def replay(self, fingerprint, plugin, context, instance):
+        """Return stored result of `fingerprint`, or None
+
+        Arguments:
+            fingerprint (str): As returned by `fingerprint`
+            plugin (pyblish.api.Plugin): Plug-in of result
+            context (pyblish.api.Context): Context of `instance`
+            instance (pyblish.api.Instance): Instance of result, if any
+
+        """
+
+        try:
+            with open(self.path(plugin, fingerprint)) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        result = util.deserialize_result(data, plugin, context, instance)
+        result["cached"] = True
+        return result
+
+    def store(self, fingerprint, result):
+        """Store `result` under `fingerprint`
+
+        Failures are not stored, as plug-ins make their actions,
+        e.g. to select what failed, whilst processing.
+
+        """
+
+        if not result["success"]:
+            return
+
+        path = self.path(result["plugin"], fingerprint)
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        # Write aside first, such that a result is never read half-written
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp, "w") as f:
+            json.dump(util.serialize_result(result), f)
+        os.replace(temp, path)
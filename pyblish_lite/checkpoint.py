@@ -0,0 +1,206 @@
+"""Checkpoints of a publish, resumed after a crash
+
+Enabled by setting environment variable "PYBLISH_CHECKPOINT_DIR" to a
+directory in which to write checkpoints.
+
+Each time processing passes a group of `util.OrderGroups` without
+errors, e.g. from validation on to extraction, the data of the context
+and its instances is written along with the results so far, the state
+of each plug-in and the group passed. Resuming, see
+`control.Controller.resume`, restores these in place of collecting, and
+continues from the next group; skipping every group already passed.
+
+Data which cannot be written as JSON, such as objects of a host, is
+left out. Plug-ins relying on such data from earlier groups can not be
+resumed, and should be collected again instead.
+
+A checkpoint is only resumed as long as the scene is what it was. The
+host provides a fingerprint of its scene, which ought to be cheap; such
+as the path, time of modification and number of nodes of the scene.
+
+    from pyblish_lite import checkpoint
+    checkpoint.register_fingerprinter("maya", scene_fingerprint)
+
+Without one, the scene is assumed unchanged. The checkpoint is removed
+once publishing finishes without errors.
+
+"""
+import os
+import json
+import time
+
+import pyblish.api
+
+from . import util
+
+# Of the layout of checkpoints written, those of others are not resumed
+version = 1
+
+# Data of the context restored by the run resuming, or held elsewhere
+excluded_keys = ("results",)
+
+# Fingerprinters of scenes, by host
+_fingerprinters = {}
+
+
+def register_fingerprinter(host, fingerprinter):
+    """Register `fingerprinter` of the scene of `host`
+
+    Arguments:
+        host (str): Name of host, as registered with pyblish
+        fingerprinter (callable): Called without arguments,
+            returning a string
+
+    """
+
+    _fingerprinters[host] = fingerprinter
+
+
+def deregister_fingerprinter(host):
+    _fingerprinters.pop(host, None)
+
+
+def fingerprint():
+    """Return fingerprint of the current scene, or None"""
+    for host in reversed(pyblish.api.registered_hosts()):
+        if host in _fingerprinters:
+            return _fingerprinters[host]()
+    return None
+
+
+def from_environment():
+    """Return checkpoints as configured by environment, or None"""
+    directory = os.getenv("PYBLISH_CHECKPOINT_DIR")
+    if not directory:
+        return None
+    return Checkpoints(directory)
+
+
+def plugin_key(plugin):
+    """Return key of `plugin`, alike between sessions"""
+    return "%s.%s" % (plugin.__module__, plugin.__name__)
+
+
+def serializable(data):
+    """Return items of `data` which can be written as JSON
+
+    Returns:
+        tuple: Serializable items, and the keys left out
+
+    """
+
+    items = {}
+    skipped = []
+    for key, value in dict.items(data):
+        if key in excluded_keys:
+            continue
+
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            skipped.append(key)
+        else:
+            items[key] = value
+
+    return items, sorted(skipped)
+
+
+class Checkpoints(object):
+    """Checkpoint of the last publish, written as JSON
+
+    Arguments:
+        directory (str): Directory in which to write the checkpoint
+
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, "checkpoint.json")
+
+    def write(self, context, plugins, passed_order):
+        """Write state of a publish having passed group of `passed_order`
+
+        Arguments:
+            context (pyblish.api.Context): Context being published
+            plugins (list): Plug-ins of the publish
+            passed_order (float): Order of the group passed
+
+        """
+
+        context_data, skipped = serializable(context.data)
+
+        instances = []
+        for instance in context:
+            data, instance_skipped = serializable(instance.data)
+            skipped.extend(
+                "%s.%s" % (instance.name, key) for key in instance_skipped
+            )
+            instances.append({
+                "id": instance.id,
+                "name": instance.name,
+                "data": data,
+            })
+
+        results = []
+        for result in context.data.get("results") or []:
+            if result["action"] is not None:
+                continue
+
+            instance = result["instance"]
+            data = util.serialize_result(result)
+            data["pluginKey"] = plugin_key(result["plugin"])
+            data["instanceId"] = None if instance is None else instance.id
+            results.append(data)
+
+        checkpoint = {
+            "version": version,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "fingerprint": fingerprint(),
+            "passedOrder": passed_order,
+            "context": {"id": context.id, "data": context_data},
+            "instances": instances,
+            "results": results,
+            "plugins": dict(
+                (plugin_key(plugin), {"active": plugin.active})
+                for plugin in plugins
+            ),
+            "skipped": skipped,
+        }
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        # Write aside first, such that a crash never leaves half of one
+        temp = "%s.%d.tmp" % (self.path, os.getpid())
+        with open(temp, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(temp, self.path)
+
+    def read(self):
+        """Return the checkpoint, or None if there is none to resume
+
+        Checkpoints of another scene, or of another layout, are not
+        resumed.
+        """
+
+        try:
+            with open(self.path) as f:
+                checkpoint = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if checkpoint.get("version") != version:
+            return None
+
+        if checkpoint["fingerprint"] != fingerprint():
+            util.u_print("Scene changed since checkpoint of %s, "
+                         "not resuming." % checkpoint["time"])
+            return None
+
+        return checkpoint
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
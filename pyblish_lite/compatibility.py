@@ -0,0 +1,197 @@
+"""Which plug-ins have instances to process, kept up to date
+
+The window shows plug-ins compatible with an active instance, which
+changes as instances are created, and toggled. Rather than matching
+every plug-in against every instance after each change, families are
+given a bit each, and plug-ins a row of the bits of their families.
+
+Active instances are counted by signature, the bits of their families,
+of which there are about as many as there are families. Once a
+signature, or family, gains its first active instance or loses its
+last, only rows sharing one of its bits are matched again; along with
+those of every family and of none, matching regardless of bits, and
+context plug-ins matching exactly the families of all instances.
+
+    compatibility = CompatibilityMap(family_index)
+    for plugin, is_compatible in compatibility.update(plugins).items():
+        ...
+
+"""
+import collections
+
+import pyblish.api
+
+
+class CompatibilityMap(object):
+    """Compatibility of plug-ins with active instances, by family
+
+    Matches as `pyblish.logic.instances_by_plugin` does for instance
+    plug-ins, and `pyblish.logic.plugins_by_families` for context
+    plug-ins, given active instances.
+
+    Arguments:
+        family_index (util.FamilyIndex): Index of instances to match
+
+    """
+
+    def __init__(self, family_index):
+        self.family_index = family_index
+
+        # Bit of each family
+        self._bits = {}
+
+        # Active instances by signature, and by family bit
+        self._signatures = collections.Counter()
+        self._families = collections.Counter()
+        self._union = 0
+
+        # Mask of each plug-in, and plug-ins by bit
+        self._rows = {}
+        self._by_bit = collections.defaultdict(set)
+
+        # Plug-ins matching regardless of bits; of every family, or none
+        self._loose = set()
+
+        # Compatibility of each plug-in, as last reported
+        self.compatible = {}
+
+        # Bits of signatures and families gaining or losing instances
+        self._changed = 0
+        self._any_changed = False
+
+        family_index.listen(self._on_indexed)
+
+    def bit(self, family):
+        if family not in self._bits:
+            self._bits[family] = 1 << len(self._bits)
+        return self._bits[family]
+
+    def mask(self, families):
+        mask = 0
+        for family in families:
+            mask |= self.bit(family)
+        return mask
+
+    def _on_indexed(self, old, new):
+        for entry, step in ((old, -1), (new, 1)):
+            if entry is None:
+                continue
+
+            families, active = entry
+            if not active:
+                continue
+
+            mask = self.mask(families)
+            self._count(self._signatures, mask, step, mask)
+            for family in families:
+                bit = self._bits[family]
+                if self._count(self._families, bit, step, bit):
+                    self._union ^= bit
+
+    def _count(self, counter, key, step, bits):
+        # Returns whether `key` gained its first, or lost its last
+        counter[key] += step
+        changed = counter[key] == (1 if step > 0 else 0)
+        if not counter[key]:
+            del counter[key]
+
+        if changed:
+            self._changed |= bits
+            self._any_changed = True
+        return changed
+
+    def add(self, plugin):
+        """Add row of `plugin`, returning its mask"""
+        families = plugin.families or []
+        if "*" in families:
+            self._rows[plugin] = None
+            self._loose.add(plugin)
+            return None
+
+        mask = self.mask(families)
+        self._rows[plugin] = mask
+
+        # Of exactly every active family, any family may change it
+        exact = (
+            plugin.match == pyblish.api.Exact
+            and not plugin.__instanceEnabled__
+        )
+        if not mask or exact:
+            self._loose.add(plugin)
+        else:
+            for family in families:
+                self._by_bit[self._bits[family]].add(plugin)
+
+        return mask
+
+    def is_compatible(self, plugin):
+        """Return whether `plugin` has an active instance to process"""
+        mask = self._rows[plugin]
+
+        if not plugin.__instanceEnabled__:
+            if mask is None:
+                return True
+            return matches(plugin.match, mask, self._union)
+
+        if mask is None:
+            return bool(self._signatures)
+
+        return any(
+            matches(plugin.match, mask, signature)
+            for signature in self._signatures
+        )
+
+    def update(self, plugins):
+        """Return compatibility of `plugins` which changed, by plug-in
+
+        Plug-ins not seen before are always included.
+
+        Arguments:
+            plugins (list): Plug-ins to consider
+
+        """
+
+        self.family_index.refresh()
+
+        affected = set()
+        if self._any_changed:
+            affected.update(self._loose)
+            for bit, plugins_of_bit in self._by_bit.items():
+                if self._changed & bit:
+                    affected.update(plugins_of_bit)
+
+            self._changed = 0
+            self._any_changed = False
+
+        changes = {}
+        for plugin in plugins:
+            if plugin not in self._rows:
+                self.add(plugin)
+            elif plugin not in affected:
+                continue
+
+            is_compatible = self.is_compatible(plugin)
+            if self.compatible.get(plugin) != is_compatible:
+                self.compatible[plugin] = is_compatible
+                changes[plugin] = is_compatible
+
+        return changes
+
+
+def matches(match, mask, families):
+    """Return whether plug-in of `mask` matches bits of `families`
+
+    Arguments:
+        match (int): Algorithm of the plug-in, e.g. `pyblish.api.Subset`
+        mask (int): Bits of families of the plug-in
+        families (int): Bits of families to match
+
+    """
+
+    if match == pyblish.api.Exact:
+        return mask == families
+
+    if match == pyblish.api.Subset:
+        return mask & families == mask
+
+    return bool(mask & families)
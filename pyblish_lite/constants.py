@@ -54,8 +54,10 @@ Roles = roles(
     "PluginActionsVisibleRole",
     "PluginValidActionsRole",
     "PluginActionProgressRole",
+    "DurationRole",
 
     "TerminalItemTypeRole",
+    "TerminalRecordIdRole",
 
     "IntentItemValue",
 
@@ -78,6 +80,7 @@ PluginStates = flags(
     "WasSkipped",
     "HasWarning",
     "HasError",
+    "WasCached",
     type_name="PluginState"
 )
 
@@ -7,7 +7,13 @@ an active window manager; such as via Travis-CI.
 """
 import os
 import sys
+import time
+import logging
+import threading
 import traceback
+import contextlib
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from .vendor.Qt import QtCore
 
@@ -17,7 +23,10 @@ import pyblish.logic
 import pyblish.lib
 import pyblish.version
 
-from . import util
+from . import (
+    cache, checkpoint, coroutines, dependencies, extraction, plan, pool,
+    profiler, tracking, util
+)
 from .constants import InstanceStates
 try:
     from pypeapp.lib.config import get_presets
@@ -29,6 +38,15 @@ class IterationBreak(Exception):
     pass
 
 
+# Yielded by `Controller._results` in place of a result, whilst waiting
+# on transfers, such that the window is given time in between
+waiting = object()
+
+
+# Stages of processing, in order, see `Controller.iter_results`
+stages = ("collect", "validate", "publish")
+
+
 class Controller(QtCore.QObject):
     # Emitted when the GUI is about to start processing;
     # e.g. resetting, validating or publishing.
@@ -37,6 +55,10 @@ class Controller(QtCore.QObject):
     # ??? Emitted for each process
     was_processed = QtCore.Signal(dict)
 
+    # Emitted with results processed since the last batch, at most
+    # once per slice of processing, see `iterate_and_process`
+    was_processed_batch = QtCore.Signal(list)
+
     # Emmited when reset
     # - all data are reset (plugins, processing, pari yielder, etc.)
     was_reset = QtCore.Signal()
@@ -59,14 +81,67 @@ class Controller(QtCore.QObject):
     # Emitted when plugin was skipped
     was_skipped = QtCore.Signal(object)
 
+    # Emitted with results discarded prior to re-validation
+    about_to_revalidate = QtCore.Signal(object)
+
+    # Emitted with plug-in, instance and fraction of items transferred,
+    # as items of extractors are transferred, see `extraction`
+    io_progress = QtCore.Signal(object, object, float)
+
     # store OrderGroups - now it is a singleton
     order_groups = util.OrderGroups
 
+    # Frame budget in milliseconds, see `util.FrameBudget`
+    # - None uses environment "PYBLISH_FRAME_BUDGET", 0 is synchronous
+    frame_budget = None
+
+    # Worker threads for plug-ins with `thread_safe = True`
+    # - None uses environment "PYBLISH_THREADS", 1 or less disables threading
+    max_workers = None
+
+    # Worker processes for plug-ins with `process_pool = True`, see `pool`
+    # - None uses environment "PYBLISH_PROCESSES", 1 or less disables them
+    #   Without either, they are disabled within an application unless
+    #   "PYBLISH_POOL_EXECUTABLE" is set, see `pool.executable`
+    max_processes = None
+
+    # Threads transferring items of extractors, see `extraction`
+    # - None uses environment "PYBLISH_IO_THREADS", 4 by default,
+    #   0 transfers items as part of processing
+    io_workers = None
+
+    # Items waiting to be transferred at most, before exporting waits
+    # - None uses environment "PYBLISH_IO_QUEUE", 4 per thread by default
+    io_queue_size = None
+
+    # Seconds to wait for a transfer to finish, before giving the window
+    # a chance to be drawn, see `_process_fanned_out`
+    io_poll_interval = 0.01
+
+    # Measure peak memory of plug-ins with `tracemalloc`, at a cost
+    # - None uses environment "PYBLISH_TRACEMALLOC"
+    trace_memory = None
+
+    # Port of the window, noted in the context as "port", see `remote`
+    # - None uses environment "PYBLISH_CLIENT_PORT", -1 by default
+    client_port = None
+
     def __init__(self, parent=None):
         super(Controller, self).__init__(parent)
         self.context = None
         self.plugins = {}
+        self.slots = {}
         self.optional_default = {}
+        self.executor = None
+        self.process_executor = None
+        self.io_pool = None
+        self.pending_results = []
+        self.cache = None
+        self.profiler = None
+        self.checkpoints = None
+        self._threadable = {}
+        self._poolable = {}
+        self._tracing = False
 
     def reset_variables(self):
         # Data internal to the GUI itself
@@ -76,6 +151,10 @@ class Controller(QtCore.QObject):
 
         # Active producer of pairs
         self.pair_generator = None
+        # Plan of the pairs it produces, see `plan`
+        self.plan = None
+        self._test_key = None
+        self._test_message = None
         # Active pair
         self.current_pair = None
 
@@ -90,6 +169,11 @@ class Controller(QtCore.QObject):
         self.validators_order = None
         self.validated = False
 
+        # What actions have touched since processing, see `revalidate`
+        self.dirty_nodes = set()
+        self.dirty_keys = set()
+        self.dirty_plugins = set()
+
         # Get collectors and validators order
         self.order_groups.reset()
         plugin_groups = self.order_groups.groups()
@@ -136,7 +220,7 @@ class Controller(QtCore.QObject):
         return result
 
     def reset_context(self):
-        self.context = pyblish.api.Context()
+        self.context = tracking.TrackedContext()
 
         self.context._publish_states = InstanceStates.ContextType
         self.context.optional = False
@@ -146,9 +230,10 @@ class Controller(QtCore.QObject):
         self.context.data["name"] = "context"
 
         self.context.data["host"] = reversed(pyblish.api.registered_hosts())
-        self.context.data["port"] = int(
-            os.environ.get("PYBLISH_CLIENT_PORT", -1)
-        )
+        port = self.client_port
+        if port is None:
+            port = int(os.environ.get("PYBLISH_CLIENT_PORT", -1))
+        self.context.data["port"] = port
         self.context.data["connectTime"] = pyblish.lib.time(),
         self.context.data["pyblishVersion"] = pyblish.version,
         self.context.data["pythonVersion"] = sys.version
@@ -157,35 +242,170 @@ class Controller(QtCore.QObject):
 
         self.context.families = ("__context__",)
 
+        # Note which data each plug-in reads and writes
+        self.tracker = tracking.Tracker()
+        self.tracker.track(self.context)
+
+        # Instances by family, for matching plug-ins
+        self.family_index = util.FamilyIndex(self.context)
+        self.tracker.watch(
+            util.FamilyIndex.keys, self.family_index.invalidate
+        )
+
     def reset(self):
         """Discover plug-ins and run collection."""
 
+        self.prepare()
+
+        # Process collectors load rest of plugins with collected instances
+        self.collect()
+
+    def prepare(self):
+        """Discover plug-ins for a new run, without processing any"""
+
+        self._prepare()
+        self.was_reset.emit()
+
+    def _prepare(self):
+        self.release()
         self.reset_context()
         self.reset_variables()
 
+        # Results of validators from previous runs, if enabled
+        self.cache = cache.from_environment()
+
+        # Stats of plug-ins processed from now on, if enabled
+        self.profiler = profiler.from_environment()
+
+        # State written at boundaries of groups, if enabled
+        self.checkpoints = checkpoint.from_environment()
+
+        if self.is_tracing_memory() and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
         self.possible_presets = self.presets_by_hosts()
 
         # Load plugins and set pair generator
         self.load_plugins()
         self.pair_generator = self._pair_yielder(self.plugins)
 
-        self.was_reset.emit()
-
-        # Process collectors load rest of plugins with collected instances
-        self.collect()
-
     def load_plugins(self):
         self.test = pyblish.logic.registered_test()
+        self._test_key = None
+        self._test_message = None
         self.optional_default = {}
 
         plugins = pyblish.api.discover()
 
         targets = pyblish.logic.registered_targets() or ["default"]
-        self.plugins = pyblish.logic.plugins_by_targets(plugins, targets)
+        plugins = pyblish.logic.plugins_by_targets(plugins, targets)
+
+        # State plug-ins keep on their class is kept to this run
+        plugins = [util.isolate(plugin) for plugin in plugins]
+
+        # Run plug-ins as soon as the data they require is provided
+        self.plugins, self.slots = dependencies.sort(
+            plugins, list(self.order_groups.groups().keys())
+        )
+        self._threadable = {}
+        self._poolable = {}
+
+    def is_tracing_memory(self):
+        trace = self.trace_memory
+        if trace is None:
+            trace = os.getenv("PYBLISH_TRACEMALLOC", "") not in ("", "0")
+        return bool(trace)
+
+    def worker_count(self):
+        workers = self.max_workers
+        if workers is None:
+            workers = os.getenv("PYBLISH_THREADS")
+
+        if workers is None:
+            return os.cpu_count() or 1
+
+        return int(workers)
+
+    def is_threadable(self, plugin):
+        """Return whether pairs of `plugin` may be processed in a thread
+
+        Plug-ins opt in with `thread_safe = True`. Only instance plug-ins
+        are considered, and never those bound to the host, see
+        `util.is_host_bound`.
+        """
+
+        if plugin not in self._threadable:
+            self._threadable[plugin] = bool(
+                getattr(plugin, "thread_safe", False)
+                and plugin.__instanceEnabled__
+                and self.worker_count() > 1
+                and not util.is_host_bound(plugin)
+            )
+        return self._threadable[plugin]
+
+    def process_count(self):
+        processes = self.max_processes
+        if processes is None:
+            processes = os.getenv("PYBLISH_PROCESSES")
+
+        if processes is None:
+            if pool.executable() is None:
+                return 1
+            return os.cpu_count() or 1
+
+        return int(processes)
+
+    def is_poolable(self, plugin):
+        """Return whether pairs of `plugin` may be processed in a worker
+
+        See `pool.is_poolable`, plug-ins bound to the host
+        are always processed in this process.
+        """
+
+        if plugin not in self._poolable:
+            self._poolable[plugin] = bool(
+                self.process_count() > 1
+                and pool.is_poolable(plugin)
+                and not util.is_host_bound(plugin)
+            )
+        return self._poolable[plugin]
+
+    def io_worker_count(self):
+        workers = self.io_workers
+        if workers is None:
+            workers = int(os.getenv("PYBLISH_IO_THREADS", 4))
+        return max(0, workers)
+
+    def io_queue_limit(self):
+        limit = self.io_queue_size
+        if limit is None:
+            limit = int(os.getenv(
+                "PYBLISH_IO_QUEUE", 4 * self.io_worker_count()
+            ))
+        return max(1, limit)
+
+    def is_fanned_out(self, plugin):
+        """Return whether items of `plugin` transfer on the I/O pool"""
+        return bool(
+            extraction.is_fanned_out(plugin) and self.io_worker_count() > 0
+        )
+
+    def is_concurrent(self, plugin):
+        return (
+            self.is_poolable(plugin)
+            or self.is_threadable(plugin)
+            or self.is_fanned_out(plugin)
+        )
 
     def on_published(self):
         if self.is_running:
             self.is_running = False
+
+        # Nothing is left to resume
+        if self.checkpoints is not None and not self.errored:
+            self.checkpoints.remove()
+
         self.was_finished.emit()
 
     def stop(self):
@@ -197,11 +417,126 @@ class Controller(QtCore.QObject):
                 plugin, self.context, None, action.id
             )
             self.is_running = False
+            self.invalidate(plugin, action)
             self.was_acted.emit(result)
 
         self.is_running = True
         util.defer(100, on_next)
 
+    def invalidate(self, plugin, action):
+        """Note what `action` of `plugin` may have changed
+
+        Actions given host objects, through `items_list` or `items`,
+        touch data holding those objects. Others are assumed to have
+        touched everything `plugin` read.
+        """
+
+        nodes = tracking.action_nodes(action)
+        if nodes:
+            self.dirty_nodes |= nodes
+        else:
+            self.dirty_keys |= self.tracker.reads[plugin]
+
+        if plugin.order > self.collectors_order:
+            self.dirty_plugins.add(plugin)
+
+    def revalidate(self):
+        """Re-run collectors and validators affected by actions
+
+        Only plug-ins already processed, up until validation, are
+        considered. Collectors run again when they wrote, or read, data
+        touched by an action. This touches whatever they write in turn.
+        Validators run again when they read touched data, or when their
+        own action was run. Instances created by a collector running
+        again are created anew.
+
+        Results of plug-ins running again are discarded beforehand, see
+        `about_to_revalidate`. Processing stops once done, and continues
+        from where it was thereafter.
+        """
+
+        dirty = self.dirty_keys | self.tracker.dirty_keys(
+            self.context, self.dirty_nodes
+        )
+
+        results = self.context.data.get("results") or []
+        processed = set(
+            result["plugin"] for result in results
+            if result["action"] is None
+        )
+
+        plugins = []
+        removed = set()
+        for plugin in self.plugins:
+            if plugin not in processed or plugin.order > self.validators_order:
+                continue
+
+            reads = self.tracker.reads[plugin]
+            touched = (
+                plugin in self.dirty_plugins
+                or reads & dirty
+                or any(owner in removed for owner, key in reads)
+            )
+
+            is_collector = plugin.order <= self.collectors_order
+            if is_collector:
+                touched = touched or self.tracker.writes[plugin] & dirty
+
+            if not touched:
+                continue
+
+            plugins.append(plugin)
+            if is_collector:
+                dirty |= self.tracker.writes[plugin]
+                removed |= self.tracker.creates.pop(plugin, set())
+
+        self.dirty_nodes.clear()
+        self.dirty_keys.clear()
+        self.dirty_plugins.clear()
+
+        self.context[:] = [
+            instance for instance in self.context
+            if instance.id not in removed
+        ]
+        for instance_id in removed:
+            self.family_index.remove(instance_id)
+
+        discarded = [
+            result for result in results
+            if result["action"] is None and (
+                result["plugin"] in plugins
+                or (
+                    result["instance"] is not None
+                    and result["instance"].id in removed
+                )
+            )
+        ]
+        discarded_ids = set(id(result) for result in discarded)
+        results[:] = [
+            result for result in results
+            if id(result) not in discarded_ids
+        ]
+
+        self.processing["ordersWithError"] = set(
+            result["plugin"].order for result in results
+            if result["action"] is None and result["error"] is not None
+        )
+        self.errored = bool(self.processing["ordersWithError"])
+
+        self.about_to_revalidate.emit(discarded)
+
+        generator = self.pair_generator
+
+        def pairs():
+            for pair in self._revalidation_yielder(plugins):
+                yield pair
+            yield IterationBreak("Revalidated")
+            for pair in generator:
+                yield pair
+
+        self.pair_generator = pairs()
+        self.iterate_and_process()
+
     def emit_(self, signal, kwargs):
         pyblish.api.emit(signal, **kwargs)
 
@@ -215,14 +550,43 @@ class Controller(QtCore.QObject):
                 if no instance is provided, context is processed.
         """
 
-        self.processing["nextOrder"] = plugin.order
+        self._prepare_pairs([(plugin, instance)])
+        result = self._run_pair(plugin, instance)
+        self._finish_pairs([(plugin, instance)], [result])
+        return result
+
+    def _prepare_pairs(self, pairs):
+        """Note `pairs` as about to be processed, on the main thread"""
+
+        for plugin, instance in pairs:
+            self.processing["nextOrder"] = plugin.order
+
+            if instance is not None:
+                self.tracker.track(instance)
+
+        # Instances added or removed until now are not of these pairs
+        self.family_index.update()
+
+    def _run_pair(self, plugin, instance):
+        # Produce result of `plugin` and `instance`, on any thread
+        profile = contextlib.nullcontext()
+        if self.profiler is not None:
+            profile = self.profiler.profile(plugin)
 
         try:
-            result = pyblish.plugin.process(plugin, self.context, instance)
-            # Make note of the order at which the
-            # potential error error occured.
-            if result["error"] is not None:
-                self.processing["ordersWithError"].add(plugin.order)
+            with util.measure() as measurement:
+                with self.tracker.processing(plugin), profile:
+                    if coroutines.is_async(plugin):
+                        # Awaited to completion, one at a time, whereas
+                        # `asynchronous.AsyncController` awaits alongside
+                        result = coroutines.run(coroutines.process(
+                            plugin, self.context, instance
+                        ))
+                    else:
+                        result = pyblish.plugin.process(
+                            plugin, self.context, instance
+                        )
+            result.update(measurement)
 
         except Exception as exc:
             raise Exception("Unknown error({}): {}".format(
@@ -231,152 +595,763 @@ class Controller(QtCore.QObject):
 
         return result
 
+    def _finish_pairs(self, pairs, results):
+        """Note `results` of `pairs`, on the main thread
+
+        Instances created are noted as created by each plug-in of
+        `pairs`, as which of those processed alongside created them
+        is not known. Instances removed are no longer indexed.
+        """
+
+        plugins = []
+        for plugin, _ in pairs:
+            if plugin not in plugins:
+                plugins.append(plugin)
+
+        created, _ = self.family_index.update()
+        for instance in created:
+            for plugin in plugins:
+                self.tracker.created(plugin, instance)
+
+        # Make note of the order at which the
+        # potential error error occured.
+        for (plugin, _), result in zip(pairs, results):
+            if result["error"] is not None:
+                self.processing["ordersWithError"].add(plugin.order)
+
+    def _process_threaded(self, plugin, instance):
+        result = self._run_pair(plugin, instance)
+
+        # Log records are captured on the root logger,
+        # which is shared by every thread processing alongside
+        ident = threading.current_thread().ident
+        result["records"] = [
+            record for record in result["records"]
+            if record.thread == ident
+        ]
+        return result
+
+    def _note_declared_reads(self, plugin, instance):
+        # For when access cannot be noted, assume all that is declared
+        context_keys, instance_keys = cache.inputs(plugin)
+        self.tracker.reads[plugin].update(
+            (self.context.id, key) for key in context_keys
+        )
+        if instance is not None:
+            self.tracker.reads[plugin].update(
+                (instance.id, key) for key in instance_keys
+            )
+
+    def _process_pairs(self, pairs):
+        """Produce results of all `pairs`, in order
+
+        Pairs with a result in the cache are replayed, the rest are
+        processed and their result stored. Results are returned, and
+        stored in the context, in the order of `pairs` regardless of
+        which finished first.
+
+        Yields `waiting` for as long as extractors transfer, see
+        `_process_fanned_out`, and returns the results.
+        """
+
+        # Results of pairs are appended from here on, as they finish
+        start = len(self.context.data.setdefault("results", []))
+
+        results = [None] * len(pairs)
+        fingerprints = {}
+        for index, (plugin, instance) in enumerate(pairs):
+            if self.cache is None:
+                break
+
+            fingerprint = self.cache.fingerprint(
+                plugin, self.context, instance
+            )
+            if fingerprint is None:
+                continue
+
+            result = self.cache.replay(
+                fingerprint, plugin, self.context, instance
+            )
+            if result is None:
+                fingerprints[index] = fingerprint
+                continue
+
+            self._note_declared_reads(plugin, instance)
+            if result["error"] is not None:
+                self.processing["ordersWithError"].add(plugin.order)
+            results[index] = result
+
+        remaining = [
+            index for index, result in enumerate(results)
+            if result is None
+        ]
+        fanned_out = [
+            index for index in remaining
+            if self.is_fanned_out(pairs[index][0])
+        ]
+        others = [index for index in remaining if index not in fanned_out]
+
+        processed = self._process_concurrently(
+            [pairs[index] for index in others]
+        )
+        transferred = yield from self._process_fanned_out(
+            [pairs[index] for index in fanned_out]
+        )
+        for index, result in zip(others + fanned_out,
+                                 processed + transferred):
+            results[index] = result
+            if index in fingerprints:
+                self.cache.store(fingerprints[index], result)
+
+        # Only those appended since are put in order, rather than the
+        # results of every pair processed so far
+        ids = set(id(result) for result in results)
+        context_results = self.context.data["results"]
+        context_results[start:] = [
+            result for result in context_results[start:]
+            if id(result) not in ids
+        ] + results
+
+        return results
+
+    def _process_concurrently(self, pairs):
+        """Produce results of `pairs`, alongside each other
+
+        A single pair is processed in the calling thread, whereas
+        multiple pairs are distributed over the process and thread
+        pools. These are waited for as a whole, blocking the calling
+        thread, and with it the window, until the last of them is
+        done; keep pairs processed alongside short, or have them
+        transfer on the I/O pool instead, see `extraction`.
+        """
+
+        if len(pairs) < 2:
+            return [self._process(*pair) for pair in pairs]
+
+        # Noted on this thread, once for every pair, as is the level of
+        # the root logger; each thread would otherwise restore the level
+        # another thread set, see `pyblish.plugin.logger`
+        threaded = [
+            pair for pair in pairs if not self.is_poolable(pair[0])
+        ]
+        self._prepare_pairs(threaded)
+
+        root = logging.getLogger()
+        level = root.level
+        root.setLevel(logging.DEBUG)
+        try:
+            results = self._wait_concurrently(pairs)
+        finally:
+            root.setLevel(level)
+
+        self._finish_pairs(threaded, [
+            result for (plugin, _), result in zip(pairs, results)
+            if not self.is_poolable(plugin)
+        ])
+
+        # Processed here once the rest is done, such that instances
+        # they create are told apart from those of the rest
+        for index, (plugin, instance) in enumerate(pairs):
+            if results[index] is None:
+                results[index] = self._process(plugin, instance)
+
+        return results
+
+    def _wait_concurrently(self, pairs):
+        futures = []
+        for plugin, instance in pairs:
+            if self.is_poolable(plugin):
+                # The worker cannot note access
+                self._note_declared_reads(plugin, instance)
+
+                if self.process_executor is None:
+                    self.process_executor = pool.executor(
+                        self.process_count()
+                    )
+                future = pool.submit(
+                    self.process_executor, plugin, self.context, instance
+                )
+            else:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(self.worker_count())
+                future = self.executor.submit(
+                    self._process_threaded, plugin, instance
+                )
+            futures.append(future)
+
+        results = []
+        for (plugin, instance), future in zip(pairs, futures):
+            if not self.is_poolable(plugin):
+                results.append(future.result())
+                continue
+
+            try:
+                outcome = future.result()
+            except Exception:
+                # The worker could not run it, e.g. the plug-in could not
+                # be imported or its data could not be pickled
+                traceback.print_exc()
+                results.append(None)
+                continue
+
+            result = util.deserialize_result(
+                outcome, plugin, self.context, instance
+            )
+            if result["error"] is not None:
+                self.processing["ordersWithError"].add(plugin.order)
+            results.append(result)
+
+        return results
+
+    def _process_fanned_out(self, pairs):
+        """Export `pairs` in turn, whilst their items transfer alongside
+
+        Once every pair is exported, their transfers are waited for,
+        see `extraction`. Results are those of exporting, along with
+        records, the first error and progress of their transfers.
+
+        Yields `waiting` in between exports, and whilst polling for
+        finished transfers, such that the window is drawn and reflects
+        their progress, see `iterate_and_process`. Returns the results.
+        """
+
+        if not pairs:
+            return []
+
+        if self.io_pool is None:
+            self.io_pool = extraction.IOPool(
+                self.io_worker_count(), self.io_queue_limit()
+            )
+
+        ident = threading.get_ident()
+        results = []
+        totals = []
+        exported_at = []
+        transfers = {}
+
+        # As `pyblish.plugin.logger` does, for records of transfers
+        root = logging.getLogger()
+        level = root.level
+        root.setLevel(logging.DEBUG)
+        try:
+            for index, (plugin, instance) in enumerate(pairs):
+                with extraction.exporting() as exported:
+                    result = self._process(plugin, instance)
+
+                # Records of transfers of pairs exported before
+                result["records"] = [
+                    record for record in result["records"]
+                    if record.thread == ident
+                ]
+                exported_at.append(time.perf_counter())
+                results.append(result)
+
+                items = [
+                    (extractor, item)
+                    for extractor, _, items in exported
+                    for item in items
+                ]
+                totals.append(len(items))
+                if not items:
+                    result["progress"] = 1.0
+
+                for extractor, item in items:
+                    future = self.io_pool.submit(extractor, instance, item)
+                    transfers[future] = index
+
+                yield waiting
+
+            done = [0] * len(pairs)
+            while transfers:
+                finished, _ = wait(
+                    transfers,
+                    timeout=self.io_poll_interval,
+                    return_when=FIRST_COMPLETED
+                )
+                if not finished:
+                    yield waiting
+                    continue
+
+                for future in finished:
+                    index = transfers.pop(future)
+                    plugin, instance = pairs[index]
+                    result = results[index]
+
+                    records, error = future.result()
+                    result["records"].extend(records)
+                    if error is not None and result["error"] is None:
+                        result["success"] = False
+                        result["error"] = error
+                        self.processing["ordersWithError"].add(plugin.order)
+
+                    done[index] += 1
+                    result["progress"] = float(done[index]) / totals[index]
+                    if done[index] == totals[index]:
+                        # Exporting, along with transferring
+                        transferred = time.perf_counter() - exported_at[index]
+                        result["duration"] += transferred * 1000
+                        if result.get("wall_time") is not None:
+                            result["wall_time"] += transferred
+
+                    self.io_progress.emit(plugin, instance, result["progress"])
+
+                yield waiting
+        finally:
+            root.setLevel(level)
+
+        return results
+
     def _pair_yielder(self, plugins):
-        for plugin in plugins:
-            if (
-                self.processing["current_group_order"] is not None
-                and plugin.order > self.processing["current_group_order"]
+        # Pairs of concurrent plug-ins sharing a slot, i.e. independent
+        # of each other, are gathered and yielded as a list, to be
+        # processed together
+        self.plan = plan.ExecutionPlan(
+            list(plugins),
+            self.family_index,
+            self.order_groups.groups(),
+            self.processing["current_group_order"],
+            self.validators_order,
+        )
+
+        batch = []
+        while self.plan.position < len(self.plan):
+            index = self.plan.position
+            step = self.plan.step(index)
+            plugin = step.plugin
+
+            if batch and not (
+                self.is_concurrent(plugin)
+                and self.slots.get(plugin) == self.slots.get(batch[-1][0])
             ):
-                new_next_group_order = None
-                new_current_group_order = self.processing["next_group_order"]
-                if new_current_group_order is not None:
-                    current_next_order_found = False
-                    for order in self.order_groups.groups().keys():
-                        if current_next_order_found:
-                            new_next_group_order = order
-                            break
-
-                        if order == new_current_group_order:
-                            current_next_order_found = True
-
-                self.processing["next_group_order"] = new_next_group_order
+                yield batch
+                batch = []
+
+            if index in self.plan.boundaries:
+                passed_order = self.processing["current_group_order"]
+                new_current_group_order = self.plan.boundaries[index]
                 self.processing["current_group_order"] = (
                     new_current_group_order
                 )
+                self.processing["next_group_order"] = self.next_group_order(
+                    new_current_group_order
+                )
+
+                if not self.errored:
+                    self.write_checkpoint(passed_order)
+
+                # Results of the group are shown before it is passed,
+                # such that groups with errors are kept expanded
+                self.flush_results()
 
                 if self.collect_state == 0:
                     self.collect_state = 1
                     self.switch_toggleability.emit(True)
                     self.passed_group.emit(new_current_group_order)
+
+                    # Instances are known from here on
+                    self.plan.refresh()
                     yield IterationBreak("Collected")
+                    step = self.plan.step(index)
 
                 self.passed_group.emit(new_current_group_order)
                 if self.errored:
                     yield IterationBreak("Last group errored")
+                    step = self.plan.step(index)
 
             if self.collect_state == 1:
                 self.collect_state = 2
                 self.switch_toggleability.emit(False)
 
-            if not self.validated and plugin.order > self.validators_order:
+            if not self.validated and index >= self.plan.validation_index:
                 self.validated = True
                 if self.processing["stop_on_validation"]:
                     yield IterationBreak("Validated")
+                    step = self.plan.step(index)
 
             # Stop if was stopped
             if self.stopped:
                 self.stopped = False
                 yield IterationBreak("Stopped")
+                step = self.plan.step(index)
 
             # check test if will stop
             self.processing["nextOrder"] = plugin.order
-            message = self.test(**self.processing)
+            message = self.run_test()
             if message:
                 yield IterationBreak("Stopped due to \"{}\"".format(message))
+                step = self.plan.step(index)
 
             self.processing["last_plugin_order"] = plugin.order
+            self.plan.position = index + 1
+
             if not plugin.active:
                 pyblish.logic.log.debug("%s was inactive, skipping.." % plugin)
                 self.was_skipped.emit(plugin)
                 continue
 
-            if plugin.__instanceEnabled__:
-                instances = pyblish.logic.instances_by_plugin(
-                    self.context, plugin
-                )
-                if not instances:
-                    self.was_skipped.emit(plugin)
+            if not step.compatible:
+                self.was_skipped.emit(plugin)
+                continue
+
+            if step.instances is None:
+                yield (plugin, None)
+                continue
+
+            for instance in step.instances:
+                if instance.data.get("publish") is False:
+                    pyblish.logic.log.debug(
+                        "%s was inactive, skipping.." % instance
+                    )
                     continue
 
+                if self.is_concurrent(plugin):
+                    batch.append((plugin, instance))
+                else:
+                    yield (plugin, instance)
+
+        if batch:
+            yield batch
+
+        self.flush_results()
+        self.passed_group.emit(self.processing["next_group_order"])
+
+    def next_group_order(self, order):
+        """Return order of the group following that of `order`, or None"""
+        orders = list(self.order_groups.groups().keys())
+        if order not in orders:
+            return None
+
+        following = orders[orders.index(order) + 1:]
+        return following[0] if following else None
+
+    def run_test(self):
+        """Return message of the registered test, once per change
+
+        The test is given `processing`, and is only run anew once any
+        of it changed, or the test was registered anew, see
+        `load_plugins`.
+        """
+
+        key = tuple(sorted(
+            (name, frozenset(value) if isinstance(value, set) else value)
+            for name, value in self.processing.items()
+        ))
+        if key != self._test_key:
+            self._test_key = key
+            self._test_message = self.test(**self.processing)
+        return self._test_message
+
+    def _revalidation_yielder(self, plugins):
+        for plugin in plugins:
+            if self.stopped:
+                self.stopped = False
+                yield IterationBreak("Stopped")
+
+            if plugin.__instanceEnabled__:
+                instances = self.family_index.instances_by_plugin(plugin)
                 for instance in instances:
                     if instance.data.get("publish") is False:
-                        pyblish.logic.log.debug(
-                            "%s was inactive, skipping.." % instance
-                        )
                         continue
                     yield (plugin, instance)
-            else:
-                families = util.collect_families_from_instances(
-                    self.context, only_active=True
-                )
-                plugins = pyblish.logic.plugins_by_families(
-                    [plugin], families
-                )
-                if not plugins:
-                    self.was_skipped.emit(plugin)
-                    continue
+            elif self.family_index.is_compatible(plugin):
                 yield (plugin, None)
 
-        self.passed_group.emit(self.processing["next_group_order"])
+    def _results(self):
+        """Process pairs and yield their results, until a break
+
+        Results of a list of pairs, see `iterate_and_process`, are all
+        emitted before the first of them is yielded. Whilst waiting on
+        transfers, `waiting` is yielded instead.
+
+        Returns:
+            bool: Whether all pairs were processed, rather than
+                processing being stopped by an `IterationBreak`
+
+        """
+
+        self.is_running = True
+        try:
+            while True:
+                try:
+                    self.current_pair = next(self.pair_generator)
+                except StopIteration:
+                    return True
+
+                if isinstance(self.current_pair, IterationBreak):
+                    return False
+
+                pairs = self.current_pair
+                if not isinstance(pairs, list):
+                    pairs = [pairs]
+
+                for pair in pairs:
+                    self.about_to_process.emit(*pair)
+
+                results = yield from self._process_pairs(pairs)
+                for result in results:
+                    if result["error"] is not None:
+                        self.errored = True
+
+                    self.was_processed.emit(result)
+
+                self.pending_results.extend(results)
+                for result in results:
+                    yield result
+
+        finally:
+            self.is_running = False
+            self.flush_results()
+            self.write_profile()
+
+    def flush_results(self):
+        """Emit results processed since the last flush as one batch"""
+        if not self.pending_results:
+            return
+
+        results, self.pending_results = self.pending_results, []
+        self.was_processed_batch.emit(results)
 
     def iterate_and_process(self, on_finished=lambda: None):
         """ Iterating inserted plugins with current context.
         Collectors do not contain instances, they are None when collecting!
         This process don't stop on one
+
+        Pairs are processed back to back for as long as they fit into
+        the frame budget (see `util.FrameBudget`), only then is the
+        event loop given back to Qt until the next slice. Results of a
+        slice are emitted together, see `was_processed_batch`.
+
+        A list of pairs, as yielded for `thread_safe` and `process_pool`
+        plug-ins, is processed concurrently and counts as a single step.
+
+        The first slice is scheduled too, such that the caller, e.g. a
+        button of the window, returns to Qt before processing starts.
+        Without a budget, processing is synchronous from the start.
         """
+        budget = util.FrameBudget(self.frame_budget)
+        results = self._results()
+
         def on_next():
-            try:
-                self.current_pair = next(self.pair_generator)
-                if isinstance(self.current_pair, IterationBreak):
-                    raise self.current_pair
+            budget.start()
+            while True:
+                try:
+                    next(results)
+
+                except StopIteration as finished:
+                    if not finished.value:
+                        self.was_stopped.emit()
+                        return
+
+                    # All pairs were processed successfully!
+                    return on_finished()
+
+                except Exception:
+                    # This is a bug
+                    exc_type, exc_msg, exc_tb = sys.exc_info()
+                    traceback.print_exception(exc_type, exc_msg, exc_tb)
+                    self.was_stopped.emit()
+                    return on_unexpected_error(error=exc_msg)
+
+                # Give Qt time to draw and respond to the user
+                if budget.exhausted():
+                    self.flush_results()
+                    return util.schedule(on_next)
 
-            except IterationBreak:
-                self.is_running = False
-                self.was_stopped.emit()
-                return
+        def on_unexpected_error(error):
+            util.u_print(u"An unexpected error occurred:\n %s" % error)
+            return on_finished()
 
-            except StopIteration:
-                self.is_running = False
-                # All pairs were processed successfully!
-                return util.defer(500, on_finished)
+        if budget.budget > 0:
+            util.schedule(on_next)
+        else:
+            on_next()
 
-            except Exception:
-                # This is a bug
-                exc_type, exc_msg, exc_tb = sys.exc_info()
-                traceback.print_exception(exc_type, exc_msg, exc_tb)
-                self.is_running = False
-                self.was_stopped.emit()
-                return util.defer(
-                    500, lambda: on_unexpected_error(error=exc_msg)
-                )
+    def iter_results(self, stage="publish", resume=False):
+        """Reset, and yield each result as soon as its pair is processed
 
-            self.about_to_process.emit(*self.current_pair)
-            util.defer(100, on_process)
+        A plain alternative to the signals of the controller, for
+        embedding publishing without a window or running event loop.
+        Processing happens as results are asked for, and stops where
+        it would in the window; once validation failed, or `stage`
+        was reached. Stopping early, e.g. by breaking out of a loop,
+        stops processing.
 
-        def on_process():
-            try:
-                result = self._process(*self.current_pair)
-                if result["error"] is not None:
-                    self.errored = True
+            for result in controller.iter_results("validate"):
+                if not result["success"]:
+                    break
 
-                self.was_processed.emit(result)
+        Arguments:
+            stage (str): Either "collect", "validate" or "publish"
+            resume (bool, optional): Continue from the last checkpoint,
+                if any, yielding its results first, see `restore`
 
-            except Exception:
-                # TODO this should be handled much differently
-                exc_type, exc_msg, exc_tb = sys.exc_info()
-                traceback.print_exception(exc_type, exc_msg, exc_tb)
-                return util.defer(
-                    500, lambda: on_unexpected_error(error=exc_msg)
-                )
+        Returns:
+            generator: Results, as emitted by `was_processed`
 
-            util.defer(10, on_next)
+        """
 
-        def on_unexpected_error(error):
-            util.u_print(u"An unexpected error occurred:\n %s" % error)
-            return util.defer(500, on_finished)
+        if stage not in stages:
+            raise ValueError("Unsupported stage \"%s\", expected one of %s" % (
+                stage, ", ".join(stages)
+            ))
 
-        self.is_running = True
-        util.defer(10, on_next)
+        return self._iter_results(stage, resume)
+
+    def _iter_results(self, stage, resume):
+        if resume and self.restore():
+            yield from list(self.context.data["results"])
+        else:
+            self.prepare()
+            yield from self._without_waiting(self._results())
+
+        if stage == "collect" or self.errored:
+            return
+
+        # Resumed from a checkpoint past validation
+        if stage == "validate" and self.validated:
+            return
+
+        self.processing["stop_on_validation"] = stage == "validate"
+        finished = yield from self._without_waiting(self._results())
+
+        if finished and stage == "publish":
+            self.on_published()
+
+    def _without_waiting(self, results):
+        # Results of `_results`, for callers without a window to draw
+        try:
+            while True:
+                try:
+                    result = next(results)
+                except StopIteration as finished:
+                    return finished.value
+
+                if result is not waiting:
+                    yield result
+        finally:
+            results.close()
+
+    def write_checkpoint(self, passed_order):
+        """Write state of this run, see `checkpoint`
+
+        Arguments:
+            passed_order (float): Order of the group just passed
+
+        """
+
+        if self.checkpoints is None:
+            return
+
+        try:
+            self.checkpoints.write(self.context, self.plugins, passed_order)
+        except (IOError, OSError) as error:
+            util.u_print("Could not write checkpoint: %s" % error)
+
+    def restore(self):
+        """Prepare a run continuing from the last checkpoint
+
+        Rather than collecting, the context and its instances are
+        restored from the checkpoint, along with results of groups
+        already passed and plug-ins toggled. Processing continues from
+        the group after the one passed. See `checkpoint`.
+
+        Returns:
+            bool: Whether a checkpoint was restored
+
+        """
+
+        checkpoints = checkpoint.from_environment()
+        state = None if checkpoints is None else checkpoints.read()
+        if state is None:
+            return False
+
+        self._prepare()
+
+        # Groups are configured by environment, see `util.OrderGroups`
+        orders = list(self.order_groups.groups().keys())
+        passed_order = state["passedOrder"]
+        if passed_order not in orders:
+            util.u_print("Groups changed since checkpoint, not resuming.")
+            return False
+
+        self.context._id = state["context"]["id"]
+        self.context.data.update(state["context"]["data"])
+
+        instances = {}
+        for data in state["instances"]:
+            instance = self.context.create_instance(data["name"])
+            instance._id = data["id"]
+            instance.data.update(data["data"])
+            self.tracker.track(instance)
+            self.family_index.add(instance)
+            instances[instance.id] = instance
+
+        plugins = dict(
+            (checkpoint.plugin_key(plugin), plugin)
+            for plugin in self.plugins
+        )
+        for key, plugin_state in state["plugins"].items():
+            if key in plugins:
+                plugins[key].active = plugin_state["active"]
+
+        results = []
+        for data in state["results"]:
+            plugin = plugins.get(data["pluginKey"])
+            if plugin is None:
+                continue
+
+            instance = instances.get(data["instanceId"])
+            result = util.deserialize_result(
+                data, plugin, self.context, instance
+            )
+            result["cached"] = True
+            results.append(result)
+
+        # Pick up from the group after the one passed
+        self.processing["current_group_order"] = passed_order
+        self.processing["next_group_order"] = self.next_group_order(
+            passed_order
+        )
+        self.processing["last_plugin_order"] = passed_order
+
+        self.collect_state = 2
+        self.collected = True
+        self.validated = passed_order >= self.validators_order
+        self.pair_generator = self._pair_yielder([
+            plugin for plugin in self.plugins
+            if plugin.order > passed_order
+        ])
+
+        self.was_reset.emit()
+        self.switch_toggleability.emit(False)
+
+        for result in results:
+            self.was_processed.emit(result)
+        self.pending_results.extend(results)
+        self.flush_results()
+
+        util.u_print("Resuming from checkpoint of %s" % state["time"])
+        return True
+
+    def resume(self):
+        """Continue publishing from the last checkpoint, see `restore`
+
+        Without a checkpoint to resume, this resets instead.
+        """
+
+        if self.restore():
+            self.publish()
+        else:
+            self.reset()
+
+    def write_profile(self):
+        """Write stats of plug-ins profiled so far, see `profiler`"""
+        if self.profiler is None:
+            return
+
+        paths = self.profiler.write()
+        if paths:
+            util.u_print("Profile written to %s" % self.profiler.directory)
 
     def collect(self):
         """ Iterate and process Collect plugins
@@ -385,30 +1360,71 @@ class Controller(QtCore.QObject):
         self.iterate_and_process()
 
     def validate(self):
-        """ Process plugins to validations_order value."""
+        """ Process plugins to validations_order value.
+        With nothing past validation, all plugins were processed and
+        publishing is finished as well.
+        """
         self.processing["stop_on_validation"] = True
-        self.iterate_and_process()
+        self.iterate_and_process(self.on_published)
 
     def publish(self):
         """ Iterate and process all remaining plugins."""
         self.processing["stop_on_validation"] = False
         self.iterate_and_process(self.on_published)
 
+    def release(self):
+        """Release the context and plug-ins of the last run
+
+        Data of the context and its instances is cleared, along with
+        results, such that what they hold is released once the run is
+        over rather than whenever the garbage collector gets to it.
+        """
+
+        if self.context is not None:
+            for entity in [self.context] + list(self.context):
+                dict.clear(entity.data)
+            self.context[:] = []
+
+        self.context = None
+        self.plugins = []
+        self.slots = {}
+        self.pair_generator = None
+        self.plan = None
+        self.current_pair = None
+        self.pending_results = []
+        self.tracker = None
+        self.family_index = None
+        self.dirty_plugins = set()
+        self._threadable = {}
+        self._poolable = {}
+
     def cleanup(self):
-        """Forcefully delete objects from memory
-        In an ideal world, this shouldn't be necessary. Garbage
-        collection guarantees that anything without reference
-        is automatically removed.
-        However, because this application is designed to be run
-        multiple times from the same interpreter process, extra
-        case must be taken to ensure there are no memory leaks.
-        Explicitly deleting objects shines a light on where objects
-        may still be referenced in the form of an error. No errors
-        means this was uneccesary, but that's ok.
+        """Release everything held by the controller
+
+        Worker threads and processes are shut down, and the last run
+        is released, see `release`. This application is designed to be
+        run many times from the same interpreter process, e.g. Maya,
+        where anything left behind adds up.
         """
 
-        for instance in self.context:
-            del(instance)
+        self.release()
 
-        for plugin in self.plugins:
-            del(plugin)
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        if self.process_executor is not None:
+            self.process_executor.shutdown()
+            self.process_executor = None
+
+        if self.io_pool is not None:
+            self.io_pool.shutdown()
+            self.io_pool = None
+
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+        self.cache = None
+        self.profiler = None
+        self.checkpoints = None
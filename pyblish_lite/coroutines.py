@@ -0,0 +1,141 @@
+"""Await coroutine plug-ins, see `asynchronous`
+
+Kept apart from `asynchronous`, such that `control` may await
+coroutine plug-ins one at a time, whereas an `AsyncController`
+awaits them alongside each other.
+
+"""
+import time
+import asyncio
+import logging
+import inspect
+import threading
+
+import pyblish.api
+import pyblish.lib
+import pyblish.plugin
+
+# Loop awaiting coroutines of threads already running a loop, see `run`
+_loop = None
+_lock = threading.Lock()
+
+
+def is_async(plugin):
+    """Return whether `plugin` processes by coroutine"""
+    return bool(
+        issubclass(plugin, (pyblish.api.ContextPlugin,
+                            pyblish.api.InstancePlugin))
+        and inspect.iscoroutinefunction(plugin.process)
+    )
+
+
+class TaskHandler(logging.Handler):
+    """Collect records emitted by the task creating the handler
+
+    The root logger is shared by every coroutine awaited alongside.
+    """
+
+    def __init__(self, records):
+        super(TaskHandler, self).__init__()
+        self.records = records
+        self.task = asyncio.current_task()
+
+    def emit(self, record):
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            # Emitted by another thread
+            return
+
+        if task is self.task:
+            self.records.append(record)
+
+
+async def process(plugin, context, instance=None):
+    """Produce result of coroutine `plugin`, as `pyblish.plugin.process`
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to await
+        context (pyblish.api.Context): The current context
+        instance (pyblish.api.Instance, optional): Instance to process
+
+    """
+
+    result = {
+        "success": False,
+        "plugin": plugin,
+        "instance": instance,
+        "action": None,
+        "error": None,
+        "records": list(),
+        "duration": None,
+        "progress": 0,
+        "context": context,
+    }
+
+    if issubclass(plugin, pyblish.api.ContextPlugin):
+        subject = context
+    else:
+        subject = instance
+
+    handler = TaskHandler(result["records"])
+    root = logging.getLogger()
+    root.addHandler(handler)
+
+    start = time.time()
+    try:
+        await plugin().process(subject)
+        result["success"] = True
+    except Exception as error:
+        pyblish.lib.emit("pluginFailed", plugin=plugin, context=context,
+                         instance=instance, error=error)
+        pyblish.lib.extract_traceback(error, plugin.__module__)
+        result["error"] = error
+        pyblish.plugin.log.exception(error.formatted_traceback)
+    finally:
+        root.removeHandler(handler)
+
+    result["duration"] = (time.time() - start) * 1000  # ms
+
+    context.data.setdefault("results", list()).append(result)
+
+    pyblish.lib.emit("pluginProcessed", result=result)
+    return result
+
+
+def run(coroutine):
+    """Await `coroutine` to completion, and return its result
+
+    A thread already running a loop, such as the Qt thread with qasync
+    or that of a Jupyter kernel, cannot run another. The coroutine is
+    then awaited on a loop of its own, in a thread started on first use,
+    as with `asynchronous.AsyncController`.
+
+    Arguments:
+        coroutine (coroutine): Coroutine to await
+
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    return asyncio.run_coroutine_threadsafe(coroutine, event_loop()).result()
+
+
+def event_loop():
+    """Return loop of `run`, starting it if need be"""
+    global _loop
+
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever,
+                name="PyblishLiteCoroutines"
+            )
+            thread.daemon = True
+            thread.start()
+
+    return _loop
@@ -1,8 +1,9 @@
 import platform
+import collections
 
 from .vendor.Qt import QtWidgets, QtGui, QtCore
 
-from . import model
+from . import model, util
 from .awesome import tags as awesome
 from .constants import (
     PluginStates, InstanceStates, PluginActionStates, GroupStates, Roles
@@ -19,7 +20,12 @@ colors = {
     "hover": QtGui.QColor(255, 255, 255, 10),
     "selected": QtGui.QColor(255, 255, 255, 20),
     "outline": QtGui.QColor("#333"),
-    "group": QtGui.QColor("#333")
+    "group": QtGui.QColor("#333"),
+    "detail": QtGui.QColor("#333"),
+    "detailHover": QtGui.QColor("#353535"),
+    "detailSelected": QtGui.QColor("#303030"),
+    "detailFont": QtGui.QColor("#aaa"),
+    "detailOutline": QtGui.QColor("#222"),
 }
 
 scale_factors = {"darwin": 1.5}
@@ -40,6 +46,7 @@ font_metrics = {
 }
 icons = {
     "action": awesome["adn"],
+    "cached": awesome["database"],
     "angle-right": awesome["angle-right"],
     "angle-left": awesome["angle-left"],
     "plus-sign": awesome['plus'],
@@ -99,11 +106,20 @@ class PluginItemDelegate(QtWidgets.QStyledItemDelegate):
 
         assert label_rect.width() > 0
 
+        # Duration, right of the label and left of where actions are
+        duration = index.data(Roles.DurationRole)
+        duration_text = util.format_duration(duration) if duration else ""
+        duration_width = font_metrics["h4"].width(duration_text)
+        duration_rect = QtCore.QRectF(label_rect)
+        duration_rect.setRight(
+            body_rect.right() - perspective_rect.width() * 1.5
+        )
+
         label = index.data(QtCore.Qt.DisplayRole)
         label = font_metrics["h4"].elidedText(
             label,
             QtCore.Qt.ElideRight,
-            label_rect.width() - 20
+            label_rect.width() - 20 - duration_width
         )
 
         font_color = colors["idle"]
@@ -123,6 +139,13 @@ class PluginItemDelegate(QtWidgets.QStyledItemDelegate):
         painter.setPen(QtGui.QPen(font_color))
         painter.drawText(label_rect, label)
 
+        # Draw duration
+        if duration_text:
+            painter.setPen(QtGui.QPen(colors["inactive"]))
+            painter.drawText(
+                duration_rect, QtCore.Qt.AlignRight, duration_text
+            )
+
         # Draw action icon
         if index.data(Roles.PluginActionsVisibleRole):
             painter.save()
@@ -151,6 +174,22 @@ class PluginItemDelegate(QtWidgets.QStyledItemDelegate):
 
             painter.restore()
 
+        # Draw cached icon, left of where actions are
+        if publish_states & PluginStates.WasCached:
+            painter.save()
+            painter.setFont(fonts["smallAwesome"])
+            painter.setPen(QtGui.QPen(colors["inactive"]))
+
+            icon_rect = QtCore.QRectF(
+                option.rect.adjusted(
+                    label_rect.width() - perspective_rect.width() * 1.25,
+                    label_rect.height() / 3, 0, 0
+                )
+            )
+            painter.drawText(icon_rect, icons["cached"])
+
+            painter.restore()
+
         # Draw checkbox
         pen = QtGui.QPen(check_color, 1)
         painter.setPen(pen)
@@ -351,6 +390,18 @@ class OverviewGroupSection(QtWidgets.QStyledItemDelegate):
         painter.setFont(fonts["h5"])
         painter.drawText(label_rect, label)
 
+        # Draw total duration of the group, if any
+        duration = index.data(Roles.DurationRole)
+        if duration:
+            duration_rect = QtCore.QRectF(label_rect)
+            duration_rect.setRight(bg_rect.right() - radius)
+            painter.setPen(QtGui.QPen(colors["inactive"]))
+            painter.drawText(
+                duration_rect,
+                QtCore.Qt.AlignRight,
+                util.format_duration(duration)
+            )
+
         if option.state & QtWidgets.QStyle.State_MouseOver:
             painter.fillPath(bg_path, colors["hover"])
 
@@ -541,13 +592,76 @@ class ArtistDelegate(QtWidgets.QStyledItemDelegate):
 
 
 class TerminalItem(QtWidgets.QStyledItemDelegate):
-    """Delegate used exclusively for the Terminal"""
+    """Delegate used exclusively for the Terminal
+
+    Details of records are drawn from documents laid out as rows are
+    painted, hence only for those expanded and in view. Documents are
+    kept by record and width, for the most recently painted details.
+
+    Arguments:
+        parent (QtWidgets.QAbstractItemView, optional): View of the
+            terminal, whose width details are laid out at
+
+    """
+
+    # Documents kept laid out, at most
+    cache_size = 256
+
+    # Space around the text of details, within their border
+    padding = 5
+
+    def __init__(self, parent=None):
+        super(TerminalItem, self).__init__(parent)
+        self._documents = collections.OrderedDict()
+
+    def document(self, index, width):
+        """Return document of detail at `index`, laid out at `width`
+
+        Documents are kept by the id of their record where the model
+        has one, such that text is only made of records not kept.
+        """
+
+        text = None
+        record_id = index.data(Roles.TerminalRecordIdRole)
+        if record_id is None:
+            text = record_id = index.data(QtCore.Qt.DisplayRole)
+
+        key = (record_id, width)
+        document = self._documents.pop(key, None)
+
+        if document is None:
+            if text is None:
+                text = index.data(QtCore.Qt.DisplayRole)
+
+            option = QtGui.QTextOption()
+            option.setWrapMode(QtGui.QTextOption.WrapAtWordBoundaryOrAnywhere)
+
+            document = QtGui.QTextDocument()
+            document.setDefaultTextOption(option)
+            document.setDocumentMargin(self.padding)
+            document.setHtml(text)
+            document.setTextWidth(width)
+
+            while len(self._documents) >= self.cache_size:
+                self._documents.popitem(last=False)
+
+        self._documents[key] = document
+        return document
+
+    def detail_width(self, option):
+        view = self.parent()
+        if isinstance(view, QtWidgets.QAbstractItemView):
+            width = view.viewport().width()
+        else:
+            width = option.rect.width()
+        return max(1, width)
 
     def paint(self, painter, option, index):
-        super(TerminalItem, self).paint(painter, option, index)
         item_type = index.data(Roles.TypeRole)
         if item_type == model.TerminalDetailType:
-            return
+            return self.paint_detail(painter, option, index)
+
+        super(TerminalItem, self).paint(painter, option, index)
 
         hover = QtGui.QPainterPath()
         hover.addRect(QtCore.QRectF(option.rect).adjusted(0, 0, -1, -1))
@@ -556,3 +670,36 @@ class TerminalItem(QtWidgets.QStyledItemDelegate):
 
         if option.state & QtWidgets.QStyle.State_MouseOver:
             painter.fillPath(hover, colors["hover"])
+
+    def paint_detail(self, painter, option, index):
+        rect = QtCore.QRectF(option.rect).adjusted(1, 1, -1, -1)
+        document = self.document(index, self.detail_width(option))
+
+        background = colors["detail"]
+        if option.state & QtWidgets.QStyle.State_Selected:
+            background = colors["detailSelected"]
+        elif option.state & QtWidgets.QStyle.State_MouseOver:
+            background = colors["detailHover"]
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtGui.QPen(colors["detailOutline"], 2))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 7, 7)
+
+        context = QtGui.QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(QtGui.QPalette.Text, colors["detailFont"])
+        context.clip = QtCore.QRectF(0, 0, rect.width(), rect.height())
+
+        painter.translate(option.rect.topLeft())
+        painter.setClipRect(context.clip)
+        document.documentLayout().draw(painter, context)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        if index.data(Roles.TypeRole) != model.TerminalDetailType:
+            return super(TerminalItem, self).sizeHint(option, index)
+
+        width = self.detail_width(option)
+        document = self.document(index, width)
+        return QtCore.QSize(width, int(document.size().height()) + 2)
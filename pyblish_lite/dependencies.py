@@ -0,0 +1,176 @@
+"""Order plug-ins by the context data they depend on
+
+Plug-ins may declare which keys of `context.data` they read and write.
+
+    class CollectExcludedNodes(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.2
+        requires_data = ["default_nodes", "reference_nodes"]
+        provides_data = ["excluded_nodes"]
+
+Within each group of `util.OrderGroups`, plug-ins are then ordered such
+that every plug-in runs after the providers of what it requires, rather
+than strictly by `order`. Plug-ins which do not depend on each other end
+up at the same level, and are processed together where they allow it
+(see `thread_safe` and `process_pool`).
+
+Note that `requires` is taken by pyblish, as the version of pyblish a
+plug-in requires, hence the suffix.
+
+Plug-ins without declarations keep to `order`; they run after every
+plug-in of a lower order within their group. The same goes for a
+declared plug-in requiring a key nothing in its group declares to
+provide, as it may be provided by such a plug-in.
+
+"""
+import collections
+
+from . import util
+
+
+def requires(plugin):
+    keys = getattr(plugin, "requires_data", None)
+    return None if keys is None else set(keys)
+
+
+def provides(plugin):
+    keys = getattr(plugin, "provides_data", None)
+    return None if keys is None else set(keys)
+
+
+def is_declared(plugin):
+    return requires(plugin) is not None or provides(plugin) is not None
+
+
+def group_of(order, group_orders):
+    for group_order in group_orders:
+        if group_order is None or order <= group_order:
+            return group_order
+    return None
+
+
+def dependencies(plugins):
+    """Return the indices each of `plugins` depends on
+
+    Arguments:
+        plugins (list): Plug-ins of a single group, sorted by order
+
+    """
+
+    providers = collections.defaultdict(list)
+    for index, plugin in enumerate(plugins):
+        for key in provides(plugin) or ():
+            providers[key].append(index)
+
+    result = []
+    for index, plugin in enumerate(plugins):
+        lower = set(
+            other for other in range(index)
+            if plugins[other].order < plugin.order
+        )
+
+        if not is_declared(plugin):
+            result.append(lower)
+            continue
+
+        depends = set()
+        for key in requires(plugin) or ():
+            if not providers[key]:
+                depends.update(lower)
+            depends.update(
+                other for other in providers[key]
+                if other != index
+            )
+
+        # Plug-ins providing the same key keep to their order
+        for key in provides(plugin) or ():
+            depends.update(
+                other for other in providers[key]
+                if other < index
+            )
+
+        result.append(depends)
+
+    return result
+
+
+def levels(plugins):
+    """Return level of each of `plugins`, or None on cyclic dependencies
+
+    A plug-in is one level above the highest of those it depends on.
+
+    Arguments:
+        plugins (list): Plug-ins of a single group, sorted by order
+
+    """
+
+    depends = dependencies(plugins)
+    dependants = collections.defaultdict(list)
+    remaining = []
+    for index, others in enumerate(depends):
+        remaining.append(len(others))
+        for other in others:
+            dependants[other].append(index)
+
+    result = [0] * len(plugins)
+    ready = collections.deque(
+        index for index, count in enumerate(remaining) if not count
+    )
+
+    visited = 0
+    while ready:
+        index = ready.popleft()
+        visited += 1
+        for dependant in dependants[index]:
+            result[dependant] = max(result[dependant], result[index] + 1)
+            remaining[dependant] -= 1
+            if not remaining[dependant]:
+                ready.append(dependant)
+
+    if visited != len(plugins):
+        return None
+
+    return result
+
+
+def sort(plugins, group_orders):
+    """Return `plugins` ordered by dependency, along with their slots
+
+    Plug-ins sharing a slot are independent of each other. Groups with
+    cyclic dependencies are left in their original order.
+
+    Arguments:
+        plugins (list): Plug-ins, sorted by order
+        group_orders (list): Orders of groups, see `util.OrderGroups`
+
+    Returns:
+        tuple: Sorted plug-ins and dictionary of slot by plug-in
+
+    """
+
+    groups = collections.OrderedDict()
+    for plugin in plugins:
+        group = group_of(plugin.order, group_orders)
+        groups.setdefault(group, []).append(plugin)
+
+    sorted_plugins = []
+    slots = {}
+    for group, members in groups.items():
+        member_levels = levels(members)
+        if member_levels is None:
+            util.u_print(
+                "Plug-ins of group \"{}\" have cyclic dependencies,"
+                " using their order instead.".format(group)
+            )
+            orders = sorted(set(plugin.order for plugin in members))
+            member_levels = [orders.index(plugin.order) for plugin in members]
+
+        ordered = sorted(
+            zip(member_levels, range(len(members)), members),
+            key=lambda item: item[:2]
+        )
+
+        for level, index, plugin in ordered:
+            sorted_plugins.append(plugin)
+            slots[plugin] = (group, level)
+
+    return sorted_plugins, slots
@@ -0,0 +1,184 @@
+"""Extraction fanned out over a pool of I/O threads
+
+Extractors of heavy data, such as caches and textures, spend most of
+their time writing and copying files rather than talking to the host.
+A :class:`FanOutExtractor` splits its work in two.
+
+- `export`: On the main thread, with access to the host, returns items
+  left to transfer; such as files to copy or convert.
+- `transfer`: On a thread of the I/O pool, once per item, without
+  access to the host.
+
+    class ExtractTextures(extraction.FanOutExtractor):
+        families = ["lookdev"]
+
+        def export(self, instance):
+            return [
+                (path, os.path.join(instance.data["stagingDir"], name))
+                for name, path in textures(instance)
+            ]
+
+        def transfer(self, instance, item):
+            shutil.copyfile(*item)
+
+The controller exports each instance in turn, whilst items of those
+exported before transfer alongside, and waits for every transfer once
+all instances are exported. No more than "PYBLISH_IO_QUEUE" items wait
+to be transferred at a time, 4 per thread by default, beyond which
+exporting waits for transfers to catch up. The pool has
+"PYBLISH_IO_THREADS" threads, 4 by default, 0 transfers items as part
+of processing instead.
+
+Records and the first error of transfers go to the result of their
+instance, with its progress as the fraction of items transferred. The
+window is drawn in between exports and whilst transfers are waited for,
+and is told of progress as each item is transferred, by `io_progress`
+of the controller.
+
+Elsewhere, such as with `pyblish.util.publish`, items are transferred
+as part of processing.
+
+"""
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+import pyblish.api
+import pyblish.lib
+
+# Receives items of extractors exported by the controller, if any
+_sink = contextvars.ContextVar("pyblish_lite_extraction_sink", default=None)
+
+
+class FanOutExtractor(pyblish.api.InstancePlugin):
+    """Extract on the main thread, transfer on the I/O pool"""
+
+    order = pyblish.api.ExtractorOrder
+
+    def export(self, instance):
+        """Return items of `instance` to transfer, see `transfer`
+
+        Called on the main thread, with access to the host.
+        """
+        return []
+
+    def transfer(self, instance, item):
+        """Transfer `item` of `instance`, as exported by `export`
+
+        Called on a thread of the I/O pool, without access to the host.
+        """
+        raise NotImplementedError
+
+    def process(self, instance):
+        items = list(self.export(instance) or [])
+
+        sink = _sink.get()
+        if sink is not None:
+            return sink(self, instance, items)
+
+        for item in items:
+            self.transfer(instance, item)
+
+
+def is_fanned_out(plugin):
+    """Return whether items of `plugin` are transferred on the I/O pool"""
+    return issubclass(plugin, FanOutExtractor)
+
+
+class exporting(object):
+    """Gather items exported within the block, rather than transfer them
+
+        with exporting() as exported:
+            pyblish.plugin.process(plugin, context, instance)
+
+        for extractor, instance, items in exported:
+            ...
+
+    """
+
+    def __init__(self):
+        self.exported = []
+        self._token = None
+
+    def _receive(self, extractor, instance, items):
+        self.exported.append((extractor, instance, items))
+
+    def __enter__(self):
+        self._token = _sink.set(self._receive)
+        return self.exported
+
+    def __exit__(self, *args):
+        _sink.reset(self._token)
+
+
+class ThreadHandler(logging.Handler):
+    """Collect records emitted by the thread creating the handler"""
+
+    def __init__(self, records):
+        super(ThreadHandler, self).__init__()
+        self.records = records
+        self.thread = threading.get_ident()
+
+    def emit(self, record):
+        if record.thread == self.thread:
+            self.records.append(record)
+
+
+def transfer(extractor, instance, item):
+    """Transfer `item` with `extractor`, on a thread of the I/O pool
+
+    Returns:
+        tuple: Records logged, and the error raised if any
+
+    """
+
+    records = []
+    handler = ThreadHandler(records)
+    root = logging.getLogger()
+    root.addHandler(handler)
+
+    try:
+        extractor.transfer(instance, item)
+    except Exception as error:
+        pyblish.lib.extract_traceback(error, type(extractor).__module__)
+        return records, error
+    finally:
+        root.removeHandler(handler)
+
+    return records, None
+
+
+class IOPool(object):
+    """Threads transferring items, with back-pressure
+
+    Arguments:
+        workers (int): Number of threads
+        queue_size (int): Items submitted and not yet transferred, at
+            most. Submitting more waits until one is done.
+
+    """
+
+    def __init__(self, workers, queue_size):
+        self.executor = ThreadPoolExecutor(
+            workers, thread_name_prefix="PyblishLiteIO"
+        )
+        self._slots = threading.BoundedSemaphore(max(1, queue_size))
+
+    def submit(self, extractor, instance, item):
+        """Return future of `transfer` of `item`, once there is room"""
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(transfer, extractor, instance, item)
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        self._slots.release()
+
+    def shutdown(self):
+        self.executor.shutdown()
@@ -0,0 +1,80 @@
+"""Headless publishing
+
+Drives the same :class:`asynchronous.AsyncController` as the window
+does, but synchronously and without a window or running Qt event loop,
+see :meth:`control.Controller.iter_results`. Results are streamed as
+JSON lines, one per processed pair, and the exit status reflects whether
+anything failed. This is intended for batch validation,
+such as on a render farm.
+
+Anything else printed whilst running, such as messages of the
+controller or of plug-ins, goes to standard error, such that standard
+output holds nothing but results.
+
+    $ python -m pyblish_lite --headless --validate > results.jsonl
+
+"""
+from __future__ import print_function
+
+import sys
+import json
+import time
+import contextlib
+
+from . import asynchronous, util
+
+# Exit statuses
+SUCCESS = 0
+FAILED = 1
+
+
+class ResultWriter(object):
+    """Write each result as a line of JSON to `stream`"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+        self.failed = 0
+
+    def write(self, result):
+        data = util.serialize_result(result)
+        self.stream.write(json.dumps(data, default=str) + "\n")
+        self.stream.flush()
+
+        self.count += 1
+        if not data["success"]:
+            self.failed += 1
+
+
+def run(stage="publish", stream=None, resume=False):
+    """Collect and process plug-ins up to `stage`
+
+    Arguments:
+        stage (str): Either "collect", "validate" or "publish"
+        stream (file, optional): Where to write results, defaults
+            to standard output.
+        resume (bool, optional): Continue from the last checkpoint,
+            if any, rather than collecting, see `checkpoint`
+
+    Returns:
+        int: Exit status; 0 on success, 1 if any plug-in failed
+
+    """
+
+    writer = ResultWriter(stream or sys.stdout)
+
+    with contextlib.redirect_stdout(sys.stderr):
+        ctrl = asynchronous.AsyncController()
+        ctrl.frame_budget = 0
+
+        start = time.time()
+        for result in ctrl.iter_results(stage, resume):
+            writer.write(result)
+
+        sys.stderr.write("%s: %d pairs processed, %d failed in %.2fs\n" % (
+            stage, writer.count, writer.failed, time.time() - start
+        ))
+
+        ctrl.cleanup()
+
+    return FAILED if ctrl.errored else SUCCESS
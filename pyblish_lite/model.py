@@ -25,14 +25,16 @@ Roles:
 """
 from __future__ import unicode_literals
 
+import array
+import collections
+
 import pyblish
 
-from . import settings, util
+from . import compatibility, records, settings, util
 from .awesome import tags as awesome
 from .vendor import Qt
 from .vendor.Qt import QtCore, QtGui
 from .vendor.six import text_type
-from .vendor.six.moves import queue
 from .vendor import qtawesome
 from .constants import PluginStates, InstanceStates, GroupStates, Roles
 
@@ -152,6 +154,7 @@ class PluginItem(QtGui.QStandardItem):
         self.setData(False, Roles.IsEnabledRole)
         self.setData(0, Roles.PublishFlagsRole)
         self.setData(0, Roles.PluginActionProgressRole)
+        self.setData(0.0, Roles.DurationRole)
         icon_name = ""
         if hasattr(plugin, "icon") and plugin.icon:
             icon_name = plugin.icon
@@ -387,10 +390,44 @@ class PluginItem(QtGui.QStandardItem):
         return super(PluginItem, self).setData(value, role)
 
 
+def update_group_states(group_items, warning_state, error_state):
+    """Set warning and error states of groups from those of their children
+
+    Groups only ever gain these states whilst processing, this is
+    for when the states of children are reset.
+    """
+
+    for group_item in group_items:
+        states = {
+            GroupStates.HasWarning: False,
+            GroupStates.HasError: False
+        }
+        for row in range(group_item.rowCount()):
+            child_states = group_item.child(row).data(Roles.PublishFlagsRole)
+            if child_states & warning_state:
+                states[GroupStates.HasWarning] = True
+            if child_states & error_state:
+                states[GroupStates.HasError] = True
+
+        group_item.setData(states, Roles.PublishFlagsRole)
+
+
+def update_group_duration(group_item):
+    """Set duration of `group_item` to the total of its children"""
+    group_item.setData(
+        sum(
+            group_item.child(row).data(Roles.DurationRole) or 0.0
+            for row in range(group_item.rowCount())
+        ),
+        Roles.DurationRole
+    )
+
+
 class GroupItem(QtGui.QStandardItem):
     def __init__(self, *args, **kwargs):
         self.order = kwargs.pop("order", None)
         self.publish_states = 0
+        self.duration = 0.0
         super(GroupItem, self).__init__(*args, **kwargs)
 
     def flags(self):
@@ -400,6 +437,9 @@ class GroupItem(QtGui.QStandardItem):
         if role == Roles.PublishFlagsRole:
             return self.publish_states
 
+        if role == Roles.DurationRole:
+            return self.duration
+
         if role == Roles.TypeRole:
             return self.type()
 
@@ -425,6 +465,11 @@ class GroupItem(QtGui.QStandardItem):
             self.emitDataChanged()
             return True
 
+        if role == Roles.DurationRole:
+            self.duration = value
+            self.emitDataChanged()
+            return True
+
         return super(GroupItem, self).setData(value, role)
 
     def type(self):
@@ -439,10 +484,12 @@ class PluginModel(QtGui.QStandardItemModel):
         self.checkstates = {}
         self.group_items = {}
         self.plugin_items = {}
+        self.compatibility = None
 
     def reset(self):
         self.group_items = {}
         self.plugin_items = {}
+        self.compatibility = None
         self.clear()
 
     def append(self, plugin):
@@ -493,6 +540,42 @@ class PluginModel(QtGui.QStandardItemModel):
             if state is not None:
                 plugin_item.setData(state, QtCore.Qt.CheckStateRole)
 
+    def reset_items(self, plugins):
+        """Clear states and records of items of `plugins`"""
+        for plugin in plugins:
+            item = self.plugin_items.get(plugin.id)
+            if item is None:
+                continue
+
+            item.setData({
+                PluginStates.InProgress: False,
+                PluginStates.WasProcessed: False,
+                PluginStates.HasWarning: False,
+                PluginStates.HasError: False,
+                PluginStates.WasCached: False
+            }, Roles.PublishFlagsRole)
+            item.setData([], Roles.LogRecordsRole)
+            item.setData(0.0, Roles.DurationRole)
+
+        update_group_states(
+            self.group_items.values(),
+            PluginStates.HasWarning,
+            PluginStates.HasError
+        )
+        for group_item in self.group_items.values():
+            update_group_duration(group_item)
+
+    def group_durations(self):
+        """Return label and total duration of groups processed so far"""
+        group_items = sorted(
+            self.group_items.values(), key=lambda item: item.order
+        )
+        return [
+            (item.data(QtCore.Qt.DisplayRole), item.data(Roles.DurationRole))
+            for item in group_items
+            if item.data(Roles.DurationRole)
+        ]
+
     def update_with_result(self, result):
         plugin = result["plugin"]
         item = self.plugin_items[plugin.id]
@@ -504,6 +587,13 @@ class PluginModel(QtGui.QStandardItemModel):
 
         publish_states = item.data(Roles.PublishFlagsRole)
 
+        # Cached only while every result of the plug-in was replayed
+        cached = bool(result.get("cached"))
+        if not publish_states & PluginStates.WasProcessed:
+            new_flag_states[PluginStates.WasCached] = cached
+        elif not cached:
+            new_flag_states[PluginStates.WasCached] = False
+
         has_warning = publish_states & PluginStates.HasWarning
         new_records = result.get("records") or []
         traceback = result.get("traceback") or []
@@ -524,55 +614,85 @@ class PluginModel(QtGui.QStandardItemModel):
 
         item.setData(new_flag_states, Roles.PublishFlagsRole)
 
-        records = item.data(Roles.LogRecordsRole) or []
-        records.extend(new_records)
+        # Slices of the records of the terminal, rather than copies
+        item_records = (
+            item.data(Roles.LogRecordsRole) or records.RecordChain()
+        )
+        item_records.extend(new_records)
 
-        item.setData(records, Roles.LogRecordsRole)
+        item.setData(item_records, Roles.LogRecordsRole)
         item.setData(traceback, Roles.TracebackModuleRole)
 
+        # Replayed results took no time to speak of
+        if not cached and result.get("wall_time") is not None:
+            item.setData(
+                item.data(Roles.DurationRole) + result["wall_time"],
+                Roles.DurationRole
+            )
+            update_group_duration(item.parent())
+
         return item
 
     def update_compatibility(self):
-        context = self.controller.context
+        """Flag plug-ins compatible with active instances
 
-        families = util.collect_families_from_instances(context, True)
-        for plugin_item in self.plugin_items.values():
-            publish_states = plugin_item.data(Roles.PublishFlagsRole)
-            if (
-                publish_states & PluginStates.WasProcessed
-                or publish_states & PluginStates.WasSkipped
-            ):
-                continue
+        Only plug-ins whose compatibility changed, see `compatibility`,
+        are flagged anew, and the view told once for each group.
+        """
 
-            is_compatible = False
-            # A plugin should always show if it has processed.
-            if plugin_item.plugin.__instanceEnabled__:
-                compatible_instances = pyblish.logic.instances_by_plugin(
-                    context, plugin_item.plugin
-                )
-                for instance in context:
-                    if not instance.data.get("publish"):
-                        continue
+        family_index = self.controller.family_index
+        if family_index is None:
+            return
 
-                    if instance in compatible_instances:
-                        is_compatible = True
-                        break
-            else:
-                plugins = pyblish.logic.plugins_by_families(
-                    [plugin_item.plugin], families
+        if (
+            self.compatibility is None
+            or self.compatibility.family_index is not family_index
+        ):
+            self.compatibility = compatibility.CompatibilityMap(family_index)
+
+        changes = self.compatibility.update(
+            [item.plugin for item in self.plugin_items.values()]
+        )
+        if not changes:
+            return
+
+        changed_rows = collections.defaultdict(list)
+        blocked = self.blockSignals(True)
+        try:
+            for plugin, is_compatible in changes.items():
+                plugin_item = self.plugin_items.get(plugin._id)
+                if plugin_item is None:
+                    continue
+
+                # A plugin should always show if it has processed.
+                publish_states = plugin_item.data(Roles.PublishFlagsRole)
+                if (
+                    publish_states & PluginStates.WasProcessed
+                    or publish_states & PluginStates.WasSkipped
+                ):
+                    continue
+
+                current_is_compatible = bool(
+                    publish_states & PluginStates.IsCompatible
                 )
-                if plugins:
-                    is_compatible = True
+                if is_compatible == current_is_compatible:
+                    continue
 
-            current_is_compatible = publish_states & PluginStates.IsCompatible
-            if (
-                (is_compatible and not current_is_compatible)
-                or (not is_compatible and current_is_compatible)
-            ):
-                new_flag = {
-                    PluginStates.IsCompatible: is_compatible
-                }
-                plugin_item.setData(new_flag, Roles.PublishFlagsRole)
+                plugin_item.setData(
+                    {PluginStates.IsCompatible: is_compatible},
+                    Roles.PublishFlagsRole
+                )
+                changed_rows[plugin_item.parent()].append(plugin_item.row())
+        finally:
+            self.blockSignals(blocked)
+
+        for group_item, rows in changed_rows.items():
+            parent = group_item.index()
+            self.dataChanged.emit(
+                self.index(min(rows), 0, parent),
+                self.index(max(rows), 0, parent),
+                [Roles.PublishFlagsRole]
+            )
 
 
 class PluginFilterProxy(QtCore.QSortFilterProxyModel):
@@ -787,6 +907,26 @@ class InstanceModel(QtGui.QStandardItemModel):
             if state is not None:
                 instance_item.setData(state, QtCore.Qt.CheckStateRole)
 
+    def reset_items(self, instance_ids):
+        """Clear states and records of items of `instance_ids`"""
+        for instance_id in instance_ids:
+            item = self.instance_items.get(instance_id)
+            if item is None:
+                continue
+
+            item.setData({
+                InstanceStates.InProgress: False,
+                InstanceStates.HasWarning: False,
+                InstanceStates.HasError: False
+            }, Roles.PublishFlagsRole)
+            item.setData([], Roles.LogRecordsRole)
+
+        update_group_states(
+            self.group_items.values(),
+            InstanceStates.HasWarning,
+            InstanceStates.HasError
+        )
+
     def update_with_result(self, result):
         instance = result["instance"]
         if instance is None:
@@ -821,10 +961,13 @@ class InstanceModel(QtGui.QStandardItemModel):
 
         item.setData(new_flag_states, Roles.PublishFlagsRole)
 
-        records = item.data(Roles.LogRecordsRole) or []
-        records.extend(new_records)
+        # Slices of the records of the terminal, rather than copies
+        item_records = (
+            item.data(Roles.LogRecordsRole) or records.RecordChain()
+        )
+        item_records.extend(new_records)
 
-        item.setData(records, Roles.LogRecordsRole)
+        item.setData(item_records, Roles.LogRecordsRole)
 
         return item
 
@@ -870,110 +1013,103 @@ class InstanceModel(QtGui.QStandardItemModel):
 
 
 class ArtistProxy(QtCore.QAbstractProxyModel):
+    """Instances of every group of the instance model, as one list
+
+    Rows are numbered by the rows of groups before their own, summed
+    by `util.RowCounts`, rather than mapped one by one. Rows inserted or
+    removed are passed on as one range.
+
+    """
+
     def __init__(self, *args, **kwargs):
-        self.mapping_from = []
-        self.mapping_to = []
+        self.row_counts = util.RowCounts()
+
+        # Whether rows about to be removed are being removed
+        self._removing = False
+
         super(ArtistProxy, self).__init__(*args, **kwargs)
 
     def on_rows_inserted(self, parent_index, from_row, to_row):
-        if not parent_index.isValid():
+        if parent_index.parent().isValid():
             return
 
-        parent_row = parent_index.row()
-        if parent_row >= len(self.mapping_from):
-            self.mapping_from.append(list())
-
-        new_from = None
-        new_to = None
-        for row_num in range(from_row, to_row + 1):
-            new_row = len(self.mapping_to)
-            new_to = new_row
-            if new_from is None:
-                new_from = new_row
-
-            self.mapping_from[parent_row].insert(row_num, new_row)
-            self.mapping_to.insert(new_row, [parent_row, row_num])
-
-        self.rowsInserted.emit(self.parent(), new_from, new_to + 1)
-
-    def _remove_rows(self, parent_row, from_row, to_row):
-        removed_rows = []
-        increment_num = self.mapping_from[parent_row][from_row]
-        _emit_last = None
-        for row_num in reversed(range(from_row, to_row + 1)):
-            row = self.mapping_from[parent_row].pop(row_num)
-            _emit_last = row
-            removed_rows.append(row)
-
-        _emit_first = int(increment_num)
-        mapping_from_len = len(self.mapping_from)
-        mapping_from_parent_len = len(self.mapping_from[parent_row])
-        if parent_row < mapping_from_len:
-            for idx in range(from_row, mapping_from_parent_len):
-                self.mapping_from[parent_row][idx] = increment_num
-                increment_num += 1
-
-        if parent_row < mapping_from_len - 1:
-            for idx_i in range(parent_row + 1, mapping_from_len):
-                sub_values = self.mapping_from[idx_i]
-                if not sub_values:
-                    continue
+        if parent_index.isValid():
+            group = parent_index.row()
+            counts = None
+            rows = to_row - from_row + 1
+            first = self.row_counts.prefix(group) + from_row
+        else:
+            # Groups, along with rows they may have already
+            group = from_row
+            source_model = self.sourceModel()
+            counts = [
+                source_model.rowCount(source_model.index(row, 0))
+                for row in range(from_row, to_row + 1)
+            ]
+            rows = sum(counts)
+            first = self.row_counts.prefix(group)
+
+        if rows:
+            self.beginInsertRows(
+                QtCore.QModelIndex(), first, first + rows - 1
+            )
+
+        if counts is None:
+            self.row_counts.add(group, rows)
+        else:
+            self.row_counts.insert(group, counts)
 
-                for idx_j in range(0, len(sub_values)):
-                    self.mapping_from[idx_i][idx_j] = increment_num
-                    increment_num += 1
+        if rows:
+            self.endInsertRows()
 
-        first_to_row = None
-        for row in removed_rows:
-            if first_to_row is None:
-                first_to_row = row
-            self.mapping_to.pop(row)
+    def on_rows_about_to_be_removed(self, parent_index, from_row, to_row):
+        self._removing = False
+        if parent_index.parent().isValid():
+            return
+
+        if parent_index.isValid():
+            first = self.row_counts.prefix(parent_index.row()) + from_row
+            last = first + to_row - from_row
+        else:
+            first = self.row_counts.prefix(from_row)
+            last = self.row_counts.prefix(to_row + 1) - 1
 
-        return (_emit_first, _emit_last)
+        if last >= first:
+            self._removing = True
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
 
     def on_rows_removed(self, parent_index, from_row, to_row):
-        if parent_index.isValid():
-            parent_row = parent_index.row()
-            _emit_first, _emit_last = self._remove_rows(
-                parent_row, from_row, to_row
-            )
-            self.rowsRemoved.emit(self.parent(), _emit_first, _emit_last)
+        if parent_index.parent().isValid():
+            return
 
+        if parent_index.isValid():
+            self.row_counts.add(parent_index.row(), from_row - to_row - 1)
         else:
-            removed_rows = False
-            emit_first = None
-            emit_last = None
-            for row_num in reversed(range(from_row, to_row + 1)):
-                remaining_rows = self.mapping_from[row_num]
-                if remaining_rows:
-                    removed_rows = True
-                    _emit_first, _emit_last = self._remove_rows(
-                        row_num, 0, len(remaining_rows) - 1
-                    )
-                    if emit_first is None:
-                        emit_first = _emit_first
-                    emit_last = _emit_last
+            self.row_counts.remove(from_row, to_row)
 
-                self.mapping_from.pop(row_num)
+        if self._removing:
+            self._removing = False
+            self.endRemoveRows()
 
-            diff = to_row - from_row + 1
-            mapping_to_len = len(self.mapping_to)
-            if from_row < mapping_to_len:
-                for idx in range(from_row, mapping_to_len):
-                    self.mapping_to[idx][0] -= diff
-
-            if removed_rows:
-                self.rowsRemoved.emit(self.parent(), emit_first, emit_last)
+    def on_about_to_reset(self):
+        self.beginResetModel()
 
     def on_reset(self):
-        self.modelReset.emit()
-        self.mapping_from = []
-        self.mapping_to = []
+        source_model = self.sourceModel()
+        self.row_counts.build(
+            source_model.rowCount(source_model.index(row, 0))
+            for row in range(source_model.rowCount())
+        )
+        self.endResetModel()
 
     def setSourceModel(self, source_model):
         super(ArtistProxy, self).setSourceModel(source_model)
         source_model.rowsInserted.connect(self.on_rows_inserted)
+        source_model.rowsAboutToBeRemoved.connect(
+            self.on_rows_about_to_be_removed
+        )
         source_model.rowsRemoved.connect(self.on_rows_removed)
+        source_model.modelAboutToBeReset.connect(self.on_about_to_reset)
         source_model.modelReset.connect(self.on_reset)
         source_model.dataChanged.connect(self.on_data_changed)
 
@@ -996,7 +1132,7 @@ class ArtistProxy(QtCore.QAbstractProxyModel):
     def rowCount(self, parent=QtCore.QModelIndex()):
         if parent.isValid():
             return 0
-        return len(self.mapping_to)
+        return self.row_counts.total()
 
     def mapFromSource(self, index):
         if not index.isValid():
@@ -1006,15 +1142,14 @@ class ArtistProxy(QtCore.QAbstractProxyModel):
         if not parent_index.isValid():
             return QtCore.QModelIndex()
 
-        parent_idx = self.mapping_from[parent_index.row()]
-        my_row = parent_idx[index.row()]
-        return self.index(my_row, index.column())
+        row = self.row_counts.prefix(parent_index.row()) + index.row()
+        return self.index(row, index.column())
 
     def mapToSource(self, index):
-        if not index.isValid() or index.row() > len(self.mapping_to):
+        if not index.isValid() or index.row() >= self.rowCount():
             return self.sourceModel().index(index.row(), index.column())
 
-        parent_row, item_row = self.mapping_to[index.row()]
+        parent_row, item_row = self.row_counts.find(index.row())
         parent_index = self.sourceModel().index(parent_row, 0)
         return self.sourceModel().index(item_row, 0, parent_index)
 
@@ -1025,7 +1160,16 @@ class ArtistProxy(QtCore.QAbstractProxyModel):
         return QtCore.QModelIndex()
 
 
-class TerminalModel(QtGui.QStandardItemModel):
+class TerminalModel(QtCore.QAbstractItemModel):
+    """Records of the terminal, each with its detail as only child
+
+    Records are kept in a `records.RecordStore`, and items are made of
+    them as they are asked for; such as when painted, with records out
+    of memory read back from disk. The type of each record is kept
+    aside for filtering, see `TerminalProxy`.
+
+    """
+
     key_label_record_map = (
         ("instance", "Instance"),
         ("msg", "Message"),
@@ -1064,15 +1208,124 @@ class TerminalModel(QtGui.QStandardItemModel):
 
     )
 
+    # Titles of fields of details, as HTML
+    detail_title_tags = tuple(
+        (key, '<span style=" font-size:8pt; font-weight:600;'
+              ' color:#fff;" >{}:</span> '.format(title))
+        for key, title in key_label_record_map
+    )
+
+    # Characters of values escaped in details, in a single pass
+    detail_escapes = {
+        ord("&"): "&#38;",
+        ord("<"): "&#60;",
+        ord(">"): "&#62;",
+        ord("\n"): "<br/>",
+        ord(" "): "&nbsp;",
+    }
+
+    # Types of items, by the code kept of each record
+    item_types = (
+        None,
+        "info",
+        "error",
+        "log_debug",
+        "log_info",
+        "log_warning",
+        "log_error",
+        "log_critical",
+    )
+
     def __init__(self, *args, **kwargs):
         super(TerminalModel, self).__init__(*args, **kwargs)
-        self.reset()
+        self.records = records.RecordStore()
+        self._types = array.array("B")
+
+        # Told apart from records of former resets, see `data`
+        self._generation = 0
 
     def reset(self):
-        self.items_to_set_widget = queue.Queue()
-        self.clear()
+        self.beginResetModel()
+
+        # Slices of former records, such as those of items of other
+        # models, keep the store they are of
+        self.records = records.RecordStore()
+        self._types = array.array("B")
+        self._generation += 1
+
+        self.endResetModel()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        # Details are told apart by the row of their record, plus one
+        if parent.isValid():
+            return self.createIndex(row, column, parent.row() + 1)
+        return self.createIndex(row, column, 0)
+
+    def parent(self, index=None):
+        if index is None or not index.isValid() or not index.internalId():
+            return QtCore.QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self.records)
+
+        if not parent.internalId():
+            return 1
+
+        return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        is_detail = bool(index.internalId())
+        row = index.internalId() - 1 if is_detail else index.row()
+
+        if role == Roles.TypeRole:
+            return TerminalDetailType if is_detail else TerminalLabelType
+
+        if role == Roles.TerminalRecordIdRole:
+            return (self._generation, row)
+
+        terminal_item_type = self.item_types[self._types[row]]
+        if role == Roles.TerminalItemTypeRole:
+            return terminal_item_type
+
+        if is_detail:
+            if role == QtCore.Qt.DisplayRole:
+                return self.prepare_detail_text(self.records[row])
+            return None
+
+        if role == QtCore.Qt.DisplayRole:
+            return self.records[row]["label"].split("\n")[0]
+
+        if role == QtCore.Qt.DecorationRole:
+            record_type = terminal_item_type
+            if record_type not in ("info", "error"):
+                record_type = "record"
+
+            icon_color = self.item_icon_colors.get(terminal_item_type)
+            icon_name = self.item_icon_name.get(record_type)
+            if icon_color and icon_name:
+                return QAwesomeIconFactory.icon(icon_name, icon_color)
+
+        return None
 
     def prepare_records(self, result):
+        """Add records and error of `result`, returning those added
+
+        Returns:
+            records.RecordSlice: Records added, as dictionaries
+
+        """
+
         prepared_records = []
         instance_name = None
         instance = result["instance"]
@@ -1080,23 +1333,7 @@ class TerminalModel(QtGui.QStandardItemModel):
             instance_name = instance.data["name"]
 
         for record in result.get("records") or []:
-            if isinstance(record, dict):
-                record_item = record
-            else:
-                record_item = {
-                    "label": text_type(record.msg),
-                    "type": "record",
-                    "levelno": record.levelno,
-                    "threadName": record.threadName,
-                    "name": record.name,
-                    "filename": record.filename,
-                    "pathname": record.pathname,
-                    "lineno": record.lineno,
-                    "msg": text_type(record.msg),
-                    "msecs": record.msecs,
-                    "levelname": record.levelname
-                }
-
+            record_item = util.record_to_dict(record)
             if instance_name is not None:
                 record_item["instance"] = instance_name
 
@@ -1104,100 +1341,115 @@ class TerminalModel(QtGui.QStandardItemModel):
 
         error = result.get("error")
         if error:
-            fname, line_no, func, exc = error.traceback
-            error_item = {
-                "label": str(error),
-                "type": "error",
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": error.formatted_traceback,
-            }
-
+            error_item = util.error_to_dict(error)
             if instance_name is not None:
                 error_item["instance"] = instance_name
 
             prepared_records.append(error_item)
 
-        return prepared_records
+        return self.add(prepared_records)
 
     def append(self, record_item):
-        record_type = record_item["type"]
+        self.add([record_item])
 
-        terminal_item_type = None
-        if record_type == "record":
-            for level, _type in self.level_to_record:
-                if level > record_item["levelno"]:
-                    break
-                terminal_item_type = _type
+    def add(self, record_items):
+        """Add `record_items`, returning the slice of records they are in
 
-        else:
-            terminal_item_type = record_type
+        Arguments:
+            record_items (list): Records, see `util.record_to_dict`
 
-        icon_color = self.item_icon_colors.get(terminal_item_type)
-        icon_name = self.item_icon_name.get(record_type)
+        """
 
-        top_item_icon = None
-        if icon_color and icon_name:
-            top_item_icon = QAwesomeIconFactory.icon(icon_name, icon_color)
+        record_items = list(record_items)
+        start = len(self.records)
+        if not record_items:
+            return records.RecordSlice(self.records, start, start)
 
-        label = record_item["label"].split("\n")[0]
+        self.beginInsertRows(
+            QtCore.QModelIndex(), start, start + len(record_items) - 1
+        )
 
-        top_item = QtGui.QStandardItem()
-        top_item.setData(TerminalLabelType, Roles.TypeRole)
-        top_item.setData(terminal_item_type, Roles.TerminalItemTypeRole)
-        top_item.setData(label, QtCore.Qt.DisplayRole)
-        top_item.setFlags(
-            QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
+        added = self.records.extend(record_items)
+        self._types.extend(
+            self.item_types.index(self.item_type(record_item))
+            for record_item in record_items
         )
 
-        if top_item_icon:
-            top_item.setData(top_item_icon, QtCore.Qt.DecorationRole)
+        self.endInsertRows()
+        return added
 
-        self.appendRow(top_item)
+    def item_type(self, record_item):
+        """Return type of item of `record_item`, see `TerminalProxy`"""
+        record_type = record_item["type"]
+        if record_type != "record":
+            return record_type
 
-        detail_text = self.prepare_detail_text(record_item)
-        detail_item = QtGui.QStandardItem(detail_text)
-        detail_item.setData(TerminalDetailType, Roles.TypeRole)
-        top_item.appendRow(detail_item)
-        self.items_to_set_widget.put(detail_item)
+        terminal_item_type = None
+        for level, _type in self.level_to_record:
+            if level > record_item["levelno"]:
+                break
+            terminal_item_type = _type
+
+        return terminal_item_type
 
     def update_with_result(self, result):
-        for record in result["records"]:
-            self.append(record)
+        # Records of `prepare_records` are added already
+        new_records = result["records"]
+        if not (
+            isinstance(new_records, records.RecordSlice)
+            and new_records.store is self.records
+        ):
+            self.add(new_records)
+
+        if result.get("wall_time") is None:
+            return
+
+        label = result["plugin"].__name__
+        if settings.UseLabel and getattr(result["plugin"], "label", None):
+            label = result["plugin"].label
+
+        if result["instance"] is not None:
+            label = "{} ({})".format(label, result["instance"].data["name"])
+
+        timings = [util.format_duration(result["wall_time"])]
+        if result.get("cpu_time") is not None:
+            timings.append("CPU " + util.format_duration(result["cpu_time"]))
+        if result.get("memory") is not None:
+            timings.append("+" + util.format_size(result["memory"]))
+
+        if result.get("cached"):
+            timings.append("cached")
+
+        self.append({
+            "label": "{}: {}".format(label, ", ".join(timings)),
+            "type": "info"
+        })
 
     def prepare_detail_text(self, item_data):
+        """Return detail of `item_data` as HTML, see `TerminalItem`
+
+        Made as details are drawn, rather than as records are added.
+        """
+
         if item_data["type"] == "info":
             return item_data["label"]
 
-        html_text = ""
-        for key, title in self.key_label_record_map:
+        rows = []
+        for key, title_tag in self.detail_title_tags:
             if key not in item_data:
                 continue
-            value = item_data[key]
-            text = (
-                str(value)
-                .replace("<", "&#60;")
-                .replace(">", "&#62;")
-                .replace('\n', '<br/>')
-                .replace(' ', '&nbsp;')
-            )
-
-            title_tag = (
-                '<span style=\" font-size:8pt; font-weight:600;'
-                # ' background-color:#bbb; color:#333;\" >{}:</span> '
-                ' color:#fff;\" >{}:</span> '
-            ).format(title)
 
-            html_text += (
+            rows.append(
                 '<tr><td width="100%" align=left>{}</td></tr>'
-                '<tr><td width="100%">{}</td></tr>'
-            ).format(title_tag, text)
+                '<tr><td width="100%">{}</td></tr>'.format(
+                    title_tag,
+                    text_type(item_data[key]).translate(self.detail_escapes)
+                )
+            )
 
-        html_text = '<table width="100%" cellspacing="3">{}</table>'.format(
-            html_text
+        return '<table width="100%" cellspacing="3">{}</table>'.format(
+            "".join(rows)
         )
-        return html_text
 
 
 class TerminalProxy(QtCore.QSortFilterProxyModel):
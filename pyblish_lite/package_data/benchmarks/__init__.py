@@ -0,0 +1,15 @@
+"""Benchmarks of the controller, models and views at scale
+
+Run from the root of this repository, results are printed as JSON.
+
+    $ python -m pyblish_lite.package_data.benchmarks \
+        --plugins 200 --instances 500 --families 10 --records 5 \
+        --output results.json
+
+Pass a previous output to compare with, e.g. of another commit.
+
+    $ python -m pyblish_lite.package_data.benchmarks --compare results.json
+
+See `workload` for what is generated, and `__main__` for what is timed.
+
+"""
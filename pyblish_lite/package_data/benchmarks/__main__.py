@@ -0,0 +1,248 @@
+"""Time phases of processing a generated workload
+
+Phases are timed from a fresh controller each run, the fastest and
+median of `--repeat` runs are reported.
+
+- reset, validate, publish: Of `control.Controller`, synchronously
+- models: Populating models of the window with the plug-ins, instances
+  and results of a publish, as the window does
+- window: Resetting, validating and publishing through the window
+- paint: Painting the window offscreen, once on the overview and once
+  on the terminal
+
+Phases of the window are skipped with `--headless`.
+
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+
+# Process synchronously, and paint without a display
+os.environ.setdefault("PYBLISH_DELAY", "0")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pyblish.api
+
+from pyblish_lite import control
+from pyblish_lite.version import version
+from pyblish_lite.package_data.benchmarks import workload
+
+phases = ("reset", "validate", "publish", "models", "window", "paint")
+
+
+def commit():
+    """Return commit of this repository, or None"""
+    try:
+        output = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.STDOUT
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode("utf-8").strip()
+
+
+def register(options):
+    pyblish.api.deregister_all_plugins()
+    pyblish.api.deregister_all_paths()
+
+    for plugin in workload.generate(
+        plugins=options.plugins,
+        instances=options.instances,
+        families=options.families,
+        records=options.records,
+        failure_ratio=options.failure_ratio,
+        seed=options.seed,
+    ):
+        pyblish.api.register_plugin(plugin)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def controller():
+    ctrl = control.Controller()
+    ctrl.frame_budget = 0
+    return ctrl
+
+
+def run_controller(timings, counts):
+    ctrl = controller()
+    results = []
+    ctrl.was_processed.connect(results.append)
+
+    timings["reset"].append(timed(ctrl.reset))
+    timings["validate"].append(timed(ctrl.validate))
+    timings["publish"].append(timed(ctrl.publish))
+
+    counts["instances"] = len(ctrl.context)
+    counts["pairs"] = len(results)
+    counts["failed"] = sum(1 for result in results if not result["success"])
+    counts["records"] = sum(len(result["records"]) for result in results)
+
+    ctrl.cleanup()
+
+
+def run_models(timings):
+    from pyblish_lite import model
+
+    ctrl = controller()
+    results = []
+    ctrl.was_processed.connect(results.append)
+    ctrl.reset()
+    ctrl.validate()
+    ctrl.publish()
+
+    def populate():
+        plugin_model = model.PluginModel(ctrl)
+        instance_model = model.InstanceModel(ctrl)
+        terminal_model = model.TerminalModel()
+
+        for plugin in ctrl.plugins:
+            plugin_model.append(plugin)
+
+        instance_model.append(ctrl.context)
+        for instance in ctrl.context:
+            instance_model.append(instance)
+
+        for result in results:
+            result = dict(result)
+            result["records"] = terminal_model.prepare_records(result)
+            plugin_model.update_with_result(result)
+            instance_model.update_with_result(result)
+            terminal_model.update_with_result(result)
+
+        plugin_model.update_compatibility()
+
+    timings["models"].append(timed(populate))
+    ctrl.cleanup()
+
+
+def run_window(timings):
+    from pyblish_lite import window
+
+    ctrl = controller()
+    win = window.Window(ctrl)
+    win.resize(1000, 800)
+    win.show()
+
+    def process():
+        win.reset()
+        win.validate()
+        win.publish()
+
+    def paint():
+        win.on_tab_changed("overview")
+        win.grab()
+        win.on_tab_changed("terminal")
+        win.grab()
+
+    timings["window"].append(timed(process))
+    timings["paint"].append(timed(paint))
+
+    win.close()
+    win.deleteLater()
+    ctrl.cleanup()
+
+
+def summary(runs):
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "runs": runs,
+    }
+
+
+def compare(baseline, current):
+    """Return ratio of median of each phase to that of `baseline`"""
+    ratios = {}
+    for phase, timing in current["timings"].items():
+        before = baseline.get("timings", {}).get(phase)
+        if before and before["median"]:
+            ratios[phase] = timing["median"] / before["median"]
+    return ratios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pyblish_lite.package_data.benchmarks",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--plugins", type=int, default=100)
+    parser.add_argument("--instances", type=int, default=100)
+    parser.add_argument("--families", type=int, default=5)
+    parser.add_argument("--records", type=int, default=1,
+                        help="Records logged per pair")
+    parser.add_argument("--failure-ratio", type=float, default=0.0,
+                        help="Ratio of pairs of validators failing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--headless", action="store_true",
+                        help="Skip models, window and painting")
+    parser.add_argument("--output", help="Write results to this file")
+    parser.add_argument("--compare", metavar="RESULTS",
+                        help="Compare with previous results")
+
+    options = parser.parse_args(argv)
+
+    register(options)
+
+    if not options.headless:
+        from pyblish_lite.vendor.Qt import QtWidgets
+        app = QtWidgets.QApplication.instance()
+        app = app or QtWidgets.QApplication(sys.argv)
+
+    timings = dict((phase, []) for phase in phases)
+    counts = {}
+    for _ in range(options.repeat):
+        run_controller(timings, counts)
+        if not options.headless:
+            run_models(timings)
+            run_window(timings)
+
+    output = {
+        "version": version,
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "workload": {
+            "plugins": options.plugins,
+            "instances": options.instances,
+            "families": options.families,
+            "records": options.records,
+            "failure_ratio": options.failure_ratio,
+            "seed": options.seed,
+        },
+        "counts": counts,
+        "timings": dict(
+            (phase, summary(runs))
+            for phase, runs in timings.items()
+            if runs
+        ),
+    }
+
+    if options.compare:
+        with open(options.compare) as f:
+            output["compared"] = compare(json.load(f), output)
+
+    text = json.dumps(output, indent=4, sort_keys=True)
+    if options.output:
+        with open(options.output, "w") as f:
+            f.write(text)
+
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
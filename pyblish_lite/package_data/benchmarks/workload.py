@@ -0,0 +1,121 @@
+"""Generate plug-ins of a workload of given size
+
+    plugins = workload.generate(plugins=200, instances=500, families=10)
+    for plugin in plugins:
+        pyblish.api.register_plugin(plugin)
+
+One collector creates every instance, the remaining plug-ins are spread
+evenly across collection, validation, extraction and integration, with
+orders spread within each. Instance plug-ins are given a family each,
+some are given every family. Pairs log a number of records, and pairs
+of validators fail by a given ratio. Which ones fail is decided by their
+names, such that the same workload fails the same way every time.
+
+Note that validators failing stop publishing, as they would in the
+window, hence extraction and integration only run without failures.
+
+"""
+import zlib
+import random
+
+import pyblish.api
+import pyblish.lib
+
+# Orders plug-ins are spread across, after the first collector
+groups = (
+    ("Collect", pyblish.api.CollectorOrder),
+    ("Validate", pyblish.api.ValidatorOrder),
+    ("Extract", pyblish.api.ExtractorOrder),
+    ("Integrate", pyblish.api.IntegratorOrder),
+)
+
+# Distinct orders within each group
+spread = 5
+
+
+def fails(ratio, *names):
+    """Return whether the pair of `names` fails, given `ratio`"""
+    if ratio <= 0:
+        return False
+    digest = zlib.crc32("/".join(names).encode("utf-8")) % 1000
+    return digest < ratio * 1000
+
+
+class BenchmarkCollector(pyblish.api.ContextPlugin):
+    """Create instances of the workload"""
+
+    order = pyblish.api.CollectorOrder - 0.49
+    instance_count = 0
+    family_names = ()
+
+    def process(self, context):
+        for index in range(self.instance_count):
+            family = self.family_names[index % len(self.family_names)]
+            instance = context.create_instance("instance%05d" % index)
+            instance.data["family"] = family
+            instance.data["families"] = [family]
+
+
+class BenchmarkPlugin(pyblish.api.InstancePlugin):
+    """Log records, and fail by ratio when validating"""
+
+    records = 0
+    failure_ratio = 0.0
+
+    def process(self, instance):
+        for index in range(self.records):
+            self.log.info("Record %d of %s", index, instance)
+
+        is_validator = pyblish.lib.inrange(
+            self.order, pyblish.api.ValidatorOrder
+        )
+        if is_validator and fails(
+            self.failure_ratio, type(self).__name__, instance.name
+        ):
+            raise ValueError("%s is invalid" % instance)
+
+
+def generate(plugins=100, instances=100, families=5, records=1,
+             failure_ratio=0.0, seed=0):
+    """Return plug-ins of a workload
+
+    Arguments:
+        plugins (int): Number of plug-ins, including the collector
+        instances (int): Number of instances collected
+        families (int): Number of families of instances
+        records (int): Records logged per pair
+        failure_ratio (float): Ratio of pairs of validators failing
+        seed (int): Seed of families given to plug-ins
+
+    """
+
+    rng = random.Random(seed)
+    names = ["family%02d" % index for index in range(max(1, families))]
+
+    result = [type("CollectBenchmark", (BenchmarkCollector,), {
+        "__module__": __name__,
+        "instance_count": instances,
+        "family_names": names,
+    })]
+
+    for index in range(plugins - 1):
+        label, order = groups[index % len(groups)]
+        offset = (index // len(groups)) % spread
+
+        # Some plug-ins are of every family
+        if rng.random() < 0.1:
+            plugin_families = ["*"]
+        else:
+            plugin_families = [rng.choice(names)]
+
+        result.append(type(
+            "%sBenchmark%04d" % (label, index), (BenchmarkPlugin,), {
+                "__module__": __name__,
+                "order": order + offset * 0.1 - 0.2,
+                "families": plugin_families,
+                "records": records,
+                "failure_ratio": failure_ratio,
+            }
+        ))
+
+    return result
@@ -1,11 +1,27 @@
+import io
+import os
+import sys
+import json
+import logging
+import time
+import shutil
+import contextlib
+import threading
+import tempfile
+import collections
+
 import pyblish.api
 import pyblish.lib
-from pyblish_lite import control
+from pyblish_lite import (
+    asynchronous, checkpoint, control, extraction, headless, util
+)
+from pyblish_lite.vendor.Qt import QtCore
 
 # Vendor libraries
 from nose.tools import (
     with_setup,
-    assert_equals
+    assert_equals,
+    assert_raises
 )
 
 
@@ -13,6 +29,11 @@ def clean():
     pyblish.api.deregister_all_plugins()
 
 
+def setup_function(function):
+    # `with_setup` is only honoured by nose, clean up for pytest too
+    clean()
+
+
 @with_setup(clean)
 def test_something():
     """Anything runs"""
@@ -360,3 +381,1597 @@ def test_controller_signals():
         "was_published": 1,
         "was_finished": 3,
     })
+
+
+@with_setup(clean)
+def test_frame_budget():
+    """Pairs are processed in slices without per-pair delays"""
+
+    count = {"about_to_process": 0, "was_processed": 0}
+
+    class BudgetCollector(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for index in range(50):
+                context.create_instance("BudgetInstance%d" % index)
+
+    class BudgetValidator(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            pass
+
+    for plugin in [BudgetCollector, BudgetValidator]:
+        pyblish.api.register_plugin(plugin)
+
+    def on_about_to_process(plugin, instance):
+        if plugin.__name__ == "BudgetValidator":
+            count["about_to_process"] += 1
+
+    def on_was_processed(result):
+        if result["plugin"].__name__ == "BudgetValidator":
+            count["was_processed"] += 1
+
+    ctrl = control.Controller()
+    ctrl.about_to_process.connect(on_about_to_process)
+    ctrl.was_processed.connect(on_was_processed)
+    ctrl.reset()
+    ctrl.publish()
+
+    assert_equals(count, {"about_to_process": 50, "was_processed": 50})
+
+    budget = util.FrameBudget(0)
+    budget.start()
+    assert not budget.exhausted()
+
+    budget = util.FrameBudget(1)
+    budget.start()
+    time.sleep(0.01)
+    assert budget.exhausted()
+
+
+@with_setup(clean)
+def test_headless():
+    """Headless runs stream results and report failure by exit status"""
+
+    class HeadlessCollector(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.create_instance("HeadlessInstance")
+
+    class HeadlessValidator(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            raise Exception("Invalid")
+
+    class HeadlessExtractor(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+
+        def process(self, instance):
+            pass
+
+    for plugin in [HeadlessCollector, HeadlessValidator, HeadlessExtractor]:
+        pyblish.api.register_plugin(plugin)
+
+    stream = io.StringIO()
+    status = headless.run("publish", stream)
+
+    assert_equals(status, headless.FAILED)
+
+    results = [json.loads(line) for line in stream.getvalue().splitlines()]
+    plugins = [result["plugin"] for result in results]
+    assert "HeadlessValidator" in plugins, plugins
+    assert "HeadlessExtractor" not in plugins, plugins
+
+    result = results[plugins.index("HeadlessValidator")]
+    assert_equals(result["instance"], "HeadlessInstance")
+    assert_equals(result["error"]["label"], "Invalid")
+
+
+@with_setup(clean)
+def test_headless_stdout():
+    """Headless standard output holds nothing but results"""
+
+    class PrintingCollector(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            print("Collecting..")
+            util.u_print("Status of the controller")
+            context.create_instance("PrintingInstance")
+
+    pyblish.api.register_plugin(PrintingCollector)
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), \
+            contextlib.redirect_stderr(stderr):
+        status = headless.run("publish")
+
+    assert_equals(status, headless.SUCCESS)
+
+    results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert "PrintingCollector" in [result["plugin"] for result in results]
+    assert "Collecting.." in stderr.getvalue(), stderr.getvalue()
+
+
+@with_setup(clean)
+def test_thread_safe():
+    """Thread-safe plug-ins are processed concurrently, results in order"""
+
+    count = {"#": 0}
+
+    class ThreadCollector(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for index in range(8):
+                context.create_instance("Instance%d" % index)
+
+    class ThreadValidator(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        thread_safe = True
+
+        def process(self, instance):
+            # Later instances finish first
+            time.sleep(0.01 * (8 - instance.context.index(instance)))
+            self.log.info(instance.name)
+            count["#"] += 1
+
+    class HostValidator(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        thread_safe = True
+
+        def process(self, instance):
+            from maya import cmds
+            cmds.ls()
+
+    for plugin in [ThreadCollector, ThreadValidator]:
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.max_workers = 4
+
+    # The level of the root logger is as it was once threads are done
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+
+    results = []
+    c.was_processed.connect(results.append)
+    try:
+        c.reset()
+        c.publish()
+        assert_equals(root.level, logging.WARNING)
+
+        # Results of the context are in order too
+        assert_equals(
+            [
+                result["instance"].name
+                for result in c.context.data["results"]
+                if result["plugin"].__name__ == "ThreadValidator"
+            ],
+            ["Instance%d" % index for index in range(8)]
+        )
+    finally:
+        root.setLevel(level)
+        c.cleanup()
+
+    results = [
+        result for result in results
+        if result["plugin"].__name__ == "ThreadValidator"
+    ]
+    assert_equals(count["#"], 8)
+    assert_equals(
+        [result["instance"].name for result in results],
+        ["Instance%d" % index for index in range(8)]
+    )
+
+    for result in results:
+        assert_equals(
+            [record.msg for record in result["records"]],
+            [result["instance"].name]
+        )
+
+    assert util.is_host_bound(HostValidator)
+    assert not util.is_host_bound(ThreadValidator)
+
+
+HOST_LIBRARY = '''
+from maya import cmds
+
+
+def lock(node):
+    cmds.lockNode(node)
+'''
+
+LIBRARY_PLUGIN = '''
+import pyblish.api
+import host_library
+
+
+class ValidateLocked(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    thread_safe = True
+
+    def process(self, instance):
+        host_library.lock(instance.name)
+'''
+
+
+@with_setup(clean)
+def test_host_bound_library():
+    """Plug-ins using the host through a library are bound to the host"""
+
+    libraries = tempfile.mkdtemp()
+    os.mkdir(os.path.join(libraries, "maya"))
+    for name, source in (("maya/__init__.py", ""),
+                         ("maya/cmds.py", "def lockNode(node): pass\n"),
+                         ("host_library.py", HOST_LIBRARY)):
+        with open(os.path.join(libraries, name), "w") as f:
+            f.write(source)
+
+    plugins = tempfile.mkdtemp()
+    with open(os.path.join(plugins, "validate_locked.py"), "w") as f:
+        f.write(LIBRARY_PLUGIN)
+
+    modules = set(sys.modules)
+    sys.path.insert(0, libraries)
+    try:
+        plugin, = pyblish.api.discover(paths=[plugins])
+        assert util.is_host_bound(plugin)
+    finally:
+        sys.path.remove(libraries)
+        for name in set(sys.modules) - modules:
+            sys.modules.pop(name)
+        shutil.rmtree(libraries)
+        shutil.rmtree(plugins)
+
+
+POOL_PLUGIN = '''
+import os
+import pyblish.api
+
+
+class PoolValidator(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    process_pool = True
+    context_keys = ["prefix"]
+    instance_keys = ["nodes"]
+
+    def process(self, instance):
+        assert "secret" not in instance.data, "Undeclared data was sent"
+        self.log.info("pid %d" % os.getpid())
+
+        prefix = instance.context.data["prefix"]
+        for node in instance.data["nodes"]:
+            if not node.startswith(prefix):
+                raise ValueError("Bad name: %s" % node)
+'''
+
+
+@with_setup(clean)
+def test_process_pool():
+    """Process pool plug-ins run in workers on declared data only"""
+
+    class PoolCollector(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.data["prefix"] = "geo_"
+            for index in range(3):
+                instance = context.create_instance("Instance%d" % index)
+                instance.data["nodes"] = ["geo_a", "geo_b"]
+                instance.data["secret"] = True
+
+            instance.data["nodes"].append("bad")
+
+    tempdir = tempfile.mkdtemp()
+    with open(os.path.join(tempdir, "pool_validator.py"), "w") as f:
+        f.write(POOL_PLUGIN)
+
+    pyblish.api.register_plugin(PoolCollector)
+    pyblish.api.register_plugin_path(tempdir)
+
+    c = control.Controller()
+    c.max_processes = 2
+
+    results = []
+    c.was_processed.connect(results.append)
+    try:
+        c.reset()
+        c.publish()
+    finally:
+        c.cleanup()
+        pyblish.api.deregister_plugin_path(tempdir)
+        shutil.rmtree(tempdir)
+
+    results = [
+        result for result in results
+        if result["plugin"].__name__ == "PoolValidator"
+    ]
+    assert_equals(
+        [result["success"] for result in results],
+        [True, True, False]
+    )
+
+    pids = set(result["records"][0]["msg"] for result in results)
+    assert "pid %d" % os.getpid() not in pids, pids
+
+    error = results[-1]["error"]
+    assert_equals(str(error), "Bad name: bad")
+    assert_equals(util.error_to_dict(error)["label"], "Bad name: bad")
+    assert c.errored
+
+
+@with_setup(clean)
+def test_pool_within_application():
+    """Processes are disabled within an application, unless told otherwise"""
+
+    executable = sys.executable
+    os.environ.pop("PYBLISH_PROCESSES", None)
+    os.environ.pop("PYBLISH_POOL_EXECUTABLE", None)
+    sys.executable = os.path.join("bin", "maya.exe")
+    try:
+        c = control.Controller()
+        assert_equals(c.process_count(), 1)
+
+        os.environ["PYBLISH_POOL_EXECUTABLE"] = os.path.join("bin", "mayapy")
+        assert_equals(c.process_count(), os.cpu_count() or 1)
+    finally:
+        sys.executable = executable
+        os.environ.pop("PYBLISH_POOL_EXECUTABLE", None)
+
+    assert util.is_python(executable)
+    assert util.is_python(os.path.join("bin", "python3.11"))
+    assert not util.is_python(os.path.join("bin", "maya.exe"))
+
+
+@with_setup(clean)
+def test_dependencies():
+    """Plug-ins run once the context data they require is provided"""
+
+    processed = []
+
+    class CollectA(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.3
+        requires_data = ["b"]
+        provides_data = ["a"]
+
+        def process(self, context):
+            processed.append(type(self).__name__)
+            context.data["a"] = context.data["b"] + 1
+
+    class CollectB(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.4
+        provides_data = ["b"]
+
+        def process(self, context):
+            processed.append(type(self).__name__)
+            context.data["b"] = 1
+
+    class CollectUndeclared(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+
+        def process(self, context):
+            processed.append(type(self).__name__)
+
+    class CollectAfter(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.45
+
+        def process(self, context):
+            processed.append(type(self).__name__)
+            assert context.data["a"] == 2
+
+    for plugin in [CollectA, CollectB, CollectUndeclared, CollectAfter]:
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.reset()
+
+    assert not c.errored
+    assert_equals(
+        processed,
+        ["CollectB", "CollectUndeclared", "CollectA", "CollectAfter"]
+    )
+
+    # Cyclic dependencies fall back to order
+    CollectB.requires_data = ["a"]
+    processed[:] = []
+    c.reset()
+    assert_equals(
+        processed,
+        ["CollectUndeclared", "CollectA", "CollectB", "CollectAfter"]
+    )
+
+
+@with_setup(clean)
+def test_revalidate():
+    """Only plug-ins touched by an action are processed again"""
+
+    scene = {"meshes": ["|GEO|bad_mesh", "|GEO|mesh"], "cameras": ["cam"]}
+    count = collections.Counter()
+
+    class DeleteBadMeshes(pyblish.api.Action):
+        items_list = ["|GEO|bad_mesh"]
+
+        def process(self, context, plugin):
+            for node in self.items_list:
+                scene["meshes"].remove(node)
+
+    class CollectMeshes(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            count["CollectMeshes"] += 1
+            context.data["meshes"] = list(scene["meshes"])
+
+    class CollectCameras(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            count["CollectCameras"] += 1
+            context.data["cameras"] = list(scene["cameras"])
+
+    class CollectInstances(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+
+        def process(self, context):
+            count["CollectInstances"] += 1
+            for mesh in context.data["meshes"]:
+                instance = context.create_instance(mesh)
+                instance.data["nodes"] = [mesh]
+
+    class ValidateMeshes(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+        actions = [DeleteBadMeshes]
+
+        def process(self, context):
+            count["ValidateMeshes"] += 1
+            for mesh in context.data["meshes"]:
+                assert "bad" not in mesh, "Bad mesh"
+
+    class ValidateCameras(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            count["ValidateCameras"] += 1
+            assert context.data["cameras"]
+
+    class ValidateInstance(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            count["ValidateInstance"] += 1
+            assert instance.data["nodes"]
+
+    for plugin in [CollectMeshes, CollectCameras, CollectInstances,
+                   ValidateMeshes, ValidateCameras, ValidateInstance]:
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    discarded = []
+    c.about_to_revalidate.connect(discarded.extend)
+
+    c.reset()
+    c.validate()
+    assert c.errored
+    assert_equals(len(c.context), 2)
+
+    plugin = next(p for p in c.plugins if p.__name__ == "ValidateMeshes")
+    c.act(plugin, DeleteBadMeshes)
+
+    count.clear()
+    c.revalidate()
+
+    assert not c.errored
+    assert_equals(count, collections.Counter({
+        "CollectMeshes": 1,
+        "CollectInstances": 1,
+        "ValidateMeshes": 1,
+        "ValidateInstance": 1,
+    }))
+    assert_equals([instance.name for instance in c.context], ["|GEO|mesh"])
+
+    # Discarded are results of plug-ins run again and removed instances
+    assert_equals(
+        sorted(result["plugin"].__name__ for result in discarded),
+        ["CollectInstances", "CollectMeshes", "ValidateInstance",
+         "ValidateInstance", "ValidateMeshes"]
+    )
+
+    results = c.context.data["results"]
+    assert_equals(
+        len([r for r in results if r["plugin"].__name__ == "ValidateCameras"]),
+        1
+    )
+
+
+@with_setup(clean)
+def test_result_cache():
+    """Validators of unchanged inputs are replayed from the cache"""
+
+    processed = []
+    names = ["geo_a"]
+
+    class CollectNodes(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.data["nodes"] = list(names)
+
+    class ValidateNodes(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+        plugin_id = "b1f7d0c4-1d3c-4c52-9b8e-0d8c4a8e7f21"
+        context_keys = ["nodes"]
+
+        def process(self, context):
+            processed.append(list(context.data["nodes"]))
+            self.log.info("Validated %s" % context.data["nodes"])
+
+    pyblish.api.register_plugin(CollectNodes)
+    pyblish.api.register_plugin(ValidateNodes)
+
+    tempdir = tempfile.mkdtemp()
+    os.environ["PYBLISH_RESULT_CACHE"] = tempdir
+
+    def validate():
+        results = []
+        c = control.Controller()
+        c.was_processed.connect(results.append)
+        c.reset()
+        c.validate()
+        return [
+            result for result in results
+            if result["plugin"].__name__ == "ValidateNodes"
+        ]
+
+    try:
+        first = validate()
+        second = validate()
+        names.append("geo_b")
+        third = validate()
+    finally:
+        os.environ.pop("PYBLISH_RESULT_CACHE")
+        shutil.rmtree(tempdir)
+
+    assert_equals(processed, [["geo_a"], ["geo_a", "geo_b"]])
+    assert_equals(
+        [result.get("cached", False) for result in first + second + third],
+        [False, True, False]
+    )
+
+    # Records are replayed as they were logged
+    assert_equals(second[0]["records"][0]["msg"], "Validated ['geo_a']")
+    assert second[0]["success"]
+
+
+@with_setup(clean)
+def test_result_cache_nodes():
+    """Only the content of nodes of `node_keys` is hashed"""
+
+    from pyblish_lite import cache
+
+    scene = {"mesh_a": "cube", "mesh_b": "sphere"}
+    hashed = []
+    processed = []
+
+    def hash_node(node):
+        hashed.append(node)
+        return scene.get(node, "missing")
+
+    class CollectMeshes(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.data["mesh_nodes"] = sorted(scene)
+            instance = context.create_instance("A")
+            instance.data["nodes"] = ["mesh_a"]
+
+    class ValidateMeshes(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        plugin_id = "0c5b8f3e-7a1d-4b9e-8f6a-2d4c3b1a9e70"
+        context_keys = ["mesh_nodes"]
+        instance_keys = ["nodes"]
+        node_keys = ["nodes"]
+
+        def process(self, instance):
+            processed.append(instance.data["nodes"])
+
+    pyblish.api.register_plugin(CollectMeshes)
+    pyblish.api.register_plugin(ValidateMeshes)
+    pyblish.api.register_host("cachehost")
+    cache.register_hasher("cachehost", hash_node)
+
+    tempdir = tempfile.mkdtemp()
+    os.environ["PYBLISH_RESULT_CACHE"] = tempdir
+
+    def validate():
+        c = control.Controller()
+        c.reset()
+        c.validate()
+        c.cleanup()
+
+    try:
+        validate()
+
+        # Changed, but not validated by the instance
+        scene["mesh_b"] = "torus"
+        validate()
+        assert_equals(len(processed), 1)
+
+        scene["mesh_a"] = "cone"
+        validate()
+        assert_equals(len(processed), 2)
+    finally:
+        os.environ.pop("PYBLISH_RESULT_CACHE")
+        cache.deregister_hasher("cachehost")
+        pyblish.api.deregister_host("cachehost")
+        shutil.rmtree(tempdir)
+
+    assert_equals(set(hashed), set(["mesh_a"]))
+
+
+@with_setup(clean)
+def test_family_index():
+    """Plug-ins match families as instances change during publishing"""
+
+    processed = []
+
+    class CollectInstances(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for name in ("A", "B", "C"):
+                instance = context.create_instance(name)
+                instance.data["family"] = "model"
+                instance.data["families"] = []
+
+            context[1].data["publish"] = False
+
+    class CollectRigs(pyblish.api.InstancePlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+        families = ["model"]
+
+        def process(self, instance):
+            if instance.name == "C":
+                instance.data["families"].append("rig")
+
+    class ValidateModels(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["model"]
+
+        def process(self, instance):
+            processed.append((type(self).__name__, instance.name))
+
+    class ValidateRigs(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder + 0.1
+        families = ["rig"]
+
+        def process(self, instance):
+            processed.append((type(self).__name__, instance.name))
+
+    class ValidateLooks(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder + 0.2
+        families = ["look"]
+
+        def process(self, context):
+            processed.append((type(self).__name__, None))
+
+    for plugin in (CollectInstances, CollectRigs,
+                   ValidateModels, ValidateRigs, ValidateLooks):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.reset()
+
+    assert_equals(
+        sorted(c.family_index.families()), ["model", "rig"]
+    )
+
+    c.validate()
+    assert_equals(processed, [
+        ("ValidateModels", "A"),
+        ("ValidateModels", "C"),
+        ("ValidateRigs", "C"),
+    ])
+
+    # Toggled outside of processing, e.g. by the artist
+    c.context[1].data["publish"] = True
+    assert_equals(
+        [instance.name for instance in
+         c.family_index.instances_by_plugin(ValidateModels)],
+        ["A", "B", "C"]
+    )
+
+
+@with_setup(clean)
+def test_family_index_replaced():
+    """Instances removed and created by one plug-in are indexed"""
+
+    processed = []
+
+    class CollectA(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.create_instance("A", family="model")
+
+    class ReplaceA(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+
+        def process(self, context):
+            context.remove(context[0])
+            context.create_instance("B", family="model")
+
+    class ValidateModels(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["model"]
+
+        def process(self, instance):
+            processed.append(instance.name)
+
+    for plugin in (CollectA, ReplaceA, ValidateModels):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.reset()
+    c.validate()
+
+    assert_equals(processed, ["B"])
+    assert_equals(
+        [instance.name for instance in
+         c.family_index.instances_by_plugin(ValidateModels)],
+        ["B"]
+    )
+
+    # Also of a plain context, whose changes are not counted
+    context = pyblish.api.Context()
+    context.create_instance("A", family="model")
+    index = util.FamilyIndex(context)
+    context[:] = []
+    context.create_instance("C", family="model")
+    assert_equals(
+        [instance.name for instance in
+         index.instances_by_plugin(ValidateModels)],
+        ["C"]
+    )
+
+
+@with_setup(clean)
+def test_timings():
+    """Results carry wall time, CPU time and peak memory"""
+
+    class ValidateSlowly(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            context.data["allocated"] = bytearray(1024 * 1024)
+            time.sleep(0.05)
+
+    pyblish.api.register_plugin(ValidateSlowly)
+
+    c = control.Controller()
+    c.trace_memory = True
+    results = []
+    c.was_processed.connect(results.append)
+    try:
+        c.reset()
+        c.validate()
+    finally:
+        c.cleanup()
+
+    result = results[-1]
+    assert result["wall_time"] >= 0.05, result["wall_time"]
+    assert result["cpu_time"] < result["wall_time"], result["cpu_time"]
+    assert result["memory"] >= 1024 * 1024, result["memory"]
+
+    serialized = util.serialize_result(result)
+    assert_equals(serialized["wall_time"], result["wall_time"])
+    assert_equals(util.format_duration(0.0504), "50 ms")
+    assert_equals(util.format_size(3 * 1024 * 1024), "3.0 MB")
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@with_setup(clean)
+def test_profile():
+    """Plug-ins are profiled when enabled, and written on stopping"""
+
+    class ValidateBusily(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            busy(0.1)
+
+    pyblish.api.register_plugin(ValidateBusily)
+
+    for mode in ("cprofile", "sampling"):
+        tempdir = tempfile.mkdtemp()
+        os.environ["PYBLISH_PROFILE"] = mode
+        os.environ["PYBLISH_PROFILE_DIR"] = tempdir
+        try:
+            c = control.Controller()
+            c.reset()
+            c.validate()
+
+            plugin, = [
+                plugin for plugin in c.plugins
+                if plugin.__name__ == "ValidateBusily"
+            ]
+            name = "%s.ValidateBusily" % plugin.__module__
+            files = sorted(os.listdir(tempdir))
+            with open(os.path.join(tempdir, name + ".txt")) as f:
+                report = f.read()
+        finally:
+            os.environ.pop("PYBLISH_PROFILE")
+            os.environ.pop("PYBLISH_PROFILE_DIR")
+            shutil.rmtree(tempdir)
+
+        assert name + ".pstats" in files, files
+        assert "publish.pstats" in files, files
+        assert "(busy)" in report, report
+        assert "(busy)" in c.profiler.report(plugin.id)
+
+
+PROFILED_PLUGIN = '''
+import time
+import pyblish.api
+
+
+class ValidateDiscovered(pyblish.api.ContextPlugin):
+    order = pyblish.api.ValidatorOrder
+
+    def process(self, context):
+        time.sleep(0.05)
+'''
+
+
+@with_setup(clean)
+def test_profile_discovered():
+    """Profiles of plug-ins discovered from a path are written alongside"""
+
+    plugins = tempfile.mkdtemp()
+    with open(os.path.join(plugins, "validate_discovered.py"), "w") as f:
+        f.write(PROFILED_PLUGIN)
+
+    tempdir = tempfile.mkdtemp()
+    os.environ["PYBLISH_PROFILE"] = "cprofile"
+    os.environ["PYBLISH_PROFILE_DIR"] = tempdir
+    pyblish.api.register_plugin_path(plugins)
+    try:
+        c = control.Controller()
+        c.reset()
+        c.validate()
+        c.cleanup()
+
+        files = sorted(os.listdir(tempdir))
+        leftovers = sorted(os.listdir(plugins))
+    finally:
+        os.environ.pop("PYBLISH_PROFILE")
+        os.environ.pop("PYBLISH_PROFILE_DIR")
+        pyblish.api.deregister_plugin_path(plugins)
+        shutil.rmtree(tempdir)
+        shutil.rmtree(plugins)
+
+    assert "validate_discovered.ValidateDiscovered.pstats" in files, files
+    assert "validate_discovered.ValidateDiscovered.txt" in files, files
+    assert_equals(leftovers, ["validate_discovered.py"])
+
+
+@with_setup(clean)
+def test_iter_results():
+    """Results are yielded as processed, and processing stops with them"""
+
+    count = {"validated": 0}
+
+    class CollectMany(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for name in ("A", "B", "C"):
+                context.create_instance(name)
+
+    class ValidateEach(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            count["validated"] += 1
+
+    class ExtractEach(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+
+        def process(self, instance):
+            pass
+
+    for plugin in (CollectMany, ValidateEach, ExtractEach):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.frame_budget = 0
+
+    # Pyblish comes with collectors of its own
+    ours = ("CollectMany", "ValidateEach", "ExtractEach")
+    plugins = [
+        result["plugin"].__name__
+        for result in c.iter_results("validate")
+        if result["plugin"].__name__ in ours
+    ]
+    assert_equals(plugins, ["CollectMany"] + ["ValidateEach"] * 3)
+    assert not c.is_running
+
+    # Stopping early leaves the remaining pairs unprocessed
+    count["validated"] = 0
+    for result in c.iter_results("publish"):
+        if result["plugin"].__name__ == "ValidateEach":
+            break
+
+    assert_equals(count["validated"], 1)
+    assert not c.is_running
+
+    finished = []
+    c.was_finished.connect(lambda: finished.append(True))
+    plugins = [
+        result["plugin"].__name__
+        for result in c.iter_results()
+        if result["plugin"].__name__ in ours
+    ]
+    assert_equals(plugins.count("ExtractEach"), 3)
+    assert finished
+
+    assert_raises(ValueError, c.iter_results, "extract")
+    c.cleanup()
+
+
+@with_setup(clean)
+def test_processed_batch():
+    """Results are emitted together, once per slice of processing"""
+
+    class CollectMany(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for index in range(20):
+                context.create_instance("Instance%d" % index)
+
+    class ValidateEach(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            pass
+
+    for plugin in (CollectMany, ValidateEach):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.frame_budget = 0
+
+    results = []
+    batches = []
+    c.was_processed.connect(results.append)
+    c.was_processed_batch.connect(batches.append)
+
+    c.reset()
+    assert_equals(len(batches), 1)
+
+    c.validate()
+    assert_equals(len(batches), 2)
+    assert_equals(len(batches[-1]), 20)
+    assert_equals(sum(batches, []), results)
+    assert_equals(c.pending_results, [])
+
+    c.cleanup()
+
+
+@with_setup(clean)
+def test_validate_finished():
+    """Validating with nothing past validation finishes, not stops"""
+
+    class ValidateA(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            pass
+
+    pyblish.api.register_plugin(ValidateA)
+
+    c = control.Controller()
+    c.reset()
+
+    emitted = []
+    c.was_stopped.connect(lambda: emitted.append("stopped"))
+    c.was_finished.connect(lambda: emitted.append("finished"))
+
+    c.validate()
+    c.cleanup()
+
+    assert_equals(emitted, ["finished"])
+    assert not c.is_running
+
+
+@with_setup(clean)
+def test_run_test():
+    """The registered test is run anew as any of `processing` changes"""
+
+    def stop_on_publish(**vars):
+        if not vars["stop_on_validation"]:
+            return "Publishing"
+
+    def stop_always(**vars):
+        return "Stopped"
+
+    c = control.Controller()
+    pyblish.api.register_test(stop_on_publish)
+    try:
+        c.reset()
+        c.processing["stop_on_validation"] = True
+        assert_equals(c.run_test(), None)
+
+        c.processing["stop_on_validation"] = False
+        assert_equals(c.run_test(), "Publishing")
+
+        # Registered anew, see `load_plugins`
+        pyblish.api.register_test(stop_always)
+        c.load_plugins()
+        assert_equals(c.run_test(), "Stopped")
+    finally:
+        pyblish.api.deregister_test()
+        c.cleanup()
+
+
+@with_setup(clean)
+def test_first_slice_scheduled():
+    """Processing with a frame budget starts once control returns to Qt"""
+
+    class ValidateA(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            context.data["validated"] = True
+
+    pyblish.api.register_plugin(ValidateA)
+
+    c = control.Controller()
+    c.reset()
+
+    loop = QtCore.QEventLoop()
+    c.was_stopped.connect(loop.quit)
+    c.was_finished.connect(loop.quit)
+    QtCore.QTimer.singleShot(5000, loop.quit)
+
+    c.frame_budget = 60000
+    try:
+        c.validate()
+        assert "validated" not in c.context.data
+
+        loop.exec_()
+        assert c.context.data["validated"]
+    finally:
+        c.cleanup()
+
+
+@with_setup(clean)
+def test_processed_batch_before_group():
+    """Results of a group are emitted before the group is passed"""
+
+    class ValidateFailing(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            raise Exception("Failed")
+
+    pyblish.api.register_plugin(ValidateFailing)
+
+    c = control.Controller()
+
+    emitted = []
+    c.was_processed_batch.connect(
+        lambda results: emitted.extend(
+            result["plugin"].__name__ for result in results
+        )
+    )
+    c.passed_group.connect(lambda order: emitted.append(order))
+
+    c.reset()
+
+    # The first slice is scheduled, see `iterate_and_process`
+    loop = QtCore.QEventLoop()
+    c.was_stopped.connect(loop.quit)
+    c.was_finished.connect(loop.quit)
+    QtCore.QTimer.singleShot(5000, loop.quit)
+
+    c.frame_budget = 60000
+    c.validate()
+    loop.exec_()
+
+    # Followed by the order of the group passed to
+    index = emitted.index("ValidateFailing")
+    assert emitted[index + 1:], emitted
+    assert not isinstance(emitted[index + 1], str), emitted
+
+    c.cleanup()
+
+
+@with_setup(clean)
+def test_async():
+    """Coroutine plug-ins of the same order are awaited alongside"""
+
+    import asyncio
+
+    class CollectMany(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for index in range(6):
+                instance = context.create_instance("Instance%d" % index)
+                instance.data["families"] = ["upload"]
+
+    class IntegrateUpload(pyblish.api.InstancePlugin):
+        order = pyblish.api.IntegratorOrder
+        families = ["upload"]
+
+        async def process(self, instance):
+            self.log.info("Uploading %s" % instance)
+            await asyncio.sleep(0.1)
+            instance.data["uploaded"] = True
+
+    class IntegrateFailure(pyblish.api.InstancePlugin):
+        order = pyblish.api.IntegratorOrder
+        families = ["upload"]
+
+        async def process(self, instance):
+            await asyncio.sleep(0.05)
+            raise Exception("Refused")
+
+    for plugin in (CollectMany, IntegrateUpload, IntegrateFailure):
+        pyblish.api.register_plugin(plugin)
+
+    assert asynchronous.is_async(IntegrateUpload)
+    assert not asynchronous.is_async(CollectMany)
+
+    c = asynchronous.AsyncController()
+    c.frame_budget = 0
+    c.max_concurrency = 6
+    results = []
+    c.was_processed.connect(results.append)
+
+    try:
+        c.reset()
+        start = time.time()
+        c.publish()
+        duration = time.time() - start
+        uploaded = [instance.data.get("uploaded") for instance in c.context]
+    finally:
+        c.cleanup()
+
+    # 12 pairs, 6 at a time
+    assert duration < 0.5, duration
+    assert_equals(uploaded, [True] * 6)
+
+    uploads = [
+        result for result in results
+        if result["plugin"].__name__ == "IntegrateUpload"
+    ]
+    assert_equals(len(uploads), 6)
+    for result in uploads:
+        assert result["success"]
+        assert_equals(result["cpu_time"], None)
+        messages = [record.getMessage() for record in result["records"]]
+        assert_equals(messages, ["Uploading %s" % result["instance"]])
+
+    failures = [
+        result for result in results
+        if result["plugin"].__name__ == "IntegrateFailure"
+    ]
+    assert_equals(len(failures), 6)
+    assert all(str(result["error"]) == "Refused" for result in failures)
+    assert c.loop is None
+
+
+@with_setup(clean)
+def test_async_within_loop():
+    """Coroutine plug-ins are awaited from a thread running a loop"""
+
+    import asyncio
+
+    class IntegrateUpload(pyblish.api.ContextPlugin):
+        order = pyblish.api.IntegratorOrder
+
+        async def process(self, context):
+            await asyncio.sleep(0.01)
+            context.data["uploaded"] = True
+
+    pyblish.api.register_plugin(IntegrateUpload)
+
+    c = control.Controller()
+    c.frame_budget = 0
+
+    async def publish():
+        # Such as the Qt thread with qasync
+        c.reset()
+        c.publish()
+
+    try:
+        asyncio.run(publish())
+        assert not c.errored
+        assert c.context.data["uploaded"]
+    finally:
+        c.cleanup()
+
+
+@with_setup(clean)
+def test_async_created():
+    """Instances created by coroutines awaited alongside are indexed"""
+
+    import asyncio
+
+    validated = []
+
+    class CollectScene(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.create_instance("Scene", family="scene")
+
+    class CollectA(pyblish.api.InstancePlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+        families = ["scene"]
+
+        async def process(self, instance):
+            await asyncio.sleep(0.05)
+            instance.context.create_instance("A", family="model")
+
+    class CollectB(pyblish.api.InstancePlugin):
+        order = pyblish.api.CollectorOrder + 0.1
+        families = ["scene"]
+
+        async def process(self, instance):
+            instance.context.create_instance("B", family="model")
+            await asyncio.sleep(0.1)
+
+    class ValidateModels(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["model"]
+
+        async def process(self, instance):
+            await asyncio.sleep(0)
+            validated.append(instance.name)
+
+    for plugin in (CollectScene, CollectA, CollectB, ValidateModels):
+        pyblish.api.register_plugin(plugin)
+
+    # Awaited by a plain controller too, one at a time
+    c = control.Controller()
+    c.reset()
+    c.validate()
+    errors = [
+        result["error"] for result in c.context.data["results"]
+        if result["error"] is not None
+    ]
+    c.cleanup()
+
+    assert_equals(errors, [])
+    assert_equals(sorted(validated), ["A", "B"])
+
+    del validated[:]
+
+    c = asynchronous.AsyncController()
+    c.frame_budget = 0
+    try:
+        c.reset()
+        created = dict(
+            (plugin.__name__, c.tracker.creates[plugin])
+            for plugin in c.plugins
+            if plugin.__name__ in ("CollectA", "CollectB")
+        )
+        ids = set(
+            instance.id for instance in c.context
+            if instance.name in ("A", "B")
+        )
+        c.validate()
+    finally:
+        c.cleanup()
+
+    assert_equals(sorted(validated), ["A", "B"])
+
+    # Either may have created them, as far as the controller knows
+    assert_equals(created, {"CollectA": ids, "CollectB": ids})
+
+
+@with_setup(clean)
+def test_resume():
+    """Publishing resumes from the group after the last one passed"""
+
+    count = collections.Counter()
+
+    class CollectNodes(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            count["collected"] += 1
+            for name in ("A", "B"):
+                instance = context.create_instance(name)
+                instance.data["path"] = "/%s.ma" % name
+                instance.data["node"] = object()
+
+    class ValidateNodes(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            count["validated"] += 1
+
+    class ExtractNodes(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+
+        def process(self, instance):
+            count["extracted"] += 1
+            if count["crashed"] < 1:
+                count["crashed"] += 1
+                raise RuntimeError("Crashed")
+
+            assert_equals(instance.data["path"], "/%s.ma" % instance.name)
+            assert "node" not in instance.data
+
+    for plugin in (CollectNodes, ValidateNodes, ExtractNodes):
+        pyblish.api.register_plugin(plugin)
+
+    tempdir = tempfile.mkdtemp()
+    os.environ["PYBLISH_CHECKPOINT_DIR"] = tempdir
+    path = os.path.join(tempdir, "checkpoint.json")
+
+    try:
+        c = control.Controller()
+        c.frame_budget = 0
+        c.reset()
+        c.publish()
+        assert c.errored
+        assert os.path.exists(path)
+        c.cleanup()
+
+        # Nothing to resume in another scene
+        pyblish.api.register_host("test")
+        checkpoint.register_fingerprinter("test", lambda: "another")
+        try:
+            c = control.Controller()
+            assert not c.restore()
+        finally:
+            checkpoint.deregister_fingerprinter("test")
+            pyblish.api.deregister_host("test")
+        c.cleanup()
+
+        count.clear()
+        count["crashed"] = 1
+
+        c = control.Controller()
+        c.frame_budget = 0
+        results = list(c.iter_results(resume=True))
+        assert not c.errored
+
+        # Collected and validated before, not again
+        assert_equals(count["collected"], 0)
+        assert_equals(count["validated"], 0)
+        assert_equals(count["extracted"], 2)
+        assert_equals(sorted(instance.name for instance in c.context),
+                      ["A", "B"])
+
+        validated = [
+            result for result in results
+            if result["plugin"].__name__ == "ValidateNodes"
+        ]
+        assert_equals(len(validated), 2)
+        assert all(result["instance"] in c.context for result in validated)
+
+        # Published in full, nothing is left to resume
+        assert not os.path.exists(path)
+        c.cleanup()
+
+    finally:
+        os.environ.pop("PYBLISH_CHECKPOINT_DIR")
+        shutil.rmtree(tempdir)
+
+
+@with_setup(clean)
+def test_plan():
+    """What is left to process is planned, and follows toggles"""
+
+    class CollectFamilies(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for name, family in (("A", "model"), ("B", "rig")):
+                instance = context.create_instance(name)
+                instance.data["family"] = family
+
+    class ValidateModel(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["model"]
+
+        def process(self, instance):
+            pass
+
+    class ExtractRig(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+        families = ["rig"]
+
+        def process(self, instance):
+            pass
+
+    class IntegrateAll(pyblish.api.InstancePlugin):
+        order = pyblish.api.IntegratorOrder
+        families = ["*"]
+
+        def process(self, instance):
+            pass
+
+    for plugin in (CollectFamilies, ValidateModel, ExtractRig, IntegrateAll):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.frame_budget = 0
+    c.reset()
+
+    steps = dict((step["plugin"], step) for step in c.plan.describe())
+    assert "CollectFamilies" not in steps
+    assert_equals(steps["ValidateModel"]["group"], "Validate")
+    assert_equals(steps["ValidateModel"]["instances"], ["A"])
+    assert_equals(steps["ExtractRig"]["group"], "Extract")
+    assert_equals(steps["IntegrateAll"]["instances"], ["A", "B"])
+    assert "ExtractRig: B" in str(c.plan)
+
+    # Toggling an instance changes the plan
+    rig, = [instance for instance in c.context if instance.name == "B"]
+    rig.data["publish"] = False
+    steps = dict((step["plugin"], step) for step in c.plan.describe())
+    assert_equals(steps["ExtractRig"]["instances"], [])
+    assert_equals(steps["IntegrateAll"]["instances"], ["A"])
+
+    processed = []
+    c.was_processed.connect(
+        lambda result: processed.append((
+            result["plugin"].__name__,
+            None if result["instance"] is None else result["instance"].name
+        ))
+    )
+    c.publish()
+
+    assert ("ExtractRig", "B") not in processed
+    assert ("IntegrateAll", "A") in processed
+    assert ("IntegrateAll", "B") not in processed
+    assert_equals(c.plan.position, len(c.plan))
+    c.cleanup()
+
+
+@with_setup(clean)
+def test_fanned_out_extraction():
+    """Items of extractors transfer on the I/O pool, per instance"""
+
+    threads = collections.defaultdict(set)
+
+    class CollectInstances(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for name in ("A", "B", "C"):
+                context.create_instance(name)
+
+    class ExtractItems(extraction.FanOutExtractor):
+        def export(self, instance):
+            threads["export"].add(threading.current_thread().name)
+            return [(instance.name, index) for index in range(3)]
+
+        def transfer(self, instance, item):
+            threads["transfer"].add(threading.current_thread().name)
+            time.sleep(0.01)
+            self.log.info("Transferred %s %d" % item)
+            if item == ("B", 1):
+                raise IOError("Disk full")
+
+    for plugin in (CollectInstances, ExtractItems):
+        pyblish.api.register_plugin(plugin)
+
+    for workers in (2, 0):
+        threads.clear()
+
+        c = control.Controller()
+        c.frame_budget = 0
+        c.io_workers = workers
+        c.io_queue_size = 2
+
+        progress = []
+        c.io_progress.connect(
+            lambda plugin, instance, value: progress.append(
+                (instance.name, value)
+            )
+        )
+
+        c.reset()
+        c.publish()
+
+        results = dict(
+            (result["instance"].name, result)
+            for result in c.context.data["results"]
+            if result["plugin"].__name__ == "ExtractItems"
+        )
+        assert_equals(sorted(results), ["A", "B", "C"])
+
+        assert results["A"]["success"]
+        assert not results["B"]["success"]
+        assert_equals(str(results["B"]["error"]), "Disk full")
+        assert_equals(
+            sorted(record.msg for record in results["C"]["records"]),
+            ["Transferred C %d" % index for index in range(3)]
+        )
+
+        assert_equals(threads["export"], set(["MainThread"]))
+        if workers:
+            assert all(
+                name.startswith("PyblishLiteIO")
+                for name in threads["transfer"]
+            )
+            assert_equals(results["A"]["progress"], 1.0)
+            assert ("A", 1.0) in progress and ("C", 1.0) in progress
+        else:
+            assert_equals(threads["transfer"], set(["MainThread"]))
+            assert_equals(progress, [])
+
+        c.cleanup()
+
+
+@with_setup(clean)
+def test_fanned_out_slices():
+    """The event loop runs whilst items transfer, along with progress"""
+
+    class CollectInstance(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            context.create_instance("A")
+
+    class ExtractSlowly(extraction.FanOutExtractor):
+        def export(self, instance):
+            return list(range(3))
+
+        def transfer(self, instance, item):
+            time.sleep(0.05)
+
+    for plugin in (CollectInstance, ExtractSlowly):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.frame_budget = 0
+    c.io_workers = 1
+    c.reset()
+
+    progress = []
+    c.io_progress.connect(
+        lambda plugin, instance, value: progress.append(value)
+    )
+
+    # Drawn whilst transferring, by the number of items transferred
+    drawn = []
+    timer = QtCore.QTimer()
+    timer.setInterval(5)
+    timer.timeout.connect(lambda: drawn.append(len(progress)))
+
+    loop = QtCore.QEventLoop()
+    c.was_finished.connect(loop.quit)
+    c.was_stopped.connect(loop.quit)
+    QtCore.QTimer.singleShot(5000, loop.quit)
+
+    c.frame_budget = 5
+    try:
+        timer.start()
+        c.publish()
+        loop.exec_()
+    finally:
+        timer.stop()
+        c.cleanup()
+
+    assert_equals(progress, [1 / 3.0, 2 / 3.0, 1.0])
+    assert set([1, 2]) & set(drawn), drawn
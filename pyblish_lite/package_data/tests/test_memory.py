@@ -0,0 +1,168 @@
+import gc
+import os
+
+import pyblish.api
+from pyblish_lite import control
+
+# Vendor libraries
+from nose.tools import (
+    with_setup,
+    assert_equals
+)
+
+
+def clean():
+    pyblish.api.deregister_all_plugins()
+
+
+def setup_function(function):
+    # `with_setup` is only honoured by nose, clean up for pytest too
+    clean()
+
+
+def rss():
+    """Return resident memory of this process in bytes, None if unknown"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (IOError, OSError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def reset_cycles(controller, cycles):
+    """Reset and validate `cycles` times
+
+    Returns:
+        tuple: Number of objects and resident memory after the last cycle
+
+    """
+
+    for _ in range(cycles):
+        controller.reset()
+        controller.validate()
+
+    controller.release()
+    gc.collect()
+    return len(gc.get_objects()), rss()
+
+
+class Select(pyblish.api.Action):
+    items_list = None
+
+
+class CollectLeaky(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+
+    def process(self, context):
+        for index in range(50):
+            instance = context.create_instance("Instance%d" % index)
+            instance.data["family"] = "model"
+            instance.data["nodes"] = [
+                "|GEO|mesh_%d_%d" % (index, node) for node in range(200)
+            ]
+
+
+class ValidateLeaky(pyblish.api.InstancePlugin):
+    """Keeps state on its class, as validators of Maya do"""
+
+    order = pyblish.api.ValidatorOrder
+    families = ["model"]
+
+    actions = []
+    failed_nodes = []
+
+    def process(self, instance):
+        self.failed_nodes.extend(instance.data["nodes"])
+
+        # A new action per run, as `create_action_subclass` does
+        action = type("Select", (Select,), {
+            "items_list": list(instance.data["nodes"])
+        })
+        self.actions.append(action)
+
+
+@with_setup(clean)
+def test_reset_cycles():
+    """Memory remains flat across many resets"""
+
+    for plugin in (CollectLeaky, ValidateLeaky):
+        pyblish.api.register_plugin(plugin)
+
+    c = control.Controller()
+    c.frame_budget = 0
+
+    try:
+        # Warm up, such that caches of Python and pyblish are filled
+        objects, memory = reset_cycles(c, 10)
+        later_objects, later_memory = reset_cycles(c, 20)
+    finally:
+        c.cleanup()
+
+    # State on the class of the plug-in was kept to each run
+    assert_equals(ValidateLeaky.failed_nodes, [])
+    assert_equals(ValidateLeaky.actions, [])
+
+    # Each leaking run holds on to 10,000 nodes and 50 classes
+    assert later_objects - objects < 1000, (objects, later_objects)
+
+    # Allow for the allocator holding on to some, a leak of
+    # 20 runs holds on to 400,000 nodes, some 30 mb
+    if memory is not None:
+        growth = later_memory - memory
+        assert growth < 8 * 1024 * 1024, growth
+
+
+def test_record_store():
+    """Records beyond capacity are archived, and read back"""
+
+    from pyblish_lite import records
+
+    store = records.RecordStore(capacity=100)
+    added = []
+    for start in range(0, 1000, 250):
+        added.append(store.extend(
+            {
+                "type": "record",
+                "label": u"Record %d" % index,
+                "levelno": 20,
+                "msecs": index / 10.0,
+            }
+            for index in range(start, start + 250)
+        ))
+
+    try:
+        assert_equals(len(store), 1000)
+        assert_equals(store.archived, 900)
+        assert_equals(len(store._ring), 100)
+
+        for index in (0, 1, 499, 899, 900, 999, -1):
+            record = store[index]
+            assert_equals(record["label"], u"Record %d" % (index % 1000))
+            assert_equals(record["msecs"], (index % 1000) / 10.0)
+            assert "instance" not in record
+
+        # Slices of each extend, and chains of slices, see every record
+        chain = records.RecordChain()
+        for records_ in added:
+            chain.extend(records_)
+
+        assert_equals(len(added[1]), 250)
+        assert_equals(added[1][0]["label"], u"Record 250")
+        assert_equals(
+            [record["label"] for record in chain],
+            [u"Record %d" % index for index in range(1000)]
+        )
+        assert_equals(chain[-1]["label"], u"Record 999")
+
+        # Archived further, the archive is mapped anew once read
+        mapped = store._map
+        store.append({"type": "record", "label": u"Record 1000"})
+        assert mapped.closed
+        assert_equals(store[900]["label"], u"Record 900")
+
+        store.clear()
+        assert_equals(len(store), 0)
+        assert_equals(store.archived, 0)
+    finally:
+        store.close()
@@ -29,3 +29,185 @@ def test_label_nonstring():
     for item in model_:
         assert isinstance(item.data(model.Label), six.text_type), (
             "\"%s\" wasn't a string!" % item.data(model.Label))
+
+
+def test_compatibility():
+    """Compatibility is kept as instances are created and toggled"""
+
+    import random
+
+    import pyblish.api
+    import pyblish.logic
+    from pyblish_lite import compatibility, util
+
+    families = ["model", "rig", "look", "camera"]
+    rng = random.Random(0)
+
+    plugins = []
+    for index in range(40):
+        base = rng.choice((pyblish.api.InstancePlugin,
+                           pyblish.api.ContextPlugin))
+        plugins.append(type("Plugin%d" % index, (base,), {
+            "families": rng.choice([
+                ["*"], []] + [rng.sample(families, 2)] * 2
+                + [[family] for family in families]
+            ),
+            "match": rng.choice((pyblish.api.Intersection,
+                                 pyblish.api.Subset,
+                                 pyblish.api.Exact)),
+        }))
+
+    def expected(plugin, context):
+        active = [
+            instance for instance in context
+            if instance.data.get("publish") is not False
+        ]
+        if plugin.__instanceEnabled__:
+            return bool(pyblish.logic.instances_by_plugin(active, plugin))
+        return bool(pyblish.logic.plugins_by_families(
+            [plugin], util.collect_families_from_instances(active)
+        ))
+
+    context = pyblish.api.Context()
+    family_index = util.FamilyIndex(context)
+    compatible = {}
+
+    for step in range(60):
+        if not context or rng.random() < 0.4:
+            instance = context.create_instance("Instance%d" % step)
+            instance.data.update(
+                rng.choice([{"family": family} for family in families]
+                           + [{"families": rng.sample(families, 2)}, {}])
+            )
+            family_index.add(instance)
+        else:
+            instance = rng.choice(context)
+            instance.data["publish"] = not instance.data.get("publish", True)
+            family_index.invalidate(instance.id)
+
+        # Created part way, as the window is reset
+        if step == 10:
+            engine = compatibility.CompatibilityMap(family_index)
+        if step < 10:
+            continue
+
+        compatible.update(engine.update(plugins))
+        for plugin in plugins:
+            assert compatible[plugin] == expected(plugin, context), (
+                step, plugin.families, plugin.match
+            )
+
+
+def test_detail_text():
+    """Details are made of records as asked for, escaped in one pass"""
+
+    from pyblish_lite.vendor.Qt import QtCore
+    from pyblish_lite.constants import Roles
+
+    model_ = model.TerminalModel()
+    model_.add([
+        {"type": "info", "label": "Info"},
+        {
+            "type": "record",
+            "label": "<b>Bold</b> & more\nlines",
+            "msg": "<b>Bold</b> & more\nlines",
+            "levelno": 30,
+            "levelname": "WARNING",
+        },
+    ])
+
+    label = model_.index(1, 0)
+    detail = model_.index(0, 0, label)
+    assert label.data(QtCore.Qt.DisplayRole) == "<b>Bold</b> & more"
+    assert label.data(Roles.TerminalItemTypeRole) == "log_warning"
+    assert detail.parent().row() == 1
+
+    text = detail.data(QtCore.Qt.DisplayRole)
+    assert (
+        "&#60;b&#62;Bold&#60;/b&#62;&nbsp;&#38;&nbsp;more<br/>lines" in text
+    ), text
+    assert "Message:" in text and "Level:" in text
+    assert "Plugin:" not in text
+
+    # Records are told apart across resets
+    record_id = detail.data(Roles.TerminalRecordIdRole)
+    model_.reset()
+    model_.append({"type": "info", "label": "Info"})
+    model_.append({"type": "info", "label": "Info"})
+    assert model_.index(0, 0, model_.index(1, 0)).data(
+        Roles.TerminalRecordIdRole) != record_id
+
+
+def test_artist_proxy():
+    """Rows of every group are flattened, and changed in single ranges"""
+
+    import random
+
+    from pyblish_lite.vendor.Qt import QtCore, QtGui
+
+    source = QtGui.QStandardItemModel()
+    proxy = model.ArtistProxy()
+    proxy.setSourceModel(source)
+
+    signals = []
+    proxy.rowsInserted.connect(
+        lambda parent, first, last: signals.append(("+", first, last)))
+    proxy.rowsRemoved.connect(
+        lambda parent, first, last: signals.append(("-", first, last)))
+
+    def flattened():
+        return [
+            source.item(group).child(row).text()
+            for group in range(source.rowCount())
+            for row in range(source.item(group).rowCount())
+        ]
+
+    rng = random.Random(0)
+    names = iter(range(100000))
+    for _ in range(300):
+        groups = source.rowCount()
+        signals[:] = []
+        operation = rng.random()
+
+        if operation < 0.15 or not groups:
+            item = QtGui.QStandardItem("group")
+            item.appendRows([
+                QtGui.QStandardItem(str(next(names)))
+                for _ in range(rng.randint(0, 2))
+            ])
+            source.insertRow(rng.randint(0, groups), item)
+            expected = 1 if item.rowCount() else 0
+
+        elif operation < 0.6:
+            item = source.item(rng.randrange(groups))
+            item.insertRows(rng.randint(0, item.rowCount()), [
+                QtGui.QStandardItem(str(next(names)))
+                for _ in range(rng.randint(1, 3))
+            ])
+            expected = 1
+
+        elif operation < 0.9:
+            item = source.item(rng.randrange(groups))
+            if not item.rowCount():
+                continue
+            first = rng.randrange(item.rowCount())
+            count = rng.randint(1, item.rowCount() - first)
+            item.removeRows(first, count)
+            expected = 1
+
+        else:
+            group = rng.randrange(groups)
+            expected = 1 if source.item(group).rowCount() else 0
+            source.removeRow(group)
+
+        assert len(signals) == expected, signals
+
+        rows = flattened()
+        assert proxy.rowCount() == len(rows)
+        for row, text in enumerate(rows):
+            index = proxy.mapToSource(proxy.index(row, 0))
+            assert index.data(QtCore.Qt.DisplayRole) == text
+            assert proxy.mapFromSource(index).row() == row
+
+    source.clear()
+    assert proxy.rowCount() == 0
@@ -0,0 +1,172 @@
+import os
+import sys
+import socket
+
+import pyblish.api
+from pyblish_lite import control, remote
+
+# Vendor libraries
+from nose.tools import (
+    with_setup,
+    assert_equals
+)
+
+
+def clean():
+    pyblish.api.deregister_all_plugins()
+
+
+def setup_function(function):
+    # `with_setup` is only honoured by nose, clean up for pytest too
+    clean()
+
+
+def drain(connection):
+    """Return messages sent so far"""
+    connection.settimeout(0.2)
+    messages = []
+    while True:
+        message = remote.receive(connection)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_framing():
+    """Messages arrive whole, whatever their size"""
+    a, b = socket.socketpair()
+    message = {"signal": "test", "data": "x" * 100000}
+    try:
+        remote.send(a, message)
+        remote.send(a, {"signal": "next"})
+        assert_equals(remote.receive(b), message)
+        assert_equals(remote.receive(b), {"signal": "next"})
+
+        a.close()
+        assert_equals(remote.receive(b), None)
+    finally:
+        b.close()
+
+
+@with_setup(clean)
+def test_remote():
+    """The window is given results, and the host is given toggles"""
+
+    class CollectModels(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for name in ("A", "B"):
+                instance = context.create_instance(name)
+                instance.data["family"] = "model"
+
+    class Select(pyblish.api.Action):
+        on = "failed"
+
+    class ValidateModels(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["model"]
+        actions = [Select]
+
+        def process(self, instance):
+            self.log.info("Validating %s" % instance)
+            assert instance.name == "A", "Not A"
+
+    for plugin in (CollectModels, ValidateModels):
+        pyblish.api.register_plugin(plugin)
+
+    host_end, window_end = socket.socketpair()
+
+    ctrl = control.Controller()
+    ctrl.frame_budget = 0
+    host = remote.Host(ctrl, host_end)
+    proxy = remote.RemoteController(window_end)
+
+    results = []
+    proxy.was_processed_batch.connect(results.extend)
+    progress = []
+    proxy.io_progress.connect(
+        lambda plugin, instance, value: progress.append(
+            (plugin, instance, value)
+        )
+    )
+
+    try:
+        host.on_message({"command": "reset"})
+        for message in drain(window_end):
+            proxy.on_message(message)
+
+        plugin, = [
+            plugin for plugin in proxy.plugins
+            if plugin.__name__ == "ValidateModels"
+        ]
+        assert_equals(plugin.id, [
+            plugin for plugin in ctrl.plugins
+            if plugin.__name__ == "ValidateModels"
+        ][0].id)
+        assert_equals(plugin.actions[0].on, "failed")
+        assert_equals([i.name for i in proxy.context], ["A", "B"])
+        assert_equals(
+            [i.id for i in proxy.context], [i.id for i in ctrl.context]
+        )
+        assert_equals(proxy.collect_state, 1)
+
+        # Compatibility is known to the window too
+        compatible = proxy.family_index.instances_by_plugin(plugin)
+        assert_equals([i.name for i in compatible], ["A", "B"])
+
+        # Progress of transfers, see `extraction`
+        host.on_io_progress(
+            [p for p in ctrl.plugins if p.id == plugin.id][0],
+            ctrl.context[0],
+            0.5
+        )
+        for message in drain(window_end):
+            proxy.on_message(message)
+        assert_equals(progress, [(plugin, proxy.context[0], 0.5)])
+
+        # Toggled in the window, and sent along with the command
+        proxy.context[1].data["publish"] = False
+        proxy.context.data["comment"] = "Remote"
+        proxy.validate()
+        for message in drain(host_end):
+            host.on_message(message)
+        for message in drain(window_end):
+            proxy.on_message(message)
+    finally:
+        host.close()
+        proxy.close()
+
+    assert_equals(ctrl.context, None)
+
+    validated = [
+        result for result in results
+        if result["plugin"] is plugin
+    ]
+    assert_equals(len(validated), 1)
+    assert validated[0]["success"]
+    assert validated[0]["instance"] is proxy.context[0]
+    assert_equals(
+        validated[0]["records"][0]["msg"], "Validating A"
+    )
+    assert_equals(proxy.context.data["comment"], "Remote")
+    assert not proxy.is_running
+
+
+@with_setup(clean)
+def test_show_within_application():
+    """The window requires an interpreter when hosted by an application"""
+
+    executable = sys.executable
+    remote_executable = os.environ.pop("PYBLISH_REMOTE_EXECUTABLE", None)
+    sys.executable = os.path.join("bin", "maya.exe")
+    try:
+        remote.show()
+    except RuntimeError as e:
+        assert "PYBLISH_REMOTE_EXECUTABLE" in str(e), e
+    else:
+        assert False, "The window was shown with maya.exe"
+    finally:
+        sys.executable = executable
+        if remote_executable is not None:
+            os.environ["PYBLISH_REMOTE_EXECUTABLE"] = remote_executable
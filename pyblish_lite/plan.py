@@ -0,0 +1,176 @@
+"""Plan of what is processed, compiled from plug-ins and instances
+
+Processing steps through plug-ins in order, each with the instances it
+is compatible with. Rather than working this out again for every
+plug-in as it comes up, along with the group it is in and whether
+validation is passed, a plan is compiled once up front.
+
+- Steps: One per plug-in, with its instances, or whether a context
+  plug-in is compatible
+- Boundaries: Indexes of steps entering another group, see
+  `util.OrderGroups`
+- Validation: Index of the first step past validation
+
+Instances are only known once collected, hence steps are compiled again
+whenever the instances, or their families, change. Each step notes the
+`util.FamilyIndex.version` it was compiled at, and is compiled again
+when next stepped on if out of date. Toggles of instances change the
+index as well, toggles of plug-ins and instances are looked at as each
+step is processed.
+
+A plan can be printed, to see what will run and in which group.
+
+    >>> print(controller.plan)  # doctest: +SKIP
+    Validate
+      ValidateNormals: A, B
+    Extract
+      ExtractModel: A, B
+      ExtractCamera (skipped)
+
+"""
+import bisect
+
+
+class Step(object):
+    """Plug-in of a plan, with what it is to process
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to process
+        group (float): Order of group of `plugin`, None for the last
+
+    """
+
+    __slots__ = ("plugin", "group", "instances", "compatible", "version")
+
+    def __init__(self, plugin, group):
+        self.plugin = plugin
+        self.group = group
+
+        # Instances of an instance plug-in, None for context plug-ins
+        self.instances = None
+        self.compatible = False
+
+        # Of the family index, when last compiled
+        self.version = None
+
+
+class ExecutionPlan(object):
+    """Steps of plug-ins left to process
+
+    Arguments:
+        plugins (list): Plug-ins to process, in order
+        family_index (util.FamilyIndex): Index of instances to process
+        groups (dict): Names of groups by order, see `util.OrderGroups`
+        current_group (float): Order of group processing is in
+        validation_order (float): Order past which validation is done
+
+    """
+
+    def __init__(self, plugins, family_index, groups, current_group,
+                 validation_order):
+        self.family_index = family_index
+        self.groups = groups
+
+        orders = sorted(order for order in groups if order is not None)
+
+        self.steps = []
+        self.boundaries = {}
+        self.validation_index = None
+
+        group = current_group
+        for index, plugin in enumerate(plugins):
+            position = bisect.bisect_left(orders, plugin.order)
+            step = Step(
+                plugin, orders[position] if position < len(orders) else None
+            )
+
+            if group is not None and plugin.order > group:
+                self.boundaries[index] = step.group
+                group = step.group
+
+            if self.validation_index is None and (
+                plugin.order > validation_order
+            ):
+                self.validation_index = index
+
+            self.steps.append(step)
+
+        if self.validation_index is None:
+            self.validation_index = len(self.steps)
+
+        # Index of the next step to process
+        self.position = 0
+
+    def __len__(self):
+        return len(self.steps)
+
+    def step(self, index):
+        """Return step at `index`, compiled anew if out of date"""
+        step = self.steps[index]
+        if step.version != self.family_index.version:
+            self.compile(step)
+        return step
+
+    def compile(self, step):
+        """Work out what `step` is to process, given current instances"""
+        step.version = self.family_index.version
+
+        plugin = step.plugin
+        if plugin.__instanceEnabled__:
+            step.instances = self.family_index.instances_by_plugin(plugin)
+            step.compatible = bool(step.instances)
+        else:
+            step.compatible = self.family_index.is_compatible(plugin)
+
+    def refresh(self):
+        """Compile steps left to process which are out of date"""
+        for index in range(self.position, len(self.steps)):
+            self.step(index)
+
+    def describe(self):
+        """Return steps left to process, as dictionaries
+
+        Each of group name, plug-in, instance names, whether the
+        plug-in is compatible and whether it is active.
+        """
+
+        self.refresh()
+
+        steps = []
+        for step in self.steps[self.position:]:
+            plugin = step.plugin
+            instances = None
+            if step.instances is not None:
+                instances = [
+                    instance.data["name"] for instance in step.instances
+                    if instance.data.get("publish") is not False
+                ]
+
+            steps.append({
+                "group": self.groups.get(step.group),
+                "plugin": getattr(plugin, "label", None) or plugin.__name__,
+                "instances": instances,
+                "compatible": step.compatible,
+                "active": plugin.active,
+            })
+
+        return steps
+
+    def __str__(self):
+        lines = []
+        group = None
+        for step in self.describe():
+            if step["group"] != group or not lines:
+                group = step["group"]
+                lines.append(str(group))
+
+            line = "  %s" % step["plugin"]
+            if not step["active"]:
+                line += " (inactive)"
+            elif not step["compatible"]:
+                line += " (skipped)"
+            elif step["instances"] is not None:
+                line += ": %s" % ", ".join(step["instances"])
+            lines.append(line)
+
+        return "\n".join(lines)
@@ -0,0 +1,190 @@
+"""Process plug-ins in worker processes
+
+Plug-ins doing heavy pure-Python work gain nothing from threads, as
+they are held back by the GIL. Those opting in with `process_pool = True`
+are instead run in a separate process, given a copy of only the data
+they declare to need.
+
+    class ValidateNames(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        process_pool = True
+        context_keys = ["excluded_nodes"]
+        instance_keys = ["nodes"]
+
+The worker imports the plug-in anew, from the file it was discovered
+in or the module it was defined in, and processes it against a context
+and instance holding the declared data. Only the outcome is sent back;
+records, errors, timings. Anything else the plug-in changes, such as
+its data or class attributes, remains in the worker.
+
+"""
+import os
+import sys
+import types
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pyblish.api
+import pyblish.plugin
+
+from . import util
+
+# Plug-ins already imported by this worker, by (source, name)
+_plugins = {}
+
+
+def plugin_source(plugin):
+    """Return where a worker may import `plugin` from, or None
+
+    Plug-ins discovered from a path carry their file as module,
+    others must be defined at the top of an importable module.
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to locate
+
+    """
+
+    source = plugin.__module__
+    if os.path.isfile(source):
+        return source
+
+    if source == "__main__" or source not in sys.modules:
+        return None
+
+    if "<locals>" in getattr(plugin, "__qualname__", ""):
+        return None
+
+    return source
+
+
+def is_poolable(plugin):
+    """Return whether pairs of `plugin` may be processed in a worker
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to inspect
+
+    """
+
+    return bool(
+        getattr(plugin, "process_pool", False)
+        and plugin.__instanceEnabled__
+        and plugin_source(plugin) is not None
+    )
+
+
+def executable():
+    """Return Python interpreter to spawn workers with, or None
+
+    When hosted within an application, `sys.executable` is the
+    application itself, and the interpreter is taken from environment
+    variable "PYBLISH_POOL_EXECUTABLE", e.g. mayapy. Without it,
+    there is no interpreter to spawn.
+
+    """
+
+    return (
+        os.getenv("PYBLISH_POOL_EXECUTABLE")
+        or (sys.executable if util.is_python(sys.executable) else None)
+    )
+
+
+def executor(max_workers):
+    """Return pool of `max_workers` processes
+
+    Workers are spawned rather than forked, as a fork of a running
+    Qt application is not safe. The interpreter spawned is that of
+    `executable`.
+
+    Arguments:
+        max_workers (int): Number of processes
+
+    """
+
+    context = multiprocessing.get_context("spawn")
+
+    interpreter = executable()
+    if interpreter:
+        context.set_executable(interpreter)
+
+    return ProcessPoolExecutor(max_workers, mp_context=context)
+
+
+def submit(pool, plugin, context, instance):
+    """Submit processing of `plugin` and `instance` to `pool`
+
+    Arguments:
+        pool (ProcessPoolExecutor): Pool, as returned by `executor`
+        plugin (pyblish.api.Plugin): Plug-in to process
+        context (pyblish.api.Context): Context of `instance`
+        instance (pyblish.api.Instance): Instance to process
+
+    """
+
+    context_data = dict(
+        (key, context.data[key])
+        for key in getattr(plugin, "context_keys", ())
+        if key in context.data
+    )
+
+    instance_data = dict(
+        (key, instance.data[key])
+        for key in getattr(plugin, "instance_keys", ())
+        if key in instance.data
+    )
+
+    return pool.submit(
+        _process,
+        plugin_source(plugin),
+        plugin.__name__,
+        context_data,
+        instance.data["name"],
+        instance_data,
+    )
+
+
+def _load(source, name):
+    key = (source, name)
+    if key not in _plugins:
+        if os.path.isfile(source):
+            module = types.ModuleType(name)
+            module.__file__ = source
+            with open(source) as f:
+                code = compile(f.read(), source, "exec")
+            exec(code, module.__dict__)
+
+            # As `pyblish.api.discover` does
+            getattr(module, name).__module__ = source
+        else:
+            module = importlib.import_module(source)
+
+        _plugins[key] = getattr(module, name)
+
+    return _plugins[key]
+
+
+def _process(source, name, context_data, instance_name, instance_data):
+    # Runs in the worker process
+    plugin = _load(source, name)
+
+    context = pyblish.api.Context()
+    context.data.update(context_data)
+    instance = context.create_instance(instance_name)
+    instance.data.update(instance_data)
+
+    with util.measure() as measurement:
+        result = pyblish.plugin.process(plugin, context, instance)
+    error = result["error"]
+
+    return {
+        "success": result["success"],
+        "duration": result["duration"],
+        "wall_time": measurement["wall_time"],
+        "cpu_time": measurement["cpu_time"],
+        "memory": measurement["memory"],
+        "records": [
+            util.record_to_dict(record)
+            for record in result["records"]
+        ],
+        "error": None if error is None else util.error_to_dict(error),
+    }
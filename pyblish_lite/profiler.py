@@ -0,0 +1,298 @@
+"""Profile plug-ins whilst processing
+
+Enabled by setting environment variable "PYBLISH_PROFILE" to either
+
+- "cprofile", tracing every call with `cProfile`, or
+- "sampling", taking a sample of the stack of the processing thread
+  every "PYBLISH_PROFILE_INTERVAL" milliseconds, 5 by default. Slower
+  to reveal short calls, but barely slows processing down.
+
+Stats are gathered per plug-in, across all of its pairs, until the next
+reset. Whenever processing stops, they are written to the directory of
+"PYBLISH_PROFILE_DIR", a temporary directory by default, as
+`<module>.<plug-in>.pstats` along with a report of hot-spots as
+`<module>.<plug-in>.txt`, see `file_name`. The same goes for all
+plug-ins together, as `publish.pstats`.
+
+    $ python -m pstats /tmp/pyblish_profile/validate_names.ValidateNames.pstats
+    $ snakeviz /tmp/pyblish_profile/publish.pstats
+
+Plug-ins processed in worker processes, see `pool`, are not profiled.
+
+"""
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import tempfile
+import threading
+import contextlib
+import collections
+
+import pyblish.plugin
+
+from . import util
+
+# Hot-spots listed in reports
+report_limit = 30
+
+
+def from_environment():
+    """Return profiler as configured by environment, or None"""
+    mode = os.getenv("PYBLISH_PROFILE", "").lower()
+    if not mode:
+        return None
+
+    directory = os.getenv("PYBLISH_PROFILE_DIR") or os.path.join(
+        tempfile.gettempdir(), "pyblish_profile"
+    )
+
+    if mode == "sampling":
+        interval = float(os.getenv("PYBLISH_PROFILE_INTERVAL", 5))
+        return SamplingProfiler(directory, interval / 1000.0)
+
+    if mode == "cprofile":
+        return Profiler(directory)
+
+    util.u_print("Unknown PYBLISH_PROFILE \"%s\", not profiling." % mode)
+    return None
+
+
+def file_name(plugin):
+    """Return name of the files of `plugin`, without extension
+
+    Plug-ins discovered from a path, see `pyblish.api.discover`, have
+    the path of their file as module, of which only the name is taken.
+
+    """
+
+    module = plugin.__module__ or ""
+    if os.path.isabs(module) or module.endswith(".py"):
+        module = os.path.splitext(os.path.basename(module))[0]
+    return "%s.%s" % (module, plugin.__name__)
+
+
+class Profiler(object):
+    """Stats of plug-ins, as profiled by `cProfile`
+
+    Arguments:
+        directory (str): Where to write stats and reports
+
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.stats = {}
+
+        # Names of files of plug-ins, by id, see `file_name`
+        self.names = {}
+
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def profile(self, plugin):
+        """Profile the block as processing of `plugin`"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is active, e.g. a debugger
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.add(plugin, profile)
+
+    def add(self, plugin, profile):
+        """Add stats of `profile` to those of `plugin`"""
+        try:
+            stats = pstats.Stats(profile)
+        except TypeError:
+            # Nothing was profiled, e.g. too quick to be sampled
+            return
+
+        with self._lock:
+            self.names[plugin.id] = file_name(plugin)
+            if plugin.id in self.stats:
+                self.stats[plugin.id].add(stats)
+            else:
+                self.stats[plugin.id] = stats
+
+    def total(self):
+        """Return stats of all plug-ins together, or None"""
+        with self._lock:
+            stats = list(self.stats.values())
+
+        if not stats:
+            return None
+
+        total = pstats.Stats()
+        for plugin_stats in stats:
+            total.add(plugin_stats)
+        return total
+
+    def report(self, plugin_id=None):
+        """Return hot-spots of plug-in of `plugin_id`, or all plug-ins
+
+        Arguments:
+            plugin_id (str, optional): Id of plug-in, None for all
+
+        """
+
+        if plugin_id is None:
+            stats = self.total()
+        else:
+            stats = self.stats.get(plugin_id)
+
+        if stats is None:
+            return ""
+
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats("tottime", "cumulative").print_stats(report_limit)
+        stats.stream = sys.stdout
+        return stream.getvalue()
+
+    def write(self):
+        """Write stats and reports of every plug-in and all together
+
+        Returns:
+            list: Paths of stats written
+
+        """
+
+        if not self.stats:
+            return []
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        stats = [("publish", None, self.total())]
+        with self._lock:
+            for plugin_id, plugin_stats in self.stats.items():
+                stats.append((self.names[plugin_id], plugin_id, plugin_stats))
+
+        paths = []
+        for name, plugin_id, plugin_stats in stats:
+            path = os.path.join(self.directory, name + ".pstats")
+            plugin_stats.dump_stats(path)
+            with open(os.path.join(self.directory, name + ".txt"), "w") as f:
+                f.write(self.report(plugin_id))
+            paths.append(path)
+
+        return paths
+
+
+class SamplingProfiler(Profiler):
+    """Stats of plug-ins, as sampled from the stack of processing threads
+
+    Samples are stored as `pstats` would store calls, such that the
+    same tools apply. Number of calls are the number of samples a
+    function appeared in, times are estimated from the interval.
+
+    Arguments:
+        directory (str): Where to write stats and reports
+        interval (float): Seconds between samples
+
+    """
+
+    def __init__(self, directory, interval=0.005):
+        super(SamplingProfiler, self).__init__(directory)
+        self.interval = interval
+
+        # Samples, by id of processing thread
+        self._threads = {}
+        self._sampler = None
+
+    @contextlib.contextmanager
+    def profile(self, plugin):
+        ident = threading.current_thread().ident
+        samples = Samples(self.interval)
+        with self._lock:
+            self._threads[ident] = samples
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample)
+                self._sampler.daemon = True
+                self._sampler.start()
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._threads.pop(ident)
+            self.add(plugin, samples)
+
+    def _sample(self):
+        # Runs for as long as any thread is processing
+        while True:
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                if not self._threads:
+                    self._sampler = None
+                    return
+
+                for ident, samples in self._threads.items():
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        samples.sample(frame)
+
+
+class Samples(object):
+    """Samples of a stack, in the form of `cProfile.Profile.stats`
+
+    Only frames from `pyblish.plugin.process` down are sampled.
+
+    Arguments:
+        interval (float): Seconds between samples
+
+    """
+
+    root = pyblish.plugin.process.__code__
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.own = collections.Counter()
+        self.cumulative = collections.Counter()
+        self.callers = collections.defaultdict(collections.Counter)
+        self.stats = {}
+
+    def sample(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            if code is self.root:
+                break
+            frame = frame.f_back
+        else:
+            # Not yet, or no longer, processing
+            return
+
+        self.own[stack[0]] += 1
+        for function in set(stack):
+            self.cumulative[function] += 1
+        for callee, caller in zip(stack, stack[1:]):
+            self.callers[callee][caller] += 1
+
+    def create_stats(self):
+        # As called upon by `pstats.Stats`
+        interval = self.interval
+        self.stats = {}
+        for function, count in self.cumulative.items():
+            callers = dict(
+                (caller, (n, n, n * interval, n * interval))
+                for caller, n in self.callers[function].items()
+            )
+            self.stats[function] = (
+                count,
+                count,
+                self.own[function] * interval,
+                count * interval,
+                callers,
+            )
@@ -0,0 +1,245 @@
+"""Records of the terminal, kept within a bounded amount of memory
+
+Records are kept as tuples of their fields, see `pack`. The most recent
+"PYBLISH_TERMINAL_RECORDS" of them, 10000 by default, are held in memory
+in a ring buffer. Older records are written to an archive on disk, a
+temporary file in "PYBLISH_RECORDS_DIR" if set, and read back through a
+memory map when asked for, such as when scrolled to in the terminal.
+0 or less holds every record in memory.
+
+    store = RecordStore()
+    added = store.extend(records)
+    added[0]  # Record as a dictionary, see `util.record_to_dict`
+
+Slices of a store, such as those returned by `extend`, are sequences of
+its records, which remain valid as the records are archived.
+
+"""
+import os
+import json
+import mmap
+import array
+import tempfile
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+# Fields of records, of `util.record_to_dict` and `util.error_to_dict`
+fields = (
+    "type",
+    "label",
+    "levelno",
+    "levelname",
+    "name",
+    "instance",
+    "msg",
+    "filename",
+    "pathname",
+    "lineno",
+    "func",
+    "threadName",
+    "msecs",
+    "traceback",
+)
+
+
+def pack(record):
+    """Return `record` as a tuple of `fields`"""
+    return tuple(record.get(field) for field in fields)
+
+
+def unpack(packed):
+    """Return record of `packed`, as a dictionary"""
+    return dict(
+        (field, value)
+        for field, value in zip(fields, packed)
+        if value is not None
+    )
+
+
+class RecordStore(object):
+    """Records in a ring buffer, with older records archived on disk
+
+    Arguments:
+        capacity (int, optional): Records held in memory at most, 0 or
+            less for every record. Defaults to "PYBLISH_TERMINAL_RECORDS"
+        directory (str, optional): Directory of the archive. Defaults
+            to "PYBLISH_RECORDS_DIR", or the temporary directory
+
+    """
+
+    def __init__(self, capacity=None, directory=None):
+        if capacity is None:
+            capacity = int(os.getenv("PYBLISH_TERMINAL_RECORDS", 10000))
+
+        self.capacity = capacity
+        self.directory = directory or os.getenv("PYBLISH_RECORDS_DIR")
+
+        # Records in memory, from the oldest at `_head` once full
+        self._ring = []
+        self._head = 0
+
+        # Index of the oldest record in memory, records before are archived
+        self._first = 0
+
+        # Archive, with offsets of each record in it and the end
+        self._archive = None
+        self._offsets = array.array("Q", [0])
+        self._map = None
+
+    def __len__(self):
+        return self._first + len(self._ring)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        if index < self._first:
+            return self._read(index)
+
+        position = self._head + index - self._first
+        return unpack(self._ring[position % len(self._ring)])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def archived(self):
+        """Number of records archived on disk"""
+        return self._first
+
+    def append(self, record):
+        """Add `record`, returning its index"""
+        packed = pack(record)
+
+        if self.capacity <= 0 or len(self._ring) < self.capacity:
+            self._ring.append(packed)
+        else:
+            self._spill(self._ring[self._head])
+            self._ring[self._head] = packed
+            self._head = (self._head + 1) % len(self._ring)
+            self._first += 1
+
+        return len(self) - 1
+
+    def extend(self, records):
+        """Add `records`, returning the slice of the store they are in"""
+        start = len(self)
+        for record in records:
+            self.append(record)
+        return RecordSlice(self, start, len(self))
+
+    def _spill(self, packed):
+        if self._archive is None:
+            self._archive = tempfile.TemporaryFile(
+                prefix="pyblish_lite_records_", dir=self.directory
+            )
+
+        line = json.dumps(packed).encode("utf-8") + b"\n"
+        self._archive.write(line)
+        self._offsets.append(self._offsets[-1] + len(line))
+
+        # Mapped anew once read, to cover what was written since
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _read(self, index):
+        if self._map is None:
+            self._archive.flush()
+            self._map = mmap.mmap(
+                self._archive.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return unpack(json.loads(self._map[start:end].decode("utf-8")))
+
+    def clear(self):
+        """Remove every record, and the archive"""
+        self.close()
+        self._ring = []
+        self._head = 0
+        self._first = 0
+        self._offsets = array.array("Q", [0])
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class RecordSlice(Sequence):
+    """Records of `store` from `start` up to `stop`"""
+
+    def __init__(self, store, start, stop):
+        self.store = store
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        return self.store[self.start + index]
+
+
+class RecordChain(Sequence):
+    """Records of several sequences, one after the other
+
+    Used for the records of a plug-in or instance, gathered from the
+    slices of each of its results rather than copied.
+    """
+
+    def __init__(self, sequences=None):
+        self.sequences = list(sequences or [])
+
+    def __len__(self):
+        return sum(len(sequence) for sequence in self.sequences)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if index >= 0:
+            for sequence in self.sequences:
+                if index < len(sequence):
+                    return sequence[index]
+                index -= len(sequence)
+
+        raise IndexError("record index out of range")
+
+    def __iter__(self):
+        for sequence in self.sequences:
+            for record in sequence:
+                yield record
+
+    def extend(self, records):
+        if not isinstance(records, RecordSlice):
+            records = list(records)
+        if records:
+            self.sequences.append(records)
@@ -0,0 +1,758 @@
+"""Run the window in a process of its own, processing in the host
+
+Painting thousands of rows takes time away from the host, e.g. the main
+thread of Maya. Instead, plug-ins may be processed by a :class:`Host`
+within the host, whilst the window runs in a separate Python process
+driven by a :class:`RemoteController`.
+
+    from pyblish_lite import remote
+    remote.show()
+
+The window is started by the interpreter of environment variable
+"PYBLISH_REMOTE_EXECUTABLE", defaulting to that of the host, and
+required when the host is an application rather than an interpreter,
+e.g. mayapy for maya.exe. It connects to the host on "PYBLISH_CLIENT_PORT", a free port by default.
+
+Both talk over a local socket, with messages of JSON framed by their
+length. The host sends signals of its controller along with what they
+carry, such as results, and the window sends commands along with what
+the user toggled. Results are sent as batches, see `was_processed_batch`,
+and instances only as they are created or change, such that what the
+host does per pair is little more than serializing its result.
+
+"""
+import os
+import sys
+import json
+import socket
+import struct
+import threading
+import subprocess
+
+from .vendor.Qt import QtCore
+
+import pyblish.api
+
+from . import asynchronous, control, tracking, util
+from .constants import InstanceStates
+
+# Length of a message, preceding it
+header = struct.Struct(">I")
+
+# Data of instances and context the window shows
+entity_keys = (
+    "name",
+    "label",
+    "family",
+    "families",
+    "publish",
+    "icon",
+    "comment",
+)
+
+# Data of the context the window may change
+context_keys = ("comment", "intent")
+
+self = sys.modules[__name__]
+
+# Host of the currently opened window
+self._server = None
+
+
+def send(connection, message):
+    """Send `message` over `connection`, framed by its length"""
+    payload = json.dumps(
+        message, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    connection.sendall(header.pack(len(payload)) + payload)
+
+
+def _receive(connection, size):
+    chunks = []
+    while size:
+        chunk = connection.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def receive(connection):
+    """Return next message of `connection`, or None once closed"""
+    try:
+        data = _receive(connection, header.size)
+        if data is None:
+            return None
+
+        payload = _receive(connection, header.unpack(data)[0])
+    except (IOError, OSError):
+        return None
+
+    if payload is None:
+        return None
+    return json.loads(payload.decode("utf-8"))
+
+
+def format_entity(entity):
+    return {
+        "id": entity.id,
+        "optional": getattr(entity, "optional", True),
+        "data": dict(
+            (key, entity.data[key])
+            for key in entity_keys
+            if key in entity.data
+        ),
+    }
+
+
+def format_action(action):
+    return {
+        "id": action.id,
+        "name": action.__name__,
+        "type": action.__type__,
+        "label": action.label,
+        "on": action.on,
+        "icon": action.icon,
+        "active": action.active,
+    }
+
+
+def format_plugin(plugin):
+    return {
+        "id": plugin.id,
+        "name": plugin.__name__,
+        "module": plugin.__module__,
+        "doc": plugin.__doc__,
+        "instance": bool(plugin.__instanceEnabled__),
+        "order": plugin.order,
+        "label": getattr(plugin, "label", None),
+        "families": list(plugin.families),
+        "match": plugin.match,
+        "optional": getattr(plugin, "optional", False),
+        "active": plugin.active,
+        "icon": getattr(plugin, "icon", None),
+        "actions": [
+            format_action(action)
+            for action in getattr(plugin, "actions", None) or ()
+        ],
+    }
+
+
+def format_result(result):
+    instance = result["instance"]
+    data = util.serialize_result(result)
+    data["plugin_id"] = result["plugin"].id
+    data["instance_id"] = None if instance is None else instance.id
+    return data
+
+
+class Connection(QtCore.QObject):
+    """Either end of a connection, handling messages in the main thread
+
+    Messages are received by a thread of their own, and handed to
+    `on_message` once control returns to the Qt event loop.
+
+    Arguments:
+        connection (socket.socket): Connected socket
+
+    """
+
+    received = QtCore.Signal(object)
+
+    def __init__(self, connection, parent=None):
+        super(Connection, self).__init__(parent)
+        self.connection = connection
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self.received.connect(self.on_message)
+
+    def listen(self):
+        """Start receiving messages"""
+        self._thread = threading.Thread(target=self._listen)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _listen(self):
+        while True:
+            message = receive(self.connection)
+            self.received.emit(message)
+            if message is None:
+                return
+
+    def send(self, message):
+        with self._lock:
+            try:
+                send(self.connection, message)
+            except (IOError, OSError):
+                # The other end is gone, as is noted by `_listen`
+                pass
+
+    def close(self):
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except (IOError, OSError):
+            pass
+        self.connection.close()
+
+    def on_message(self, message):
+        """Handle `message` of the other end, None once it is gone"""
+        pass
+
+
+class Host(Connection):
+    """Process plug-ins on behalf of a remote window
+
+    Signals of `controller` are sent to the window, and commands of
+    the window are run by `controller`.
+
+    Arguments:
+        controller (control.Controller): Controller to run
+        connection (socket.socket): Connection to the window
+
+    """
+
+    def __init__(self, controller, connection, parent=None):
+        super(Host, self).__init__(connection, parent)
+        self.controller = controller
+        self.plugins = {}
+
+        # Data of instances as last sent, by id
+        self.sent = {}
+
+        controller.was_reset.connect(self.on_was_reset)
+        controller.about_to_process.connect(self.on_about_to_process)
+        controller.was_processed_batch.connect(
+            self.on_was_processed_batch
+        )
+        controller.passed_group.connect(self.on_passed_group)
+        controller.switch_toggleability.connect(
+            self.on_switch_toggleability
+        )
+        controller.was_skipped.connect(self.on_was_skipped)
+        controller.was_acted.connect(self.on_was_acted)
+        controller.about_to_revalidate.connect(self.on_about_to_revalidate)
+        controller.io_progress.connect(self.on_io_progress)
+        controller.was_stopped.connect(self.on_was_stopped)
+        controller.was_finished.connect(self.on_was_finished)
+
+    def forward(self, signal, **kwargs):
+        controller = self.controller
+        kwargs["signal"] = signal
+        kwargs["state"] = {
+            "is_running": controller.is_running,
+            "errored": controller.errored,
+            "validated": controller.validated,
+            "collect_state": controller.collect_state,
+        }
+        self.send(kwargs)
+
+    def instance_changes(self):
+        """Return instances created or changed, and ids of removed ones"""
+        changed = []
+        current = {}
+        for instance in self.controller.context:
+            data = format_entity(instance)
+            current[instance.id] = data
+            if self.sent.get(instance.id) != data:
+                changed.append(data)
+
+        removed = [
+            instance_id for instance_id in self.sent
+            if instance_id not in current
+        ]
+        self.sent = current
+        return {"instances": changed, "removed": removed}
+
+    def on_message(self, message):
+        if message is None:
+            return self.close()
+
+        command = message["command"]
+        self.apply(message.get("toggles") or {})
+
+        if command == "act":
+            plugin = self.plugins[message["plugin"]]
+            action, = [
+                action for action in plugin.actions
+                if action.id == message["action"]
+            ]
+            self.controller.act(plugin, action)
+
+        elif command == "close":
+            self.close()
+
+        elif command in ("reset", "resume", "validate", "publish",
+                         "revalidate", "stop"):
+            getattr(self.controller, command)()
+
+        else:
+            util.u_print("Unsupported command \"%s\"" % command)
+
+    def apply(self, toggles):
+        """Apply what the user toggled in the window"""
+        context = self.controller.context
+        if context is None:
+            return
+
+        instances = dict((instance.id, instance) for instance in context)
+        for instance_id, publish in toggles.get("instances", {}).items():
+            if instance_id in instances:
+                instances[instance_id].data["publish"] = publish
+
+        for plugin_id, active in toggles.get("plugins", {}).items():
+            if plugin_id in self.plugins:
+                self.plugins[plugin_id].active = active
+
+        context.data.update(toggles.get("context") or {})
+
+    def close(self):
+        self.controller.cleanup()
+        super(Host, self).close()
+
+    def on_was_reset(self):
+        controller = self.controller
+        self.plugins = dict(
+            (plugin.id, plugin) for plugin in controller.plugins
+        )
+        self.sent = {}
+        self.forward(
+            "was_reset",
+            context=format_entity(controller.context),
+            plugins=[format_plugin(plugin) for plugin in controller.plugins],
+            presets=controller.possible_presets,
+            optional_default=controller.optional_default,
+        )
+
+    def on_about_to_process(self, plugin, instance):
+        kwargs = {}
+        if instance is not None and instance.id not in self.sent:
+            # Created since the last batch
+            kwargs = self.instance_changes()
+
+        self.forward(
+            "about_to_process",
+            plugin=plugin.id,
+            instance=None if instance is None else instance.id,
+            **kwargs
+        )
+
+    def on_was_processed_batch(self, results):
+        self.forward(
+            "was_processed_batch",
+            results=[format_result(result) for result in results],
+            **self.instance_changes()
+        )
+
+    def on_passed_group(self, order):
+        self.forward("passed_group", order=order)
+
+    def on_switch_toggleability(self, enabled):
+        self.forward("switch_toggleability", enabled=enabled)
+
+    def on_was_skipped(self, plugin):
+        self.forward("was_skipped", plugin=plugin.id)
+
+    def on_was_acted(self, result):
+        self.forward(
+            "was_acted",
+            result=format_result(result),
+            **self.instance_changes()
+        )
+
+    def on_about_to_revalidate(self, results):
+        self.forward(
+            "about_to_revalidate",
+            results=[format_result(result) for result in results],
+            **self.instance_changes()
+        )
+
+    def on_io_progress(self, plugin, instance, progress):
+        self.forward(
+            "io_progress",
+            plugin=plugin.id,
+            instance=None if instance is None else instance.id,
+            progress=progress,
+        )
+
+    def on_was_stopped(self):
+        self.forward("was_stopped")
+
+    def on_was_finished(self):
+        self.forward("was_finished")
+
+
+class RemoteController(Connection):
+    """Stand-in for `control.Controller` of a remote host
+
+    Plug-ins, the context and its instances are represented by objects
+    of pyblish carrying what the window needs from them, by the ids of
+    the host. Results and records are what `util.deserialize_result`
+    makes of them.
+
+    Arguments:
+        connection (socket.socket): Connection to the host
+
+    """
+
+    # As emitted by `control.Controller`
+    about_to_process = QtCore.Signal(object, object)
+    was_processed = QtCore.Signal(dict)
+    was_processed_batch = QtCore.Signal(list)
+    was_reset = QtCore.Signal()
+    passed_group = QtCore.Signal(object)
+    switch_toggleability = QtCore.Signal(bool)
+    was_acted = QtCore.Signal(dict)
+    was_stopped = QtCore.Signal()
+    was_finished = QtCore.Signal()
+    was_skipped = QtCore.Signal(object)
+    about_to_revalidate = QtCore.Signal(object)
+    io_progress = QtCore.Signal(object, object, float)
+
+    order_groups = util.OrderGroups
+
+    # Processing happens in the host
+    profiler = None
+
+    def __init__(self, connection, parent=None):
+        super(RemoteController, self).__init__(connection, parent)
+        self.context = None
+        self.plugins = []
+        self.family_index = None
+        self.possible_presets = {}
+        self.optional_default = {}
+
+        self.is_running = False
+        self.errored = False
+        self.validated = False
+        self.collect_state = 0
+
+        self._plugins = {}
+        self._instances = {}
+
+    def command(self, command, **kwargs):
+        kwargs["command"] = command
+        kwargs["toggles"] = self.toggles()
+        self.send(kwargs)
+
+    def toggles(self):
+        """Return what the user may have toggled"""
+        if self.context is None:
+            return {}
+
+        return {
+            "instances": dict(
+                (instance.id, instance.data.get("publish", True))
+                for instance in self.context
+            ),
+            "plugins": dict(
+                (plugin.id, plugin.active) for plugin in self.plugins
+            ),
+            "context": dict(
+                (key, self.context.data[key])
+                for key in context_keys
+                if key in self.context.data
+            ),
+        }
+
+    def reset(self):
+        self.is_running = True
+        self.command("reset")
+
+    def resume(self):
+        self.is_running = True
+        self.command("resume")
+
+    def validate(self):
+        self.is_running = True
+        self.command("validate")
+
+    def publish(self):
+        self.is_running = True
+        self.command("publish")
+
+    def revalidate(self):
+        self.is_running = True
+        self.command("revalidate")
+
+    def stop(self):
+        self.command("stop")
+
+    def act(self, plugin, action):
+        self.is_running = True
+        self.command("act", plugin=plugin.id, action=action.id)
+
+    def cleanup(self):
+        self.command("close")
+        self.close()
+
+    # Messages of the host
+
+    def on_message(self, message):
+        if message is None:
+            util.u_print("Lost connection to host")
+            self.is_running = False
+            return self.was_stopped.emit()
+
+        for key, value in message["state"].items():
+            setattr(self, key, value)
+
+        self.apply_instances(message)
+        getattr(self, "on_" + message["signal"])(message)
+
+    def apply_instances(self, message):
+        for data in message.get("instances") or ():
+            instance = self._instances.get(data["id"])
+            if instance is None:
+                instance = pyblish.api.Instance(
+                    data["data"]["name"], parent=self.context
+                )
+                instance._id = data["id"]
+                self._instances[instance.id] = instance
+                self.family_index.add(instance)
+            else:
+                self.family_index.invalidate(instance.id)
+
+            instance.optional = data["optional"]
+            instance.data.update(data["data"])
+
+        removed = set(message.get("removed") or ())
+        if removed:
+            self.context[:] = [
+                instance for instance in self.context
+                if instance.id not in removed
+            ]
+            for instance_id in removed:
+                self._instances.pop(instance_id, None)
+                self.family_index.remove(instance_id)
+
+    def result(self, data):
+        instance = data["instance_id"]
+        if instance is not None:
+            instance = self._instances[instance]
+
+        result = util.deserialize_result(
+            data, self._plugins[data["plugin_id"]], self.context, instance
+        )
+        result["cached"] = data.get("cached", False)
+        return result
+
+    def on_was_reset(self, message):
+        context = tracking.TrackedContext()
+        context._id = message["context"]["id"]
+        context._publish_states = InstanceStates.ContextType
+        context.optional = False
+        context.families = ("__context__",)
+        context.data.update(message["context"]["data"])
+
+        self.context = context
+        self.family_index = util.FamilyIndex(context)
+        self._instances = {}
+        self.plugins = [
+            self.create_plugin(data) for data in message["plugins"]
+        ]
+        self._plugins = dict(
+            (plugin.id, plugin) for plugin in self.plugins
+        )
+        self.possible_presets = message["presets"] or {}
+        self.optional_default = message["optional_default"] or {}
+        self.order_groups.reset()
+
+        self.was_reset.emit()
+
+    def create_plugin(self, data):
+        """Return stand-in of plug-in of `data`, see `format_plugin`"""
+        if data["instance"]:
+            base = pyblish.api.InstancePlugin
+        else:
+            base = pyblish.api.ContextPlugin
+
+        plugin = type(str(data["name"]), (base,), {
+            "__module__": data["module"],
+            "__doc__": data["doc"],
+            "order": data["order"],
+            "label": data["label"],
+            "families": data["families"],
+            "match": data["match"],
+            "optional": data["optional"],
+            "active": data["active"],
+            "icon": data["icon"],
+            "actions": [
+                self.create_action(action) for action in data["actions"]
+            ],
+        })
+        plugin._id = data["id"]
+        return plugin
+
+    def create_action(self, data):
+        action = type(str(data["name"]), (pyblish.api.Action,), {
+            "__type__": data["type"],
+            "label": data["label"],
+            "on": data["on"],
+            "icon": data["icon"],
+            "active": data["active"],
+        })
+        action._id = data["id"]
+        return action
+
+    def on_about_to_process(self, message):
+        instance = message["instance"]
+        if instance is not None:
+            instance = self._instances[instance]
+        self.about_to_process.emit(self._plugins[message["plugin"]], instance)
+
+    def on_was_processed_batch(self, message):
+        results = [self.result(data) for data in message["results"]]
+        for result in results:
+            self.was_processed.emit(result)
+        self.was_processed_batch.emit(results)
+
+    def on_passed_group(self, message):
+        self.passed_group.emit(message["order"])
+
+    def on_switch_toggleability(self, message):
+        self.switch_toggleability.emit(message["enabled"])
+
+    def on_was_skipped(self, message):
+        self.was_skipped.emit(self._plugins[message["plugin"]])
+
+    def on_was_acted(self, message):
+        result = self.result(message["result"])
+        self.was_acted.emit(result)
+
+    def on_about_to_revalidate(self, message):
+        # Discard results as the host did
+        discarded = set(
+            (data["plugin_id"], data["instance_id"])
+            for data in message["results"]
+        )
+
+        results = self.context.data.get("results") or []
+        kept = []
+        removed = []
+        for result in results:
+            instance = result["instance"]
+            key = (
+                result["plugin"].id,
+                None if instance is None else instance.id
+            )
+            if result["action"] is None and key in discarded:
+                removed.append(result)
+            else:
+                kept.append(result)
+
+        results[:] = kept
+        self.about_to_revalidate.emit(removed)
+
+    def on_io_progress(self, message):
+        instance = message["instance"]
+        if instance is not None:
+            instance = self._instances.get(instance)
+        self.io_progress.emit(
+            self._plugins[message["plugin"]], instance, message["progress"]
+        )
+
+    def on_was_stopped(self, message):
+        self.was_stopped.emit()
+
+    def on_was_finished(self, message):
+        self.was_finished.emit()
+
+
+class Server(QtCore.QObject):
+    """Accept the connection of a window, and host it
+
+    Arguments:
+        controller (control.Controller): Controller to host with
+
+    """
+
+    accepted = QtCore.Signal(object)
+
+    def __init__(self, controller, parent=None):
+        super(Server, self).__init__(parent)
+        self.controller = controller
+        self.host = None
+
+        port = int(os.getenv("PYBLISH_CLIENT_PORT", 0) or 0)
+        if port < 0:
+            port = 0
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.bind(("127.0.0.1", port))
+        self.socket.listen(1)
+        self.port = self.socket.getsockname()[1]
+
+        self.accepted.connect(self.on_accepted)
+
+    def listen(self):
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def _accept(self):
+        try:
+            connection, address = self.socket.accept()
+        except (IOError, OSError):
+            return
+        finally:
+            self.socket.close()
+
+        self.accepted.emit(connection)
+
+    def on_accepted(self, connection):
+        self.host = Host(self.controller, connection)
+        self.host.listen()
+
+
+def connect(port):
+    """Return controller of the host listening on `port`
+
+    As called upon by the process of the window, see `show`.
+    """
+
+    connection = socket.create_connection(("127.0.0.1", port))
+    controller = RemoteController(connection)
+    controller.listen()
+    return controller
+
+
+def show():
+    """Show window in a separate process, processing in this one
+
+    Returns:
+        subprocess.Popen: Process of the window
+
+    Raises:
+        RuntimeError: When there is no Python interpreter to run the window
+
+    """
+
+    executable = os.getenv("PYBLISH_REMOTE_EXECUTABLE") or sys.executable
+    if not util.is_python(executable):
+        raise RuntimeError(
+            "Cannot run the window with \"%s\", which is not a Python "
+            "interpreter. Set environment variable "
+            "\"PYBLISH_REMOTE_EXECUTABLE\" to one, e.g. mayapy." % executable
+        )
+
+    ctrl = asynchronous.AsyncController()
+    server = Server(ctrl)
+    server.listen()
+    self._server = server
+
+    # Noted in the context, see `Controller.reset_context`
+    ctrl.client_port = server.port
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (root, env.get("PYTHONPATH")) if path
+    )
+
+    return subprocess.Popen(
+        [executable, "-m", "pyblish_lite", "--remote", str(server.port)],
+        env=env
+    )
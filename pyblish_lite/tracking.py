@@ -0,0 +1,250 @@
+"""Track which data plug-ins read and write
+
+During processing, the data of the context and its instances is
+replaced by a dictionary noting which keys the plug-in currently
+processing reads and writes. After an action has changed the scene,
+only plug-ins whose inputs were touched then need to run again.
+
+What an action touched is taken from the host objects it was given,
+by the conventional `items_list` and `items` attributes of an action,
+and matched against the node names held by the data.
+
+"""
+import contextlib
+import contextvars
+import collections
+
+import pyblish.api
+
+from .vendor import six
+
+
+class TrackedData(dict):
+    """Data of an instance, or context, noting access by plug-ins
+
+    Arguments:
+        parent (pyblish.api.Instance): Owner of data
+        tracker (Tracker): Tracker to notify
+        data (dict): Original data
+
+    """
+
+    def __init__(self, parent, tracker, data):
+        super(TrackedData, self).__init__(data)
+        self._parent = parent
+        self._tracker = tracker
+
+    def __call__(self, key=None, default=None):
+        # Backwards compatibility, as per pyblish.plugin._Dict
+        if key is None:
+            return self.copy()
+
+        if key == "name":
+            default = self._parent.name
+
+        return self.get(key, default)
+
+    def __getitem__(self, key):
+        self._tracker.read(self._parent.id, key)
+        return super(TrackedData, self).__getitem__(key)
+
+    def __contains__(self, key):
+        self._tracker.read(self._parent.id, key)
+        return super(TrackedData, self).__contains__(key)
+
+    def get(self, key, default=None):
+        self._tracker.read(self._parent.id, key)
+        return super(TrackedData, self).get(key, default)
+
+    def __setitem__(self, key, value):
+        self._tracker.write(self._parent.id, key)
+        super(TrackedData, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._tracker.write(self._parent.id, key)
+        super(TrackedData, self).__delitem__(key)
+
+    def setdefault(self, key, default=None):
+        self._tracker.read(self._parent.id, key)
+        self._tracker.write(self._parent.id, key)
+        return super(TrackedData, self).setdefault(key, default)
+
+    def pop(self, key, *args):
+        self._tracker.write(self._parent.id, key)
+        return super(TrackedData, self).pop(key, *args)
+
+    def update(self, *args, **kwargs):
+        for key in dict(*args, **kwargs):
+            self._tracker.write(self._parent.id, key)
+        super(TrackedData, self).update(*args, **kwargs)
+
+
+class TrackedContext(pyblish.api.Context):
+    """Context counting changes to which instances it holds
+
+    Instances created, removed or replaced by any means count as
+    a change, such that what was indexed from the context is known
+    to be out of date without comparing every instance, see
+    `util.FamilyIndex`.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.changes = 0
+        super(TrackedContext, self).__init__(*args, **kwargs)
+
+    def _changed(method):
+        def changed(self, *args, **kwargs):
+            self.changes += 1
+            return method(self, *args, **kwargs)
+
+        changed.__name__ = method.__name__
+        changed.__doc__ = method.__doc__
+        return changed
+
+    append = _changed(list.append)
+    extend = _changed(list.extend)
+    insert = _changed(list.insert)
+    remove = _changed(list.remove)
+    pop = _changed(list.pop)
+    clear = _changed(list.clear)
+    sort = _changed(list.sort)
+    reverse = _changed(list.reverse)
+    __setitem__ = _changed(list.__setitem__)
+    __delitem__ = _changed(list.__delitem__)
+    __iadd__ = _changed(list.__iadd__)
+    __imul__ = _changed(list.__imul__)
+
+    del _changed
+
+
+class Tracker(object):
+    """Keys of data read and written, by plug-in
+
+    Keys are noted as (id of instance or context, key).
+
+    """
+
+    # Keys maintained by pyblish itself whilst processing
+    untracked = ("results",)
+
+    def __init__(self):
+        self.reads = collections.defaultdict(set)
+        self.writes = collections.defaultdict(set)
+
+        # Ids of instances created, by plug-in
+        self.creates = collections.defaultdict(set)
+
+        # Plug-in processing, per thread and per asyncio task
+        self._plugin = contextvars.ContextVar("plugin", default=None)
+
+        # Callbacks of `watch`, with the keys they watch
+        self._watchers = []
+
+    def track(self, entity):
+        """Replace data of `entity` by tracked data"""
+        if not isinstance(entity.data, TrackedData):
+            entity._data = TrackedData(entity, self, entity.data)
+
+    @contextlib.contextmanager
+    def processing(self, plugin):
+        """Note access during the context as done by `plugin`"""
+        token = self._plugin.set(plugin)
+        try:
+            yield
+        finally:
+            self._plugin.reset(token)
+
+    def watch(self, keys, callback):
+        """Call `callback` with the owner of any of `keys` as they change
+
+        Values may be changed in place, such as a list of families,
+        hence keys read whilst processing count as changed too.
+
+        Arguments:
+            keys (list): Keys of data to watch
+            callback (callable): Called with id of instance or context
+
+        """
+
+        self._watchers.append((frozenset(keys), callback))
+
+    def _notify(self, owner, key):
+        for keys, callback in self._watchers:
+            if key in keys:
+                callback(owner)
+
+    def read(self, owner, key):
+        plugin = self._plugin.get()
+        if plugin is None:
+            return
+
+        self._notify(owner, key)
+        if key not in self.untracked:
+            self.reads[plugin].add((owner, key))
+
+    def write(self, owner, key):
+        self._notify(owner, key)
+        plugin = self._plugin.get()
+        if plugin is not None and key not in self.untracked:
+            self.writes[plugin].add((owner, key))
+
+    def created(self, plugin, instance):
+        """Note `instance` and all of its data as created by `plugin`"""
+        self.creates[plugin].add(instance.id)
+        self.writes[plugin].update((instance.id, key) for key in instance.data)
+        self.track(instance)
+
+    def dirty_keys(self, context, nodes):
+        """Return keys of data in `context` holding any of `nodes`
+
+        Arguments:
+            context (pyblish.api.Context): Context and instances to search
+            nodes (set): Names of host objects
+
+        """
+
+        dirty = set()
+        if not nodes:
+            return dirty
+
+        for entity in [context] + list(context):
+            for key, value in dict.items(entity.data):
+                if nodes & node_names(value):
+                    dirty.add((entity.id, key))
+
+        return dirty
+
+
+def node_names(value):
+    """Return names of host objects held by `value`
+
+    Strings, and strings within lists and dictionaries, are taken
+    to be names. For full paths, such as "|GEO|body", the short
+    name is included as well.
+
+    """
+
+    if isinstance(value, six.string_types):
+        values = [value]
+    elif isinstance(value, dict):
+        values = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        values = value
+    else:
+        return set()
+
+    names = set()
+    for name in values:
+        if isinstance(name, six.string_types):
+            names.add(name)
+            names.add(name.rsplit("|", 1)[-1])
+    return names
+
+
+def action_nodes(action):
+    """Return names of host objects `action` was given to act upon"""
+    nodes = set()
+    for attr in ("items_list", "items"):
+        nodes |= node_names(getattr(action, attr, None))
+    return nodes
@@ -3,13 +3,20 @@ from __future__ import (absolute_import, division, print_function,
 
 import os
 import sys
+import time
+import types
+import sysconfig
 import numbers
 import copy
+import contextlib
 import collections
+import tracemalloc
 
 from .vendor.Qt import QtCore
+from .vendor import six
 from .vendor.six import text_type
 import pyblish.api
+import pyblish.logic
 
 root = os.path.dirname(__file__)
 
@@ -50,6 +57,242 @@ def defer(delay, func):
         return func()
 
 
+def schedule(func):
+    """Run `func` once control returns to the Qt event loop
+
+    Arguments:
+        func (callable): Any callable
+
+    """
+
+    return QtCore.QTimer.singleShot(0, func)
+
+
+class FrameBudget(object):
+    """Time slice processing may hold the Qt event loop for
+
+    Pairs are processed back to back until the budget is exhausted,
+    after which the event loop is given the chance to repaint and
+    respond to the user before the next slice is started.
+
+    The budget, in milliseconds, can be set with environment variable
+    "PYBLISH_FRAME_BUDGET". A budget of 0 never yields, which makes
+    processing synchronous; this is the default when "PYBLISH_DELAY"
+    is set to 0 such that tests remain deterministic.
+
+    Arguments:
+        budget (float, optional): Budget in milliseconds
+
+    """
+
+    default_budget = 16
+
+    def __init__(self, budget=None):
+        if budget is None:
+            budget = os.getenv("PYBLISH_FRAME_BUDGET")
+
+        if budget is None:
+            budget = self.default_budget
+            if float(os.getenv("PYBLISH_DELAY", 1)) <= 0:
+                budget = 0
+
+        self.budget = float(budget) / 1000.0
+        self.deadline = None
+
+    def start(self):
+        self.deadline = time.perf_counter() + self.budget
+
+    def exhausted(self):
+        if self.budget <= 0 or self.deadline is None:
+            return False
+        return time.perf_counter() >= self.deadline
+
+
+# CPU time of the calling thread, such that plug-ins processed
+# alongside each other are not counted towards one another
+thread_time = getattr(time, "thread_time", time.process_time)
+
+
+@contextlib.contextmanager
+def measure():
+    """Measure wall time, CPU time and peak memory of the block
+
+    Yields a dictionary, filled in once the block is done. Memory is only
+    measured whilst `tracemalloc` is tracing, as the peak allocated above
+    what was allocated beforehand. As the peak is that of the process,
+    it is approximate for plug-ins processed alongside each other.
+
+        with measure() as measurement:
+            plugin.process(instance)
+
+    """
+
+    measurement = {"wall_time": None, "cpu_time": None, "memory": None}
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        before = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    wall_time = time.perf_counter()
+    cpu_time = thread_time()
+    try:
+        yield measurement
+    finally:
+        measurement["wall_time"] = time.perf_counter() - wall_time
+        measurement["cpu_time"] = thread_time() - cpu_time
+        if tracing:
+            peak = tracemalloc.get_traced_memory()[1]
+            measurement["memory"] = max(0, peak - before)
+
+
+def format_duration(seconds):
+    if seconds < 1:
+        return "%d ms" % round(seconds * 1000)
+    return "%.1f s" % seconds
+
+
+def format_size(size):
+    if size < 1024:
+        return "%d B" % size
+
+    for unit in ("KB", "MB"):
+        size /= 1024.0
+        if size < 1024:
+            return "%.1f %s" % (size, unit)
+    return "%.1f GB" % (size / 1024.0)
+
+
+def isolate(plugin):
+    """Return subclass of `plugin` with copies of its mutable attributes
+
+    Plug-ins keep state on their class, such as nodes that failed or
+    actions made whilst processing. Processing a subclass per run keeps
+    this state from accumulating across runs, as the subclass, along
+    with its state, is released with the run.
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to isolate
+
+    """
+
+    attributes = {}
+    for cls in reversed(plugin.__mro__[:-1]):
+        for name, value in vars(cls).items():
+            if name.startswith("__"):
+                continue
+
+            if isinstance(value, (list, dict, set)):
+                attributes[name] = copy.copy(value)
+            else:
+                attributes.pop(name, None)
+
+    attributes.update({
+        "__module__": plugin.__module__,
+        "__qualname__": getattr(plugin, "__qualname__", plugin.__name__),
+        "__doc__": plugin.__doc__,
+    })
+
+    return type(plugin)(plugin.__name__, (plugin,), attributes)
+
+
+# Modules whose API may only be called from the main thread of the host
+host_modules = ("maya", "pymel")
+
+
+def is_host_bound(plugin):
+    """Return whether `plugin` makes use of any of `host_modules`
+
+    Both modules imported alongside the plug-in and modules
+    imported from within its `process` method are taken into account,
+    as are the modules imported by those modules in turn, such that
+    calls made through a helper library are found too. Modules of the
+    standard library and compiled modules are not looked into.
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to inspect
+
+    """
+
+    func = getattr(plugin.process, "__func__", plugin.process)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return False
+
+    names = set(code.co_names)
+    visited = set()
+    namespaces = [func.__globals__]
+
+    while namespaces:
+        for value in namespaces.pop().values():
+            if isinstance(value, types.ModuleType):
+                module = value
+            else:
+                name = getattr(value, "__module__", None)
+                if not isinstance(name, six.string_types):
+                    continue
+                module = sys.modules.get(name)
+                names.add(name)
+
+            if module is None or module.__name__ in visited:
+                continue
+
+            visited.add(module.__name__)
+            names.add(module.__name__)
+
+            if _is_project_module(module):
+                namespaces.append(vars(module))
+
+    return any(
+        name.split(".")[0] in host_modules
+        for name in names
+    )
+
+
+def _is_project_module(module):
+    """Return whether `module` is pure Python and not of the standard library"""
+
+    path = getattr(module, "__file__", None) or ""
+    if not path.endswith(".py"):
+        return False
+
+    path = os.path.realpath(path)
+    return not any(
+        path.startswith(directory + os.sep)
+        and "site-packages" not in path[len(directory):]
+        for directory in _stdlib_paths
+    )
+
+
+_stdlib_paths = set(
+    os.path.realpath(sysconfig.get_paths()[key])
+    for key in ("stdlib", "platstdlib")
+)
+
+
+# Names of Python interpreters, besides "python" itself
+python_executables = ("mayapy", "hython", "pypy")
+
+
+def is_python(executable):
+    """Return whether `executable` is a Python interpreter
+
+    Within an application, `sys.executable` is the application itself,
+    e.g. maya.exe, which cannot be given `-m` to run a module.
+
+    Arguments:
+        executable (str): Path to executable
+
+    """
+
+    name = os.path.splitext(os.path.basename(executable or ""))[0].lower()
+    return bool(name) and (
+        name.startswith("python")
+        or name.startswith(python_executables)
+    )
+
+
 def u_print(msg, **kwargs):
     """`print` with encoded unicode.
 
@@ -62,7 +305,8 @@ def u_print(msg, **kwargs):
         **kwargs: Keyword argument for `print` function.
     """
 
-    if isinstance(msg, text_type):
+    # Python 3 prints unicode as-is, and bytes as their representation
+    if six.PY2 and isinstance(msg, text_type):
         encoding = None
         try:
             encoding = os.getenv('PYTHONIOENCODING', sys.stdout.encoding)
@@ -73,21 +317,499 @@ def u_print(msg, **kwargs):
     print(msg, **kwargs)
 
 
+def record_to_dict(record):
+    """Return `record` as a JSON-compatible dictionary
+
+    The dictionary is of the same form the terminal displays, such that
+    records produced elsewhere (e.g. in another process) can be shown
+    as-is.
+
+    Arguments:
+        record (logging.LogRecord): Record logged by a plug-in
+
+    """
+
+    if isinstance(record, dict):
+        return record
+
+    return {
+        "label": text_type(record.msg),
+        "type": "record",
+        "levelno": record.levelno,
+        "threadName": record.threadName,
+        "name": record.name,
+        "filename": record.filename,
+        "pathname": record.pathname,
+        "lineno": record.lineno,
+        "msg": text_type(record.msg),
+        "msecs": record.msecs,
+        "levelname": record.levelname
+    }
+
+
+def error_to_dict(error):
+    """Return `error` of a result as a JSON-compatible dictionary
+
+    Arguments:
+        error (Exception): Error with traceback extracted by pyblish
+
+    """
+
+    fname, line_no, func, exc = error.traceback
+    return {
+        "label": str(error),
+        "type": "error",
+        "filename": str(fname),
+        "lineno": str(line_no),
+        "func": str(func),
+        "traceback": error.formatted_traceback,
+    }
+
+
+class SerializedError(Exception):
+    """Error of a result restored from its dictionary
+
+    Carries the traceback as it was extracted by pyblish, such that
+    it is presented like any other error.
+
+    Arguments:
+        error (dict): Error as returned by `error_to_dict`
+
+    """
+
+    def __init__(self, error):
+        super(SerializedError, self).__init__(error["label"])
+        self.traceback = (
+            error["filename"],
+            error["lineno"],
+            error["func"],
+            error["label"],
+        )
+        self.formatted_traceback = error["traceback"]
+
+
+def deserialize_result(data, plugin, context, instance):
+    """Return result of pyblish from `data` of `serialize_result`
+
+    The result is appended to the results of `context`,
+    as `pyblish.plugin.process` would have.
+
+    Arguments:
+        data (dict): Success, records, error and duration of a result
+        plugin (pyblish.api.Plugin): Plug-in of result
+        context (pyblish.api.Context): Context of `instance`
+        instance (pyblish.api.Instance): Instance of result, if any
+
+    """
+
+    error = data["error"]
+    if error is not None:
+        error = SerializedError(error)
+
+    result = {
+        "success": data["success"],
+        "plugin": plugin,
+        "instance": instance,
+        "action": None,
+        "error": error,
+        "records": data["records"],
+        "duration": data["duration"],
+        "wall_time": data.get("wall_time"),
+        "cpu_time": data.get("cpu_time"),
+        "memory": data.get("memory"),
+        "progress": 0,
+        "context": context,
+    }
+
+    context.data.setdefault("results", list()).append(result)
+
+    return result
+
+
+def serialize_result(result):
+    """Return JSON-compatible copy of `result` of `pyblish.plugin.process`
+
+    Arguments:
+        result (dict): Result as produced by pyblish
+
+    """
+
+    plugin = result["plugin"]
+    instance = result["instance"]
+    error = result["error"]
+
+    return {
+        "plugin": plugin.__name__,
+        "label": getattr(plugin, "label", None) or plugin.__name__,
+        "order": plugin.order,
+        "instance": None if instance is None else instance.data["name"],
+        "success": result["success"],
+        "cached": result.get("cached", False),
+        "duration": result.get("duration"),
+        "wall_time": result.get("wall_time"),
+        "cpu_time": result.get("cpu_time"),
+        "memory": result.get("memory"),
+        "records": [
+            record_to_dict(record)
+            for record in result.get("records") or []
+        ],
+        "error": None if error is None else error_to_dict(error)
+    }
+
+
+def instance_families(instance):
+    """Return family and families of `instance`"""
+    families = set(instance.data.get("families") or tuple())
+    family = instance.data.get("family")
+    if family:
+        families.add(family)
+    return families
+
+
 def collect_families_from_instances(instances, only_active=False):
     all_families = set()
     for instance in instances:
         if only_active:
             if instance.data.get("publish") is False:
                 continue
-        family = instance.data.get("family")
-        if family:
-            all_families.add(family)
+        all_families.update(instance_families(instance))
 
-        families = instance.data.get("families") or tuple()
+    return list(all_families)
+
+
+class FamilyIndex(object):
+    """Families of instances within a context, kept up to date
+
+    Rather than walking every instance of the context for every plug-in,
+    instances are indexed by family. Instances are added as they are
+    created, and looked at again once their `keys` may have changed.
+    Instances added to, or removed from, the context by other means are
+    found by `update`, by the changes counted by a
+    `tracking.TrackedContext`, or by their ids for any other context.
+
+    Any change is counted by `version`, such that what was computed
+    from the index is known to be out of date, see `plan`. Listeners
+    are told of each change as it is indexed, see `listen`.
+
+    Arguments:
+        context (pyblish.api.Context): Context to index
+
+    """
+
+    # Data deciding which plug-ins an instance is processed by
+    keys = ("family", "families", "publish")
+
+    def __init__(self, context):
+        self.context = context
+        self._instances = {}
+
+        # Families and whether active, by instance id
+        self._entries = {}
+
+        self._ids_by_family = collections.defaultdict(set)
+        self._active = collections.Counter()
+
+        # Position within context, by instance id
+        self._positions = {}
+        self._position = 0
+
+        self._stale = set()
+        self._version = 0
+        self._listeners = []
+
+        # Changes of the context as of the last `update`
+        self._changes = getattr(context, "changes", None)
+
+        for instance in context:
+            self.add(instance)
+
+    @property
+    def version(self):
+        """Number of changes to the index so far"""
+        self.update()
+        return self._version
+
+    def listen(self, listener):
+        """Call `listener` as instances are indexed
+
+        The listener is called with the entry of an instance before and
+        after it changed, each of its families and whether it is active,
+        or None for an instance added or removed. Instances indexed so
+        far are given to it as added.
+
+        Arguments:
+            listener (callable): Called with the old and new entry
+
+        """
+
+        self._listeners.append(listener)
+        for entry in self._entries.values():
+            listener(None, entry)
+
+    def _notify(self, old, new):
+        for listener in self._listeners:
+            listener(old, new)
+
+    def add(self, instance):
+        self._version += 1
+        self._instances[instance.id] = instance
+        self._positions[instance.id] = self._position
+        self._position += 1
+        self._stale.add(instance.id)
+
+    def remove(self, instance_id):
+        self._version += 1
+        entry = self._unindex(instance_id)
+        if entry is not None:
+            self._notify(entry, None)
+        self._instances.pop(instance_id, None)
+        self._positions.pop(instance_id, None)
+        self._stale.discard(instance_id)
+
+    def invalidate(self, instance_id):
+        """Look at families of instance of `instance_id` again"""
+        if instance_id in self._instances:
+            self._version += 1
+            self._stale.add(instance_id)
+
+    def _changed(self):
+        changes = getattr(self.context, "changes", None)
+        if changes is not None:
+            return changes != self._changes
+
+        return len(self._instances) != len(self.context) or any(
+            instance.id not in self._instances for instance in self.context
+        )
+
+    def update(self):
+        """Index instances added to the context since, forget those removed
+
+        Returns:
+            tuple: Instances added, and ids of instances removed
+
+        """
+
+        if not self._changed():
+            return [], []
+
+        self._changes = getattr(self.context, "changes", None)
+        ids = [instance.id for instance in self.context]
+
+        current = set(ids)
+        removed = [
+            instance_id for instance_id in self._instances
+            if instance_id not in current
+        ]
+        for instance_id in removed:
+            self.remove(instance_id)
+
+        added = [
+            instance for instance in self.context
+            if instance.id not in self._instances
+        ]
+        for instance in added:
+            self.add(instance)
+
+        # Instances may have been moved, as well as added or removed
+        self._positions = dict(
+            (instance_id, position) for position, instance_id in enumerate(ids)
+        )
+        self._position = len(ids)
+
+        return added, removed
+
+    def sync(self):
+        """Index the context anew"""
+        self._version += 1
+        for entry in self._entries.values():
+            self._notify(entry, None)
+
+        self._instances.clear()
+        self._entries.clear()
+        self._ids_by_family.clear()
+        self._active.clear()
+        self._positions.clear()
+        self._position = 0
+        self._stale.clear()
+
+        self._changes = getattr(self.context, "changes", None)
+        for instance in self.context:
+            self.add(instance)
+
+    def _unindex(self, instance_id):
+        # Returns the entry of the instance, None if not indexed
+        entry = self._entries.pop(instance_id, None)
+        if entry is None:
+            return None
+
+        families, active = entry
         for family in families:
-            all_families.add(family)
+            self._ids_by_family[family].discard(instance_id)
+            if active:
+                self._active[family] -= 1
+                if not self._active[family]:
+                    del self._active[family]
 
-    return list(all_families)
+        return entry
+
+    def refresh(self):
+        """Index instances added, or changed, since last indexed"""
+        self.update()
+
+        while self._stale:
+            instance_id = self._stale.pop()
+            old = self._unindex(instance_id)
+
+            instance = self._instances[instance_id]
+            families = instance_families(instance)
+            active = instance.data.get("publish") is not False
+
+            self._entries[instance_id] = (families, active)
+            for family in families:
+                self._ids_by_family[family].add(instance_id)
+                if active:
+                    self._active[family] += 1
+
+            self._notify(old, (families, active))
+
+    def families(self, only_active=False):
+        """Return families of instances
+
+        Arguments:
+            only_active (bool): Only of instances which are to be published
+
+        """
+
+        self.refresh()
+        if only_active:
+            return list(self._active)
+
+        return [
+            family for family, ids in self._ids_by_family.items() if ids
+        ]
+
+    def instances_by_plugin(self, plugin):
+        """Return instances compatible with `plugin`, in order of context
+
+        As `pyblish.logic.instances_by_plugin`, only looking at
+        instances sharing a family with `plugin`.
+
+        Arguments:
+            plugin (pyblish.api.Plugin): Plug-in to match
+
+        """
+
+        self.refresh()
+        if not plugin.families or "*" in plugin.families:
+            ids = self._instances.keys()
+        else:
+            ids = set()
+            for family in plugin.families:
+                ids.update(self._ids_by_family.get(family, ()))
+
+        candidates = [
+            self._instances[instance_id]
+            for instance_id in sorted(ids, key=self._positions.get)
+        ]
+        return pyblish.logic.instances_by_plugin(candidates, plugin)
+
+    def is_compatible(self, plugin):
+        """Return whether context `plugin` has active instances to process
+
+        Arguments:
+            plugin (pyblish.api.ContextPlugin): Plug-in to match
+
+        """
+
+        return bool(pyblish.logic.plugins_by_families(
+            [plugin], self.families(only_active=True)
+        ))
+
+
+class RowCounts(object):
+    """Numbers of rows of groups, summed in logarithmic time
+
+    A Fenwick tree of the number of rows of each group, flattening rows
+    of groups into one list; see `model.ArtistProxy`. Rows are added to
+    and removed from groups in O(log groups), whereas groups themselves
+    are inserted and removed in O(groups).
+
+    Arguments:
+        counts (list, optional): Number of rows of each group
+
+    """
+
+    def __init__(self, counts=None):
+        self.build(counts or [])
+
+    def build(self, counts):
+        """Build tree anew, of `counts` of each group"""
+        self._counts = list(counts)
+        self._tree = [0] + self._counts
+
+        size = len(self._counts)
+        for position in range(1, size + 1):
+            parent = position + (position & -position)
+            if parent <= size:
+                self._tree[parent] += self._tree[position]
+
+    def __len__(self):
+        return len(self._counts)
+
+    def count(self, group):
+        """Return number of rows of `group`"""
+        return self._counts[group]
+
+    def total(self):
+        """Return number of rows of every group"""
+        return self.prefix(len(self._counts))
+
+    def prefix(self, group):
+        """Return number of rows of groups before `group`"""
+        total = 0
+        while group > 0:
+            total += self._tree[group]
+            group -= group & -group
+        return total
+
+    def add(self, group, rows):
+        """Add number of `rows`, or remove if negative, of `group`"""
+        self._counts[group] += rows
+
+        position = group + 1
+        while position < len(self._tree):
+            self._tree[position] += rows
+            position += position & -position
+
+    def find(self, row):
+        """Return group of flattened `row`, and its row within the group
+
+        Arguments:
+            row (int): Row of every group, below `total`
+
+        """
+
+        group = 0
+        step = 1
+        while step * 2 <= len(self._counts):
+            step *= 2
+
+        while step:
+            position = group + step
+            if position <= len(self._counts) and self._tree[position] <= row:
+                group = position
+                row -= self._tree[position]
+            step //= 2
+
+        return group, row
+
+    def insert(self, group, counts):
+        """Insert groups of `counts` before `group`"""
+        self.build(self._counts[:group] + list(counts) + self._counts[group:])
+
+    def remove(self, first, last):
+        """Remove groups from `first` up to and including `last`"""
+        self.build(self._counts[:first] + self._counts[last + 1:])
 
 
 class OrderGroups:
@@ -1,4 +1,4 @@
-from .vendor.Qt import QtCore, QtWidgets
+from .vendor.Qt import QtCore, QtGui, QtWidgets
 from . import model
 from .constants import Roles
 
@@ -149,7 +149,12 @@ class TerminalView(QtWidgets.QTreeView):
         self.verticalScrollBar().setSingleStep(10)
         self.setRootIsDecorated(False)
 
+        # Rows expanded, such that their height is summed without
+        # going through every row
+        self._expanded = []
+
         self.clicked.connect(self.item_expand)
+        self.expanded.connect(self.on_expanded)
 
     def event(self, event):
         if not event.type() == QtCore.QEvent.KeyPress:
@@ -170,8 +175,34 @@ class TerminalView(QtWidgets.QTreeView):
             for index in self.selectionModel().selectedIndexes():
                 self.expand(index)
 
+        elif event.matches(QtGui.QKeySequence.Copy):
+            self.copy_selected()
+            return True
+
         return super(TerminalView, self).event(event)
 
+    def copy_selected(self):
+        """Copy text of selected records and details to the clipboard"""
+        indexes = sorted(
+            self.selectionModel().selectedIndexes(),
+            key=lambda index: (
+                index.parent().row() if index.parent().isValid()
+                else index.row(),
+                index.parent().isValid()
+            )
+        )
+
+        lines = []
+        document = QtGui.QTextDocument()
+        for index in indexes:
+            text = index.data(QtCore.Qt.DisplayRole) or ""
+            if index.data(Roles.TypeRole) == model.TerminalDetailType:
+                document.setHtml(text)
+                text = document.toPlainText()
+            lines.append(text)
+
+        QtWidgets.QApplication.clipboard().setText("\n".join(lines))
+
     def focusOutEvent(self, event):
         self.selectionModel().clear()
 
@@ -181,9 +212,11 @@ class TerminalView(QtWidgets.QTreeView):
                 self.collapse(index)
             else:
                 self.expand(index)
-                self.model().layoutChanged.emit()
             self.updateGeometry()
 
+    def on_expanded(self, index):
+        self._expanded.append(QtCore.QPersistentModelIndex(index))
+
     def rowsInserted(self, parent, start, end):
         """Automatically scroll to bottom on each new item added."""
         super(TerminalView, self).rowsInserted(parent, start, end)
@@ -192,7 +225,10 @@ class TerminalView(QtWidgets.QTreeView):
 
     def resizeEvent(self, event):
         super(self.__class__, self).resizeEvent(event)
-        self.model().layoutChanged.emit()
+
+        # Details wrap at the width of the view, and are laid out anew
+        if event.size().width() != event.oldSize().width():
+            self.scheduleDelayedItemsLayout()
 
     def sizeHint(self):
         size = super(TerminalView, self).sizeHint()
@@ -200,13 +236,27 @@ class TerminalView(QtWidgets.QTreeView):
             self.contentsMargins().top()
             + self.contentsMargins().bottom()
         )
-        for idx_i in range(self.model().rowCount()):
-            index = self.model().index(idx_i, 0)
-            height += self.rowHeight(index)
-            if self.isExpanded(index):
-                for idx_j in range(index.model().rowCount(index)):
-                    child_index = index.child(idx_j, 0)
-                    height += self.rowHeight(child_index)
+
+        # Records are of one line each, only details vary in height
+        model = self.model()
+        rows = model.rowCount()
+        if rows:
+            height += rows * self.rowHeight(model.index(0, 0))
+
+        expanded = []
+        for persistent in self._expanded:
+            if not persistent.isValid():
+                continue
+
+            index = model.index(persistent.row(), 0)
+            if not self.isExpanded(index) or persistent in expanded:
+                continue
+
+            expanded.append(persistent)
+            for row in range(model.rowCount(index)):
+                height += self.rowHeight(model.index(row, 0, index))
+
+        self._expanded = expanded
 
         size.setHeight(height)
         return size
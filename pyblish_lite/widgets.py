@@ -59,6 +59,7 @@ class PerspectiveWidget(QtWidgets.QWidget):
     l_rec = "Records"
     l_path = "Path"
     l_traceback = "Traceback"
+    l_profile = "Profile"
 
     def __init__(self, parent):
         super(PerspectiveWidget, self).__init__(parent)
@@ -120,6 +121,12 @@ class PerspectiveWidget(QtWidgets.QWidget):
         traceback.set_content(traceback_label)
         layout.addWidget(traceback)
 
+        profile = ExpandableWidget(self, self.l_profile)
+        profile_label = PerspectiveLabel()
+        profile_label.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
+        profile.set_content(profile_label)
+        layout.addWidget(profile)
+
         contents_widget.setLayout(layout)
 
         terminal_view = view.TerminalView()
@@ -129,7 +136,7 @@ class PerspectiveWidget(QtWidgets.QWidget):
         terminal_proxy.setSourceModel(terminal_model)
 
         terminal_view.setModel(terminal_proxy)
-        terminal_delegate = delegate.TerminalItem()
+        terminal_delegate = delegate.TerminalItem(terminal_view)
         terminal_view.setItemDelegate(terminal_delegate)
         records.set_content(terminal_view)
 
@@ -154,6 +161,7 @@ class PerspectiveWidget(QtWidgets.QWidget):
         self.path = path
         self.records = records
         self.traceback = traceback
+        self.profile = profile
 
         self.toggle_button.clicked.connect(self.toggle_me)
 
@@ -262,6 +270,7 @@ class PerspectiveWidget(QtWidgets.QWidget):
             self.documentation.setVisible(False)
             self.path.setVisible(False)
             self.traceback.setVisible(False)
+            self.profile.setVisible(False)
 
         elif index_type == model.PluginType:
             item_id = index.data(Roles.ObjectIdRole)
@@ -303,6 +312,14 @@ class PerspectiveWidget(QtWidgets.QWidget):
             self.path.setVisible(True)
             self.traceback.setVisible(True)
 
+            # Hot-spots, when profiling
+            profiler = self.parent_widget.controller.profiler
+            report = ""
+            if profiler is not None:
+                report = profiler.report(item_id)
+            self.profile.content.setPlainText(report)
+            self.profile.setVisible(bool(report))
+
         else:
             self.last_type = None
             self.last_id = None
@@ -310,6 +327,7 @@ class PerspectiveWidget(QtWidgets.QWidget):
             self.set_indicator_state(None)
             self.documentation.setVisible(False)
             self.path.setVisible(False)
+            self.profile.setVisible(False)
             self.records.setVisible(False)
             return
 
@@ -334,11 +352,6 @@ class PerspectiveWidget(QtWidgets.QWidget):
         data = {"records": records}
         self.terminal_model.reset()
         self.terminal_model.update_with_result(data)
-        while not self.terminal_model.items_to_set_widget.empty():
-            item = self.terminal_model.items_to_set_widget.get()
-            widget = TerminalDetail(item.data(QtCore.Qt.DisplayRole))
-            index = self.terminal_proxy.mapFromSource(item.index())
-            self.terminal_view.setIndexWidget(index, widget)
 
         self.records.button_toggle_text.setText(
             "{} ({})".format(self.l_rec, len_records)
@@ -497,27 +510,6 @@ class CommentBox(QtWidgets.QLineEdit):
         return super(CommentBox, self).focusOutEvent(event)
 
 
-class TerminalDetail(QtWidgets.QTextEdit):
-    def __init__(self, text, *args, **kwargs):
-        super(self.__class__, self).__init__(*args, **kwargs)
-
-        self.setReadOnly(True)
-        self.setHtml(text)
-        self.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
-        self.setWordWrapMode(
-            QtGui.QTextOption.WrapAtWordBoundaryOrAnywhere
-        )
-
-    def sizeHint(self):
-        content_margins = (
-            self.contentsMargins().top()
-            + self.contentsMargins().bottom()
-        )
-        size = self.document().documentLayout().documentSize().toSize()
-        size.setHeight(size.height() + content_margins)
-        return size
-
-
 class FilterButton(QtWidgets.QPushButton):
     def __init__(self, name, *args, **kwargs):
         self.filter_name = name
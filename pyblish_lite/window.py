@@ -231,7 +231,7 @@ class Window(QtWidgets.QDialog):
         terminal_proxy.setSourceModel(terminal_model)
 
         terminal_view.setModel(terminal_proxy)
-        terminal_delegate = delegate.TerminalItem()
+        terminal_delegate = delegate.TerminalItem(terminal_view)
         terminal_view.setItemDelegate(terminal_delegate)
 
         layout = QtWidgets.QVBoxLayout(terminal_container)
@@ -295,9 +295,13 @@ class Window(QtWidgets.QDialog):
 
         footer_info = QtWidgets.QLabel(footer_widget)
         footer_spacer = QtWidgets.QWidget(footer_widget)
+        footer_durations = QtWidgets.QLabel(footer_widget)
         footer_button_reset = QtWidgets.QPushButton(
             awesome["refresh"], footer_widget
         )
+        footer_button_revalidate = QtWidgets.QPushButton(
+            awesome["repeat"], footer_widget
+        )
         footer_button_validate = QtWidgets.QPushButton(
             awesome["flask"], footer_widget
         )
@@ -312,8 +316,10 @@ class Window(QtWidgets.QDialog):
         layout.setContentsMargins(5, 5, 5, 5)
         layout.addWidget(footer_info, 0)
         layout.addWidget(footer_spacer, 1)
+        layout.addWidget(footer_durations, 0)
         layout.addWidget(footer_button_stop, 0)
         layout.addWidget(footer_button_reset, 0)
+        layout.addWidget(footer_button_revalidate, 0)
         layout.addWidget(footer_button_validate, 0)
         layout.addWidget(footer_button_play, 0)
 
@@ -438,12 +444,14 @@ class Window(QtWidgets.QDialog):
             "Play": footer_button_play,
             "Validate": footer_button_validate,
             "Reset": footer_button_reset,
+            "Revalidate": footer_button_revalidate,
             "Stop": footer_button_stop,
 
             # Misc
             "HeaderSpacer": header_spacer,
             "FooterSpacer": footer_spacer,
             "FooterInfo": footer_info,
+            "FooterDurations": footer_durations,
             "CommentIntentWidget": comment_intent_widget,
             "CommentBox": comment_box,
             "CommentPlaceholder": comment_box.placeholder,
@@ -467,6 +475,7 @@ class Window(QtWidgets.QDialog):
             footer_button_validate,
             footer_button_stop,
             footer_button_reset,
+            footer_button_revalidate,
             footer_spacer,
             closing_placeholder
         ):
@@ -502,14 +511,16 @@ class Window(QtWidgets.QDialog):
         controller.switch_toggleability.connect(self.change_toggleability)
 
         controller.was_reset.connect(self.on_was_reset)
-        # This is called synchronously on each process
-        controller.was_processed.connect(self.on_was_processed)
+        # This is called synchronously once per slice of processing
+        controller.was_processed_batch.connect(self.on_was_processed_batch)
         controller.passed_group.connect(self.on_passed_group)
         controller.was_stopped.connect(self.on_was_stopped)
         controller.was_finished.connect(self.on_was_finished)
 
         controller.was_skipped.connect(self.on_was_skipped)
         controller.was_acted.connect(self.on_was_acted)
+        controller.about_to_revalidate.connect(self.on_about_to_revalidate)
+        controller.io_progress.connect(self.on_io_progress)
 
         # NOTE: Listeners to this signal are run in the main thread
         controller.about_to_process.connect(
@@ -523,6 +534,7 @@ class Window(QtWidgets.QDialog):
 
         footer_button_stop.clicked.connect(self.on_stop_clicked)
         footer_button_reset.clicked.connect(self.on_reset_clicked)
+        footer_button_revalidate.clicked.connect(self.on_revalidate_clicked)
         footer_button_validate.clicked.connect(self.on_validate_clicked)
         footer_button_play.clicked.connect(self.on_play_clicked)
 
@@ -544,7 +556,9 @@ class Window(QtWidgets.QDialog):
         self.terminal_filters_widget = terminal_filters_widget
 
         self.footer_widget = footer_widget
+        self.footer_durations = footer_durations
         self.footer_button_reset = footer_button_reset
+        self.footer_button_revalidate = footer_button_revalidate
         self.footer_button_validate = footer_button_validate
         self.footer_button_play = footer_button_play
         self.footer_button_stop = footer_button_stop
@@ -680,12 +694,16 @@ class Window(QtWidgets.QDialog):
     def on_reset_clicked(self):
         self.reset()
 
+    def on_revalidate_clicked(self):
+        self.revalidate()
+
     def on_stop_clicked(self):
         self.info("Stopping..")
         self.controller.stop()
 
         # TODO checks
         self.footer_button_reset.setEnabled(True)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_play.setEnabled(False)
         self.footer_button_stop.setEnabled(False)
 
@@ -712,6 +730,10 @@ class Window(QtWidgets.QDialog):
         else:
             instance_id = instance.id
 
+        # Created within this slice of processing, see `on_was_processed_batch`
+        if instance_id not in self.instance_model.instance_items:
+            self.sync_instances()
+
         instance_item = (
             self.instance_model.instance_items[instance_id]
         )
@@ -730,6 +752,24 @@ class Window(QtWidgets.QDialog):
             self.tr("Processing"), plugin_item.data(QtCore.Qt.DisplayRole)
         ))
 
+    def on_io_progress(self, plugin, instance, progress):
+        """Reflect progress of transfers of an extractor, see `extraction`
+
+        Shown in the footer only, rather than in the terminal, as
+        progress is reported once per item transferred.
+        """
+
+        plugin_item = self.plugin_model.plugin_items.get(plugin._id)
+        if plugin_item is None:
+            return
+
+        info = self.findChild(QtWidgets.QLabel, "FooterInfo")
+        info.setText("{} {} ({}%)".format(
+            self.tr("Transferring"),
+            plugin_item.data(QtCore.Qt.DisplayRole),
+            int(progress * 100)
+        ))
+
     def on_plugin_action_menu_requested(self, pos):
         """The user right-clicked on a plug-in
          __________
@@ -760,6 +800,13 @@ class Window(QtWidgets.QDialog):
 
         menu.popup(self.overview_plugin_view.viewport().mapToGlobal(pos))
 
+    def update_durations(self):
+        """Show total duration of each group processed so far"""
+        self.footer_durations.setText("  ".join(
+            "{} {}".format(label, util.format_duration(duration))
+            for label, duration in self.plugin_model.group_durations()
+        ))
+
     def update_compatibility(self):
         self.plugin_model.update_compatibility()
         self.plugin_proxy.invalidateFilter()
@@ -805,6 +852,7 @@ class Window(QtWidgets.QDialog):
 
         self.footer_button_validate.setEnabled(True)
         self.footer_button_reset.setEnabled(True)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_stop.setEnabled(False)
         self.footer_button_play.setEnabled(True)
         self.footer_button_play.setFocus()
@@ -847,6 +895,7 @@ class Window(QtWidgets.QDialog):
             not errored and not self.controller.validated
         )
         self.footer_button_reset.setEnabled(True)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_stop.setEnabled(False)
         if errored:
             self.footer_widget.setProperty("success", 0)
@@ -863,6 +912,7 @@ class Window(QtWidgets.QDialog):
         self.footer_button_play.setEnabled(False)
         self.footer_button_validate.setEnabled(False)
         self.footer_button_reset.setEnabled(True)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_stop.setEnabled(False)
 
         if self.controller.errored:
@@ -894,7 +944,8 @@ class Window(QtWidgets.QDialog):
 
         self.update_compatibility()
 
-    def on_was_processed(self, result):
+    def sync_instances(self):
+        """Add and remove instance items to match the context"""
         existing_ids = set(self.instance_model.instance_items.keys())
         existing_ids.remove(self.controller.context.id)
         for instance in self.controller.context:
@@ -906,24 +957,29 @@ class Window(QtWidgets.QDialog):
         for instance_id in existing_ids:
             self.instance_model.remove(instance_id)
 
-        if result.get("error"):
+    def on_was_processed_batch(self, results):
+        """Reflect `results` of a slice of processing in GUI
+
+        Models are updated per result, whereas instances, compatibility
+        and filtering are updated once for all of them.
+        """
+
+        self.sync_instances()
+
+        if any(result.get("error") for result in results):
             # Toggle from artist to overview tab on error
             if self.tabs["artist"].isChecked():
                 self.tabs["overview"].toggle()
 
-        result["records"] = self.terminal_model.prepare_records(result)
-
-        plugin_item = self.plugin_model.update_with_result(result)
-        instance_item = self.instance_model.update_with_result(result)
+        for result in results:
+            result["records"] = self.terminal_model.prepare_records(result)
 
-        self.terminal_model.update_with_result(result)
-        while not self.terminal_model.items_to_set_widget.empty():
-            item = self.terminal_model.items_to_set_widget.get()
-            widget = widgets.TerminalDetail(item.data(QtCore.Qt.DisplayRole))
-            index = self.terminal_proxy.mapFromSource(item.index())
-            self.terminal_view.setIndexWidget(index, widget)
+            plugin_item = self.plugin_model.update_with_result(result)
+            instance_item = self.instance_model.update_with_result(result)
+            self.terminal_model.update_with_result(result)
 
         self.update_compatibility()
+        self.update_durations()
 
         if self.perspective_widget.isVisible():
             self.perspective_widget.update_context(
@@ -936,6 +992,16 @@ class Window(QtWidgets.QDialog):
     #
     # -------------------------------------------------------------------------
 
+    def revalidate(self):
+        self.info(self.tr("Preparing revalidate.."))
+        self.footer_button_stop.setEnabled(True)
+        self.footer_button_reset.setEnabled(False)
+        self.footer_button_revalidate.setEnabled(False)
+        self.footer_button_validate.setEnabled(False)
+        self.footer_button_play.setEnabled(False)
+
+        util.defer(5, self.controller.revalidate)
+
     def reset(self):
         """Prepare GUI for reset"""
         self.info(self.tr("About to reset.."))
@@ -953,9 +1019,11 @@ class Window(QtWidgets.QDialog):
         self.plugin_model.reset()
         self.intent_model.reset()
         self.terminal_model.reset()
+        self.update_durations()
 
         self.footer_button_stop.setEnabled(False)
         self.footer_button_reset.setEnabled(False)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_validate.setEnabled(False)
         self.footer_button_play.setEnabled(False)
 
@@ -972,6 +1040,7 @@ class Window(QtWidgets.QDialog):
         self.info(self.tr("Preparing validate.."))
         self.footer_button_stop.setEnabled(True)
         self.footer_button_reset.setEnabled(False)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_validate.setEnabled(False)
         self.footer_button_play.setEnabled(False)
 
@@ -982,6 +1051,7 @@ class Window(QtWidgets.QDialog):
 
         self.footer_button_stop.setEnabled(True)
         self.footer_button_reset.setEnabled(False)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_validate.setEnabled(False)
         self.footer_button_play.setEnabled(False)
 
@@ -992,6 +1062,7 @@ class Window(QtWidgets.QDialog):
 
         self.footer_button_stop.setEnabled(True)
         self.footer_button_reset.setEnabled(False)
+        self.footer_button_revalidate.setEnabled(False)
         self.footer_button_validate.setEnabled(False)
         self.footer_button_play.setEnabled(False)
 
@@ -1010,6 +1081,7 @@ class Window(QtWidgets.QDialog):
 
     def on_was_acted(self, result):
         self.footer_button_reset.setEnabled(True)
+        self.footer_button_revalidate.setEnabled(True)
         self.footer_button_stop.setEnabled(False)
 
         # Update action with result
@@ -1018,22 +1090,9 @@ class Window(QtWidgets.QDialog):
         action_state |= PluginActionStates.HasFinished
         result["records"] = self.terminal_model.prepare_records(result)
 
-        error = result.get("error")
-        if error:
-            records = result.get("records") or []
+        # The error is among records prepared
+        if result.get("error"):
             action_state |= PluginActionStates.HasFailed
-            fname, line_no, func, exc = error.traceback
-
-            records.append({
-                "label": str(error),
-                "type": "error",
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": error.formatted_traceback
-            })
-
-            result["records"] = records
 
         plugin_item.setData(action_state, Roles.PluginActionProgressRole)
 
@@ -1041,6 +1100,30 @@ class Window(QtWidgets.QDialog):
         self.instance_model.update_with_result(result)
         self.terminal_model.update_with_result(result)
 
+    def on_about_to_revalidate(self, results):
+        """Clear items of results about to be produced anew"""
+        context = self.controller.context
+        instance_ids = set()
+        for result in results:
+            instance = result["instance"]
+            instance_ids.add(context.id if instance is None else instance.id)
+
+        self.plugin_model.reset_items(
+            set(result["plugin"] for result in results)
+        )
+        self.instance_model.reset_items(instance_ids)
+
+        # Restore what remains of other plug-ins
+        for result in context.data.get("results") or []:
+            instance = result["instance"]
+            instance_id = context.id if instance is None else instance.id
+            if result["action"] is None and instance_id in instance_ids:
+                self.instance_model.update_with_result(result)
+
+        self.sync_instances()
+        self.update_compatibility()
+        self.update_durations()
+
     def closeEvent(self, event):
         """Perform post-flight checks before closing
 
@@ -1060,6 +1143,7 @@ class Window(QtWidgets.QDialog):
             self.info(self.tr("Cleaning up models.."))
             self.intent_model.deleteLater()
             self.plugin_model.deleteLater()
+            self.terminal_model.records.clear()
             self.terminal_model.deleteLater()
             self.terminal_proxy.deleteLater()
             self.plugin_proxy.deleteLater()
@@ -0,0 +1,224 @@
+"""
+@package: common_lib.content_store_lib
+@module: content_store_lib.py
+@synopsis: Content-addressed storage of published files
+@description: This module provides a local store of files addressed by the hash of their content.
+    Files are hashed in parallel, each unique content is stored once as a blob, and versions are
+    published as manifests of blobs along with a directory of hardlinks to them. Files which did
+    not change between versions are neither copied again nor take up any more space.
+
+    <root>/blobs/<ab>/<abcdef...>          Content, stored once
+    <root>/manifests/<name>/v001.json      Files of a version, by relative path
+    <root>/published/<name>/v001/<path>    Hardlinks to blobs of a version
+"""
+
+# External imports
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+
+# Read at once when hashing, large enough for hashlib to release the GIL
+CHUNK_SIZE = 1024 * 1024
+
+# Name of versions, and of their manifests
+VERSION_FORMAT = 'v{:03d}'
+VERSION_PATTERN = re.compile(r'^v(\d+)\.json$')
+
+
+def hash_file(path, chunk_size=CHUNK_SIZE):
+    """Return the SHA-256 of the content of a file, read in chunks
+
+    :param path: (str) Path of the file
+    :param chunk_size: (int) Bytes read at once
+    :return: (str) Hexadecimal digest of the content
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(paths, workers=None):
+    """Return the SHA-256 of the content of files, hashed alongside each other
+
+    Hashing large chunks releases the GIL, hence threads hash in parallel.
+
+    :param paths: (list) Paths of files
+    :param workers: (int) Threads hashing, defaults to the number of CPUs
+    :return: (dict) Hexadecimal digest by path
+    """
+    paths = list(paths)
+    if len(paths) < 2:
+        return {path: hash_file(path) for path in paths}
+
+    workers = workers or min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(workers, thread_name_prefix='ContentStoreHash') as executor:
+        return dict(zip(paths, executor.map(hash_file, paths)))
+
+
+def link_or_copy(source, destination):
+    """Hardlink a file, copying it where links are not supported
+
+    :param source: (str) Path of the existing file
+    :param destination: (str) Path of the link, which must not exist
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        # Another device, or a file system without hardlinks
+        shutil.copy2(source, destination)
+
+
+class ContentStore(object):
+    """Local store of files addressed by the hash of their content
+
+    :param root: (str) Directory of the store
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def blob_path(self, digest):
+        """Return the path of the blob of a digest
+
+        :param digest: (str) Hexadecimal digest of the content
+        :return: (str) Path of the blob, whether it exists or not
+        """
+        return os.path.join(self.root, 'blobs', digest[:2], digest)
+
+    def add(self, path, digest):
+        """Store the content of a file, unless stored already
+
+        :param path: (str) Path of the file
+        :param digest: (str) Hexadecimal digest of its content, see hash_file()
+        :return: (bool) Whether the content was stored, False when it already was
+        """
+        blob = self.blob_path(digest)
+        if os.path.exists(blob):
+            return False
+
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+
+        # Copied rather than linked, such that rewriting the extracted file
+        # never changes the blob, nor what was published from it. Written
+        # aside first, such that a blob is never half-written.
+        temp = '{}.{}.tmp'.format(blob, os.getpid())
+        shutil.copyfile(path, temp)
+        os.chmod(temp, 0o444)
+        os.replace(temp, blob)
+        return True
+
+    def manifest_dir(self, name):
+        return os.path.join(self.root, 'manifests', name)
+
+    def versions(self, name):
+        """Return the versions published under a name
+
+        :param name: (str) Name of what is published, e.g. of an instance
+        :return: (list) Version numbers, in ascending order
+        """
+        try:
+            filenames = os.listdir(self.manifest_dir(name))
+        except OSError:
+            return []
+
+        matches = (VERSION_PATTERN.match(filename) for filename in filenames)
+        return sorted(int(match.group(1)) for match in matches if match)
+
+    def manifest(self, name, version):
+        """Return the manifest of a version
+
+        :param name: (str) Name of what is published
+        :param version: (int) Version number
+        :return: (dict) Manifest, as written by publish()
+        """
+        path = os.path.join(self.manifest_dir(name), VERSION_FORMAT.format(version) + '.json')
+        with open(path) as f:
+            return json.load(f)
+
+    def claim_version(self, name):
+        """Create the directory of the next version of a name, and return it
+
+        A directory is claimed by creating it, such that a version left without
+        manifest by an interrupted publish, or claimed by another publish meanwhile,
+        is skipped rather than published into.
+
+        :param name: (str) Name of what is published
+        :return: (tuple) Version number, and its directory
+        """
+        versions = self.versions(name)
+        version = (versions[-1] if versions else 0) + 1
+
+        published = os.path.join(self.root, 'published', name)
+        os.makedirs(published, exist_ok=True)
+        while True:
+            directory = os.path.join(published, VERSION_FORMAT.format(version))
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                version += 1
+                continue
+            return version, directory
+
+    def publish(self, name, paths, staging_dir=None, workers=None):
+        """Publish files as the next version of a name
+
+        Files are hashed in parallel, and only content not yet in the store is
+        stored. The version is a manifest of the files and a directory of
+        hardlinks to their blobs.
+
+        :param name: (str) Name of what is published, e.g. of an instance
+        :param paths: (list) Paths of the files to publish
+        :param staging_dir: (str) Directory files are relative to in the version,
+            files are published by name when not given
+        :param workers: (int) Threads hashing, see hash_files()
+        :return: (dict) Manifest of the published version
+        """
+        digests = hash_files(paths, workers)
+
+        files = {}
+        stored = 0
+        for path, digest in digests.items():
+            if staging_dir:
+                relative = os.path.relpath(path, staging_dir)
+            else:
+                relative = os.path.basename(path)
+
+            files[relative.replace(os.sep, '/')] = {
+                'digest': digest,
+                'size': os.path.getsize(path),
+            }
+            stored += self.add(path, digest)
+
+        version, directory = self.claim_version(name)
+        version_name = VERSION_FORMAT.format(version)
+
+        for relative, entry in files.items():
+            destination = os.path.join(directory, *relative.split('/'))
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            link_or_copy(self.blob_path(entry['digest']), destination)
+
+        manifest = {
+            'name': name,
+            'version': version,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'directory': directory,
+            'files': files,
+            'stored': stored,
+        }
+
+        # Written last, such that a version is only listed once complete
+        manifest_dir = self.manifest_dir(name)
+        os.makedirs(manifest_dir, exist_ok=True)
+        path = os.path.join(manifest_dir, version_name + '.json')
+        temp = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temp, 'w') as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+        os.replace(temp, path)
+
+        return manifest
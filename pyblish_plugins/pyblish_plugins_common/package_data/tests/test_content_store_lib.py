@@ -0,0 +1,150 @@
+import os
+import shutil
+import hashlib
+import tempfile
+
+from pyblish_plugins.pyblish_plugins_common.core import content_store_lib
+
+# Vendor libraries
+from nose.tools import (
+    with_setup,
+    assert_equals,
+)
+
+# Store and staging directory of the current test
+state = {}
+
+
+def setup_store():
+    state["root"] = tempfile.mkdtemp()
+    state["staging"] = os.path.join(state["root"], "staging")
+    state["store"] = content_store_lib.ContentStore(
+        os.path.join(state["root"], "store")
+    )
+    os.makedirs(os.path.join(state["staging"], "textures"))
+
+
+def teardown_store():
+    # Blobs are read-only
+    for root, dirs, files in os.walk(state["root"]):
+        for name in files:
+            os.chmod(os.path.join(root, name), 0o644)
+    shutil.rmtree(state["root"])
+
+
+def setup_function(function):
+    # `with_setup` is only honoured by nose, set up for pytest too
+    setup_store()
+
+
+def teardown_function(function):
+    teardown_store()
+
+
+def write(relative, content):
+    path = os.path.join(state["staging"], relative)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+@with_setup(setup_store, teardown_store)
+def test_hash_files():
+    """Files are hashed alongside each other, as they are one by one"""
+
+    paths = [
+        write("file%d.txt" % index, b"content %d" % index)
+        for index in range(4)
+    ]
+
+    digests = content_store_lib.hash_files(paths, workers=2)
+    assert_equals(sorted(digests), sorted(paths))
+    for index, path in enumerate(paths):
+        assert_equals(
+            digests[path],
+            hashlib.sha256(b"content %d" % index).hexdigest()
+        )
+
+    # Read in chunks, smaller than the file
+    assert_equals(
+        content_store_lib.hash_file(paths[0], chunk_size=3),
+        digests[paths[0]]
+    )
+    assert_equals(content_store_lib.hash_files(paths[:1]), {
+        paths[0]: digests[paths[0]]
+    })
+
+
+@with_setup(setup_store, teardown_store)
+def test_publish_dedup():
+    """Content published before is not stored again"""
+
+    store = state["store"]
+    paths = [write("a.txt", b"same"), write("b.txt", b"same")]
+
+    first = store.publish("model", paths)
+    assert_equals(first["version"], 1)
+    assert_equals(first["stored"], 1)
+    assert_equals(sorted(first["files"]), ["a.txt", "b.txt"])
+
+    second = store.publish("model", paths)
+    assert_equals(second["version"], 2)
+    assert_equals(second["stored"], 0)
+
+    for manifest in (first, second):
+        with open(os.path.join(manifest["directory"], "a.txt"), "rb") as f:
+            assert_equals(f.read(), b"same")
+
+    blobs = []
+    for root, dirs, files in os.walk(os.path.join(store.root, "blobs")):
+        blobs.extend(files)
+    assert_equals(len(blobs), 1)
+
+
+@with_setup(setup_store, teardown_store)
+def test_versions():
+    """Versions count up per name, and are listed once complete"""
+
+    store = state["store"]
+    path = write("a.txt", b"content")
+
+    assert_equals(store.versions("model"), [])
+    for _ in range(3):
+        store.publish("model", [path])
+    store.publish("rig", [path])
+
+    assert_equals(store.versions("model"), [1, 2, 3])
+    assert_equals(store.versions("rig"), [1])
+    assert_equals(store.manifest("model", 2)["version"], 2)
+
+    # Interrupted after linking, before the manifest was written
+    os.remove(os.path.join(store.manifest_dir("model"), "v003.json"))
+    assert_equals(store.versions("model"), [1, 2])
+
+    manifest = store.publish("model", [path])
+    assert_equals(manifest["version"], 4)
+    assert_equals(store.versions("model"), [1, 2, 4])
+
+
+@with_setup(setup_store, teardown_store)
+def test_staging_dir():
+    """Files are published relative to the staging directory"""
+
+    store = state["store"]
+    paths = [
+        write("scene.ma", b"scene"),
+        write(os.path.join("textures", "diffuse.png"), b"texture"),
+    ]
+
+    manifest = store.publish("look", paths, staging_dir=state["staging"])
+    assert_equals(
+        sorted(manifest["files"]), ["scene.ma", "textures/diffuse.png"]
+    )
+
+    path = os.path.join(manifest["directory"], "textures", "diffuse.png")
+    with open(path, "rb") as f:
+        assert_equals(f.read(), b"texture")
+
+    # By name only, without staging directory
+    manifest = store.publish("flat", paths)
+    assert_equals(sorted(manifest["files"]), ["diffuse.png", "scene.ma"])
@@ -0,0 +1,55 @@
+import os
+
+import pyblish.api
+from pyblish_plugins.pyblish_plugins_common.core.content_store_lib import ContentStore
+from pyblish_core.plugins_utilities.strings_handling import define_plugin_label
+
+
+class ContentStoreIntegrator(pyblish.api.InstancePlugin):
+    """Integrator publishing extracted files to the content store.
+
+    Files listed in the 'extracted_files' data of an instance are hashed in parallel and
+    published as the next version of the instance, see content_store_lib. Content already in
+    the store, e.g. files unchanged since the previous version, is neither copied nor stored again.
+
+    The store is the directory of the 'PYBLISH_CONTENT_STORE' environment variable, or of the
+    'content_store' data of the context.
+
+    """
+    plugin_id = '3d0f6c1e-2a4b-4f8e-9c57-b1e2d4a6f8c0'  # https://www.uuidgenerator.net/version4
+    category = 'Publish'
+    name = 'Content store'
+
+    hosts = ['*']
+    mandatory = False
+
+    label = define_plugin_label(category, name)
+
+    order = pyblish.api.IntegratorOrder
+
+    # Context and instance data read, see pyblish_lite.dependencies
+    requires_data = ['content_store']
+    instance_keys = ['extracted_files', 'staging_dir']
+
+    def process(self, instance):
+        """Main method for processing the current instance
+
+        :param instance: (pyblish.api.Instance) Instance that meets the plugin requirements
+        """
+        paths = instance.data.get('extracted_files') or []
+        if not paths:
+            self.log.info(f"Nothing extracted to publish for '{instance.name}'")
+            return
+
+        root = os.environ.get('PYBLISH_CONTENT_STORE') or instance.context.data.get('content_store')
+        if not root:
+            raise pyblish.api.PyblishError('No content store, set PYBLISH_CONTENT_STORE')
+
+        store = ContentStore(root)
+        manifest = store.publish(instance.name, paths, staging_dir=instance.data.get('staging_dir'))
+
+        instance.data['published_version'] = manifest['version']
+        instance.data['published_directory'] = manifest['directory']
+
+        self.log.info(f"Published {len(manifest['files'])} file(s) of '{instance.name}' "
+                      f"as version {manifest['version']}, {manifest['stored']} of which were new content")
@@ -0,0 +1,68 @@
+"""
+@package: maya_lib.cache_lib
+@module: cache_lib.py
+@synopsis: Functions hashing the content of Maya nodes
+@description: This module provides the hasher of the Pyblish Lite result cache for Maya,
+    such that validators are only processed again once the nodes they validate have changed.
+"""
+
+# External imports
+from maya import cmds
+import hashlib
+from pyblish_plugins.pyblish_plugins_maya.core import geometry_lib
+
+
+def node_content(node):
+    """Return what the content of a node is made of
+
+    :param node: (str) Long name of an existing node
+    :return: (list) Type, hierarchy, transform, geometry and topology of the node
+    """
+    content = [
+        node,
+        cmds.nodeType(node),
+        cmds.listRelatives(node, children=True, fullPath=True) or [],
+    ]
+
+    if cmds.objectType(node, isAType='transform'):
+        content.append(cmds.xform(node, query=True, matrix=True, objectSpace=True))
+
+    if cmds.objectType(node, isAType='mesh'):
+        content.append(cmds.polyEvaluate(node, vertex=True, edge=True, face=True))
+        content.append(cmds.xform(f"{node}.vtx[*]", query=True, translation=True, objectSpace=True))
+
+        # Topology, as changed by e.g. flipping an edge, and faces with holes, as validated
+        # by the holed, lamina and non-manifold validators
+        content.append(cmds.polyInfo(node, faceToVertex=True) or [])
+        if cmds.ls(f"{node}.f[*]"):
+            content.append(geometry_lib.poly_constraint(f"{node}.f[*]", mode=3, type=8, holes=1))
+
+    return content
+
+
+def hash_node(node):
+    """Return a hash of the content of the given node
+
+    A node which does not exist is hashed by its name only. The result cache
+    hashes each node once per reset, such that the vertices of a mesh are not
+    queried again for every validator reading it.
+
+    :param node: (str) Name of a node
+    :return: (str) Hash of the content of the node
+    """
+    existing = cmds.ls(node, long=True) or []
+    if not existing:
+        return f"missing:{node}"
+
+    digest = hashlib.sha1()
+    for each in sorted(existing):
+        digest.update(repr(node_content(each)).encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def register():
+    """Register the hasher of Maya nodes to the Pyblish Lite result cache"""
+    from pyblish_lite import cache
+
+    cache.register_hasher('maya', hash_node)
@@ -0,0 +1,34 @@
+"""
+@package: maya_lib.checkpoint_lib
+@module: checkpoint_lib.py
+@synopsis: Fingerprint of the Maya scene
+@description: This module provides the fingerprinter of Pyblish Lite checkpoints for Maya,
+    such that a publish is only resumed in the scene it was checkpointed in.
+"""
+
+# External imports
+from maya import cmds
+import os
+
+
+def scene_fingerprint():
+    """Return a cheap fingerprint of the current scene
+
+    The scene is not hashed, the path, time of modification and number of
+    nodes of the scene tell whether it is still the one checkpointed.
+
+    :return: (str) Fingerprint of the scene
+    """
+    path = cmds.file(query=True, sceneName=True) or ''
+    mtime = os.path.getmtime(path) if os.path.isfile(path) else None
+    modified = cmds.file(query=True, modified=True)
+    nodes = len(cmds.ls(long=True) or [])
+
+    return repr([path, mtime, modified, nodes])
+
+
+def register():
+    """Register the fingerprinter of the Maya scene to Pyblish Lite checkpoints"""
+    from pyblish_lite import checkpoint
+
+    checkpoint.register_fingerprinter('maya', scene_fingerprint)
@@ -28,6 +28,11 @@ class MeshLaminaFacesValidator(pyblish.api.Validator):
 
     lod_type = None
 
+    # Data validated, see pyblish_lite.cache, hashing only the nodes of the instance
+    context_keys = ['mesh_nodes']
+    instance_keys = ['nodes']
+    node_keys = ['nodes']
+
     def process(self, context, instance):
         """Main method for processing the current instance
 
@@ -29,6 +29,11 @@ class StarLikeVerticesValidator(pyblish.api.Validator):
 
     lod_type = None
 
+    # Data validated, see pyblish_lite.cache, hashing only the nodes of the instance
+    context_keys = ['mesh_nodes']
+    instance_keys = ['nodes']
+    node_keys = ['nodes']
+
     @staticmethod
     def _find_vertices_with_more_than_5_edges(mesh_name: str) -> list[str]:
         """Find vertices in a mesh with more than 5 connected edges.
@@ -33,6 +33,11 @@ class MeshZeroEdgeLengthValidator(pyblish.api.Validator):
 
     lod_type = None
 
+    # Data validated, see pyblish_lite.cache, hashing only the nodes of the instance
+    context_keys = ['mesh_nodes']
+    instance_keys = ['nodes']
+    node_keys = ['nodes']
+
     __tolerance = 1e-5
 
     def process(self, context, instance):
@@ -23,6 +23,10 @@ class DefaultNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = []
+    provides_data = ['default_nodes']
+
     def process(self, context):
         """Main method for processing the current context
 
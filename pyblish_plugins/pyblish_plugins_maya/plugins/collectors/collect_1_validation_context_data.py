@@ -19,6 +19,19 @@ class ValidationContextCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     settings = 'default'  # This value can be overriden with filtering: https://learn.pyblish.com/24-filtering
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = []
+    provides_data = [
+        'required_shader_type',
+        'required_root_nodes',
+        'valid_root_nodes',
+        'lod_types',
+        'shapes_abbr_mapping',
+        'shading_affix_mapping',
+        'group_suffix',
+        'reserved_patterns',
+    ]
+
     def _collect_required_shader(self, context):
         """Collect Required Shader Types
 
@@ -22,6 +22,10 @@ class ReferenceMembersCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['reference_nodes']
+    provides_data = ['reference_members_nodes']
+
     order = pyblish.api.CollectorOrder + 0.1
 
     def process(self, context):
@@ -21,6 +21,17 @@ class ExcludeFromValidationCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = [
+        'default_nodes',
+        'reference_nodes',
+        'reference_members_nodes',
+        'trash_nodes',
+        'help_nodes',
+        'previz_nodes',
+    ]
+    provides_data = ['excluded_nodes']
+
     order = pyblish.api.CollectorOrder + 0.2
 
     def process(self, context):
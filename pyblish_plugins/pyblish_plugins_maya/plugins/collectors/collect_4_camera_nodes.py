@@ -24,6 +24,10 @@ class CameraNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['excluded_nodes']
+    provides_data = ['camera_nodes']
+
     order = pyblish.api.CollectorOrder + 0.3
 
     def process(self, context):
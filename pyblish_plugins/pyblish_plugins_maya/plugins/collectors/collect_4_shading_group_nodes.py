@@ -23,6 +23,10 @@ class ShadingGroupNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = []
+    provides_data = ['shading_groups']
+
     order = pyblish.api.CollectorOrder + 0.3
 
     def process(self, context):
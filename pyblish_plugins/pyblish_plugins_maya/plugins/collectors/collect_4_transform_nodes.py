@@ -22,6 +22,10 @@ class TransformNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['excluded_nodes']
+    provides_data = ['transform_nodes']
+
     order = pyblish.api.CollectorOrder + 0.3
 
     def process(self, context):
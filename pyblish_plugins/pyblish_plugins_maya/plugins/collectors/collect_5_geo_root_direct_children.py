@@ -22,6 +22,10 @@ class GeoDirectChildrenCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['lod_types']
+    provides_data = ['geo_direct_children', 'model_lod_types']
+
     order = pyblish.api.CollectorOrder + 0.4
 
     def process(self, context):
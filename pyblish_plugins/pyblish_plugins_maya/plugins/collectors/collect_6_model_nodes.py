@@ -22,6 +22,10 @@ class ModelLodNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['lod_types', 'excluded_nodes', 'geo_direct_children']
+    provides_data = []
+
     order = pyblish.api.CollectorOrder + 0.41
 
     def process(self, context):
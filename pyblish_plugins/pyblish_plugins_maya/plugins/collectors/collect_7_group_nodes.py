@@ -24,6 +24,10 @@ class TransformGroupNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['transform_nodes', 'shape_scope_nodes', 'root_nodes', 'geo_direct_children']
+    provides_data = ['group_nodes']
+
     order = pyblish.api.CollectorOrder + 0.43
 
     def process(self, context):
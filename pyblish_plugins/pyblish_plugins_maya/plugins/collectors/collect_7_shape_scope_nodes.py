@@ -22,6 +22,10 @@ class TransformShapeNodesCollector(pyblish.api.Collector):
     label = define_plugin_label(category, name)
     actions = []
 
+    # Context data read and written, see pyblish_lite.dependencies
+    requires_data = ['shape_nodes']
+    provides_data = ['shape_scope_nodes']
+
     order = pyblish.api.CollectorOrder + 0.42
 
     def process(self, context):
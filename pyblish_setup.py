@@ -66,3 +66,13 @@ def run_pyblish_maya_setup(pyblish_maya_path: str):
     log.info('Run Pyblish Maya userSetup.py')
     user_setup_path = os.path.join(pyblish_maya_path, 'pyblish_maya', 'pythonpath', 'userSetup.py')
     runpy.run_path(user_setup_path)
+
+    # Let validators of unchanged nodes be replayed from the result cache
+    from pyblish_plugins.pyblish_plugins_maya.core import cache_lib
+    cache_lib.register()
+    log.info('Registered Maya hasher of the Pyblish Lite result cache')
+
+    # Let a publish resume only in the scene it was checkpointed in
+    from pyblish_plugins.pyblish_plugins_maya.core import checkpoint_lib
+    checkpoint_lib.register()
+    log.info('Registered Maya fingerprinter of Pyblish Lite checkpoints')